@@ -0,0 +1,92 @@
+"""
+Ingestion throughput in rows per second: POST /tenders/new one by one against POST /tenders/bulk and POST /bids/bulk.
+
+Usage: python -m benchmarks.bulk --batches 100 1000 10000
+"""
+import asyncio
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter
+
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.utils import (
+    benchmark_database,
+    create_organization,
+    override_sessions,
+    print_table,
+    seed_tenders,
+    session_override,
+)
+
+from tenders.__main__ import get_app
+
+
+async def rows_per_second(client: AsyncClient, requests: list[tuple[str, object]], rows: int, repeat: int) -> float:
+    """
+    Send `requests` `repeat` times and return the median ingestion speed.
+    """
+    speeds = []
+    for _ in range(repeat):
+        started = perf_counter()
+        for url, body in requests:
+            response = await client.post(url, json=body, timeout=None)
+            assert response.status_code == 200, response.text
+        speeds.append(rows / (perf_counter() - started))
+
+    return median(speeds)
+
+
+async def run(database_uri: str, batches: list[int], single: int, repeat: int) -> None:
+    engine = create_async_engine(database_uri)
+    app = get_app()
+    override_sessions(app, session_override(engine))
+    organization_id, (creator_id,) = await create_organization(engine)
+    await seed_tenders(engine, 1, organization_id, creator_id)
+    async with engine.connect() as connection:
+        username = await connection.scalar(text("SELECT username FROM employee WHERE id = :id"), {"id": creator_id})
+        tender_id = await connection.scalar(text("SELECT id FROM tender"))
+
+    tender = {
+        "name": "tender",
+        "description": "benchmark tender",
+        "serviceType": "Delivery",
+        "organizationId": str(organization_id),
+        "creatorUsername": username,
+    }
+    bid = {
+        "name": "bid",
+        "description": "benchmark bid",
+        "tenderId": str(tender_id),
+        "authorType": "User",
+        "authorId": str(creator_id),
+    }
+
+    rows = []
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        requests = [("/api/tenders/new", tender)] * single
+        rows.append(["POST /tenders/new", single, f"{await rows_per_second(client, requests, single, repeat):.0f}"])
+        for batch in batches:
+            for url, item in (("/api/tenders/bulk", tender), ("/api/bids/bulk", bid)):
+                speed = await rows_per_second(client, [(url, [item] * batch)], batch, repeat)
+                rows.append([f"POST {url.removeprefix('/api')}", batch, f"{speed:.0f}"])
+    await engine.dispose()
+
+    print_table(["request", "rows", "rows/s"], rows)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--batches", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--single", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with benchmark_database() as database_uri:
+        asyncio.run(run(database_uri, args.batches, args.single, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
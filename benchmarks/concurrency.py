@@ -0,0 +1,93 @@
+"""
+Throughput of the API under concurrent load: a new engine per request (the way sessions used to be issued)
+against one shared engine configured from DefaultSettings.
+
+Usage: python -m benchmarks.concurrency --concurrency 1 10 50 --requests 2000
+"""
+import asyncio
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import AsyncIterator, Callable
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.utils import (
+    benchmark_database,
+    create_organization,
+    override_sessions,
+    print_table,
+    seed_tenders,
+    session_override,
+)
+
+from tenders.__main__ import get_app
+from tenders.config import get_settings
+
+
+def engine_per_request(database_uri: str) -> Callable[[], AsyncIterator[AsyncSession]]:
+    async def get_session() -> AsyncIterator[AsyncSession]:
+        engine = create_async_engine(database_uri)
+        async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+            yield session
+        await engine.dispose()
+
+    return get_session
+
+
+async def load(client: AsyncClient, urls: list[str], requests: int, concurrency: int) -> float:
+    queue = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(urls[i % len(urls)])
+
+    async def worker() -> None:
+        while not queue.empty():
+            response = await client.get(queue.get_nowait())
+            assert response.status_code == 200, response.text
+
+    started = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return requests / (perf_counter() - started)
+
+
+async def run(database_uri: str, concurrency: list[int], requests: int) -> None:
+    seed_engine = create_async_engine(database_uri)
+    organization_id, (creator_id,) = await create_organization(seed_engine)
+    await seed_tenders(seed_engine, 1_000, organization_id, creator_id)
+    await seed_engine.dispose()
+
+    pooled_engine = create_async_engine(database_uri, **get_settings().database_engine_settings)
+    modes = {
+        "engine per request": engine_per_request(database_uri),
+        "shared pool": session_override(pooled_engine),
+    }
+    urls = ["/api/tenders?limit=5", "/api/tenders?limit=5&service_type=Delivery", "/api/tenders?limit=20&offset=100"]
+
+    rows = []
+    app = get_app()
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        for workers in concurrency:
+            row = [workers]
+            for override in modes.values():
+                override_sessions(app, override)
+                await load(client, urls, min(requests, 50), workers)  # warm up
+                row.append(f"{await load(client, urls, requests, workers):.0f}")
+            rows.append(row)
+    await pooled_engine.dispose()
+
+    print_table(["concurrency", *(f"{mode} rps" for mode in modes)], rows)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+
+    with benchmark_database() as database_uri:
+        asyncio.run(run(database_uri, args.concurrency, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Latency of creating tenders and bids.
+
+Usage: python -m benchmarks.create --repeat 500
+"""
+import asyncio
+from argparse import ArgumentParser
+
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.utils import (
+    benchmark_database,
+    create_organization,
+    measure,
+    override_sessions,
+    print_table,
+    seed_tenders,
+    session_override,
+)
+
+from tenders.__main__ import get_app
+
+
+async def run(database_uri: str, repeat: int) -> None:
+    engine = create_async_engine(database_uri)
+    app = get_app()
+    override_sessions(app, session_override(engine))
+    organization_id, (creator_id,) = await create_organization(engine)
+    await seed_tenders(engine, 1, organization_id, creator_id)
+    async with engine.connect() as connection:
+        username = await connection.scalar(text("SELECT username FROM employee WHERE id = :id"), {"id": creator_id})
+        tender_id = await connection.scalar(text("SELECT id FROM tender"))
+
+    requests = {
+        "POST /tenders/new": (
+            "/api/tenders/new",
+            {
+                "name": "tender",
+                "description": "benchmark tender",
+                "serviceType": "Delivery",
+                "organizationId": str(organization_id),
+                "creatorUsername": username,
+            },
+        ),
+        "POST /bids/new": (
+            "/api/bids/new",
+            {
+                "name": "bid",
+                "description": "benchmark bid",
+                "tenderId": str(tender_id),
+                "authorType": "User",
+                "authorId": str(creator_id),
+            },
+        ),
+    }
+
+    rows = []
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        for name, (url, body) in requests.items():
+            stats = await measure(lambda: client.post(url, json=body), repeat)
+            rows.append([name, *(f"{v:.2f}" for v in stats.values())])
+    await engine.dispose()
+
+    print_table(["request", "mean ms", "p50 ms", "p95 ms", "p99 ms"], rows)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    with benchmark_database() as database_uri:
+        asyncio.run(run(database_uri, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Throughput of PUT /bids/{bid_id}/submit_decision under parallel approvers of one bid,
+checking that no approval is lost.
+
+Usage: python -m benchmarks.decisions --concurrency 1 10 50 --decisions 1000
+"""
+import asyncio
+from argparse import ArgumentParser
+from time import perf_counter
+from uuid import UUID
+
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from benchmarks.utils import (
+    benchmark_database,
+    create_organization,
+    override_sessions,
+    print_table,
+    seed_tenders,
+    session_override,
+)
+
+from tenders.__main__ import get_app
+from tenders.config import get_settings
+
+
+async def create_bid(engine: AsyncEngine, creator_id: UUID) -> UUID:
+    async with engine.begin() as connection:
+        return await connection.scalar(
+            text(
+                """
+                WITH new_bid AS (
+                    INSERT INTO bid (tender_id, status, creator_type, creator_id)
+                    SELECT id, 'PUBLISHED', 'USER', :creator_id FROM tender LIMIT 1
+                    RETURNING id
+                )
+                INSERT INTO bid_history (bid_id, name, description, history_number)
+                SELECT id, 'bid', 'benchmark bid', 1 FROM new_bid
+                RETURNING bid_id
+                """
+            ),
+            {"creator_id": creator_id},
+        )
+
+
+async def load(client: AsyncClient, bid_id: UUID, usernames: list[str], decisions: int, concurrency: int) -> float:
+    queue = asyncio.Queue()
+    for i in range(decisions):
+        queue.put_nowait(usernames[i % len(usernames)])
+
+    async def worker() -> None:
+        while not queue.empty():
+            params = {"username": queue.get_nowait(), "decision": "Approved"}
+            response = await client.put(f"/api/bids/{bid_id}/submit_decision", params=params)
+            assert response.status_code == 200, response.text
+
+    started = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return decisions / (perf_counter() - started)
+
+
+async def run(database_uri: str, concurrency: list[int], decisions: int, approvers: int) -> None:
+    engine = create_async_engine(database_uri, **get_settings().database_engine_settings)
+    organization_id, employee_ids = await create_organization(engine, approvers)
+    await seed_tenders(engine, 1, organization_id, employee_ids[0])
+    async with engine.connect() as connection:
+        usernames = list(await connection.scalars(text("SELECT username FROM employee")))
+
+    queries = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_query(*args) -> None:
+        nonlocal queries
+        queries += 1
+
+    rows = []
+    app = get_app()
+    override_sessions(app, session_override(engine))
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        for workers in concurrency:
+            bid_id = await create_bid(engine, employee_ids[0])
+            queries = 0
+            speed = await load(client, bid_id, usernames, decisions, workers)
+            per_decision = queries / decisions
+            async with engine.connect() as connection:
+                approved = await connection.scalar(text("SELECT approved_num FROM bid WHERE id = :id"), {"id": bid_id})
+            rows.append([workers, f"{speed:.0f}", f"{per_decision:.1f}", decisions - approved])
+    await engine.dispose()
+
+    print_table(["concurrency", "decisions/s", "queries/decision", "lost approvals"], rows)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--decisions", type=int, default=1_000)
+    parser.add_argument("--approvers", type=int, default=5)
+    args = parser.parse_args()
+
+    with benchmark_database() as database_uri:
+        asyncio.run(run(database_uri, args.concurrency, args.decisions, args.approvers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Throughput and peak memory of GET /tenders/export compared with loading the same tenders
+as one GET /tenders page, depending on the number of published tenders.
+
+Usage: python -m benchmarks.export --sizes 10000 100000
+"""
+import asyncio
+import tracemalloc
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.utils import (
+    benchmark_database,
+    create_organization,
+    override_sessions,
+    print_table,
+    seed_tenders,
+    session_override,
+)
+
+from tenders.__main__ import get_app
+from tenders.db.connection import SessionManager
+
+
+def stream_sessions(engine: AsyncEngine) -> None:
+    """
+    Serve the sessions that streaming endpoints open themselves from `engine`.
+    """
+    manager = SessionManager()
+    manager.session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    manager.replica_session_maker = manager.session_maker
+
+
+async def get(app: FastAPI, path: str, query: str = "") -> int:
+    """
+    Call `app` directly over ASGI, discarding the body as it is sent and counting its lines:
+    the httpx test transport would buffer the whole body itself.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [(b"host", b"bench")],
+        "server": ("bench", 80),
+        "client": ("127.0.0.1", 1),
+    }
+    requested, finished = asyncio.Event(), asyncio.Event()
+    lines = 0
+
+    async def receive() -> dict:
+        if not requested.is_set():
+            requested.set()
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        nonlocal lines
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+        elif message["type"] == "http.response.body":
+            lines += bytes(message["body"]).count(b"\n")
+            if not message.get("more_body"):
+                finished.set()
+
+    await app(scope, receive, send)
+
+    return lines
+
+
+async def export(app: FastAPI) -> int:
+    return await get(app, "/api/tenders/export")
+
+
+async def page(app: FastAPI, size: int) -> int:
+    await get(app, "/api/tenders", f"limit={size}")
+
+    return size
+
+
+async def profile(call: Callable[[], Awaitable[int]]) -> tuple[int, float, float]:
+    started = perf_counter()
+    rows = await call()
+    speed = rows / (perf_counter() - started)
+
+    tracemalloc.start()
+    await call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return rows, speed, peak / 2**20
+
+
+async def run(database_uri: str, sizes: list[int]) -> None:
+    engine = create_async_engine(database_uri)
+    app = get_app()
+    override_sessions(app, session_override(engine))
+    stream_sessions(engine)
+    organization_id, (creator_id,) = await create_organization(engine)
+
+    rows = []
+    seeded = 0
+    for size in sorted(sizes):
+        await seed_tenders(engine, size - seeded, organization_id, creator_id)
+        seeded = size
+        for name, call in (("export", lambda: export(app)), ("page", lambda: page(app, size))):
+            exported, speed, peak = await profile(call)
+            assert exported == size, exported
+            rows.append([size, name, f"{speed:.0f}", f"{peak:.1f}"])
+    await engine.dispose()
+
+    print_table(["tenders", "endpoint", "rows/s", "peak MiB"], rows)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    with benchmark_database() as database_uri:
+        asyncio.run(run(database_uri, args.sizes))
+
+
+if __name__ == "__main__":
+    main()
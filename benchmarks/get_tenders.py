@@ -0,0 +1,68 @@
+"""
+Latency of GET /tenders depending on the number of published tenders.
+
+Usage: python -m benchmarks.get_tenders --sizes 1000 10000 100000
+"""
+import asyncio
+from argparse import ArgumentParser
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from benchmarks.utils import (
+    benchmark_database,
+    create_organization,
+    measure,
+    override_sessions,
+    print_table,
+    seed_tenders,
+    session_override,
+)
+
+from tenders.__main__ import get_app
+from tenders.utils.common import encode_cursor
+
+
+def describe(params: dict) -> str:
+    return " ".join(f"{key}={'<middle>' if key == 'cursor' else value}" for key, value in params.items())
+
+
+async def run(database_uri: str, sizes: list[int], limit: int, repeat: int) -> None:
+    engine = create_async_engine(database_uri)
+    app = get_app()
+    override_sessions(app, session_override(engine))
+    organization_id, (creator_id,) = await create_organization(engine)
+
+    rows = []
+    seeded = 0
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        for size in sorted(sizes):
+            await seed_tenders(engine, size - seeded, organization_id, creator_id)
+            seeded = size
+            (middle,) = (await client.get("/api/tenders", params={"limit": 1, "offset": size // 2})).json()
+            for params in (
+                {"limit": limit},
+                {"limit": limit, "offset": size // 2},
+                {"limit": limit, "cursor": encode_cursor(middle["name"], middle["id"])},
+                {"limit": limit, "service_type": "Delivery"},
+            ):
+                stats = await measure(lambda: client.get("/api/tenders", params=params), repeat)
+                rows.append([size, describe(params), *(f"{v:.2f}" for v in stats.values())])
+    await engine.dispose()
+
+    print_table(["tenders", "params", "mean ms", "p50 ms", "p95 ms", "p99 ms"], rows)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with benchmark_database() as database_uri:
+        asyncio.run(run(database_uri, args.sizes, args.limit, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Per-item cost of building and serializing a list of tenders, with the default path
+(validated schemas, response_model validation and the stdlib encoder) and with FAST_SERIALIZATION.
+No database is involved: the route builds the response from prepared rows.
+
+Usage: python -m benchmarks.serialization --sizes 10 100 1000 --repeat 200
+"""
+import asyncio
+from argparse import ArgumentParser
+from datetime import datetime
+from os import environ
+from uuid import uuid4
+
+from fastapi import FastAPI, Response
+from httpx import AsyncClient
+
+from benchmarks.utils import measure, print_table
+
+from tenders.db.enums import ServiceType, TenderStatus
+from tenders.db.models import Tender, TenderHistory
+from tenders.schemas.pagination import CursorPage
+from tenders.schemas.tender import GetTendersResponse
+from tenders.schemas.tender import Tender as SchemaTender
+from tenders.utils.common import is_fast_serialization_enabled, respond_fast
+from tenders.utils.tender import make_tender
+
+
+def make_rows(size: int) -> list[tuple[Tender, TenderHistory]]:
+    rows = []
+    for i in range(size):
+        tender = Tender(
+            id=uuid4(),
+            status=TenderStatus.PUBLISHED,
+            organization_id=uuid4(),
+            creator_id=uuid4(),
+            created_at=datetime.now(),
+        )
+        history = TenderHistory(
+            tender_id=tender.id,
+            name=f"tender {i}",
+            description="benchmark tender",
+            service_type=ServiceType.DELIVERY,
+            history_number=1,
+        )
+        rows.append((tender, history))
+
+    return rows
+
+
+def get_benchmark_app(rows: list[tuple[Tender, TenderHistory]]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/tenders", response_model=GetTendersResponse | CursorPage[SchemaTender])
+    async def get_tenders(response: Response, size: int):
+        return respond_fast(response, [make_tender(tender, history) for tender, history in rows[:size]])
+
+    return app
+
+
+def set_fast_serialization(enabled: bool) -> None:
+    environ["FAST_SERIALIZATION"] = str(enabled).lower()
+    is_fast_serialization_enabled.cache_clear()
+
+
+async def run(sizes: list[int], repeat: int) -> None:
+    app = get_benchmark_app(make_rows(max(sizes)))
+    rows = []
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        for size in sizes:
+            per_item = {}
+            for enabled in (False, True):
+                set_fast_serialization(enabled)
+                await client.get("/tenders", params={"size": size})
+                stats = await measure(lambda: client.get("/tenders", params={"size": size}), repeat)
+                per_item[enabled] = stats["p50"] * 1000 / size
+            rows.append(
+                [size, f"{per_item[False]:.1f}", f"{per_item[True]:.1f}", f"{per_item[False] / per_item[True]:.1f}x"]
+            )
+
+    print_table(["items", "default us/item", "fast us/item", "speedup"], rows)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.sizes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Latency of GET /tenders/suggest for prefixes and misspelled words depending on the number of published tenders
+with names of three random words. Without pg_trgm the endpoint only matches prefixes, which is reported;
+the database is then migrated only with PG_TRGM_OPTIONAL=true.
+
+"sorted" is the number of rows that went into sort nodes, from EXPLAIN ANALYZE of the suggestion statement:
+it stays around the limit as long as both the prefix and the trigram matches are read from indexes in order.
+
+Usage: python -m benchmarks.suggest --sizes 100000 1000000
+"""
+import asyncio
+import json
+from argparse import ArgumentParser
+
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from benchmarks.utils import (
+    benchmark_database,
+    create_organization,
+    measure,
+    override_sessions,
+    print_table,
+    session_override,
+)
+
+from tenders.__main__ import get_app
+from tenders.utils.tender import select_suggested_tenders
+
+
+WORDS = [
+    "доставка", "поставка", "ремонт", "строительство", "монтаж", "цемент", "кирпич", "песок", "бетон", "арматура",
+    "офис", "склад", "дорога", "мост", "кровля", "фасад", "окна", "двери", "отопление", "вентиляция",
+    "delivery", "supply", "repair", "construction", "cement", "brick", "sand", "concrete", "steel", "warehouse",
+    "office", "road", "bridge", "roof", "facade", "windows", "doors", "heating", "cooling", "lighting",
+]  # fmt: skip
+
+QUERIES = ["дос", "дост", "цемент", "wareh", "цимент", "вентеляция", "warehuose", "xyz"]
+
+
+async def seed_named_tenders(engine: AsyncEngine, count: int, organization_id, creator_id) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(
+            text(
+                """
+                WITH new_tender AS (
+                    INSERT INTO tender (organization_id, status, creator_id)
+                    SELECT :organization_id, 'PUBLISHED', :creator_id FROM generate_series(1, :count)
+                    RETURNING id
+                ), words AS (
+                    SELECT CAST(:words AS text[]) AS words
+                )
+                INSERT INTO tender_history (tender_id, name, description, service_type, history_number)
+                SELECT
+                    id,
+                    concat_ws(
+                        ' ',
+                        initcap(words[1 + floor(random() * cardinality(words))::int]),
+                        words[1 + floor(random() * cardinality(words))::int],
+                        words[1 + floor(random() * cardinality(words))::int]
+                    ),
+                    'benchmark tender',
+                    'DELIVERY',
+                    1
+                FROM new_tender, words
+                """
+            ),
+            {"organization_id": organization_id, "creator_id": creator_id, "count": count, "words": WORDS},
+        )
+        await connection.execute(text("ANALYZE"))
+
+
+def count_sorted_rows(plan: dict) -> int:
+    children = plan.get("Plans", [])
+    rows = sum(child["Actual Rows"] * child["Actual Loops"] for child in children) if plan["Node Type"] == "Sort" else 0
+
+    return rows + sum(count_sorted_rows(child) for child in children)
+
+
+async def explain_suggestion(engine: AsyncEngine, prefix: str, limit: int) -> int:
+    async with AsyncSession(engine) as session:
+        query = await select_suggested_tenders(prefix, limit, session)
+        sql = query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+        plan = await session.scalar(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return count_sorted_rows(plan[0]["Plan"])
+
+
+async def run(database_uri: str, sizes: list[int], limit: int, repeat: int) -> None:
+    engine = create_async_engine(database_uri)
+    app = get_app()
+    override_sessions(app, session_override(engine))
+    organization_id, (creator_id,) = await create_organization(engine)
+    async with engine.connect() as connection:
+        trigrams = await connection.scalar(text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"))
+    print(f"pg_trgm: {'installed' if trigrams else 'not available, prefix matches only'}")
+
+    rows = []
+    seeded = 0
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        for size in sorted(sizes):
+            await seed_named_tenders(engine, size - seeded, organization_id, creator_id)
+            seeded = size
+            for prefix in QUERIES:
+                params = {"prefix": prefix, "limit": limit}
+                found = len((await client.get("/api/tenders/suggest", params=params)).json())
+                sorted_rows = await explain_suggestion(engine, prefix, limit)
+                stats = await measure(lambda: client.get("/api/tenders/suggest", params=params), repeat)
+                rows.append([size, prefix, found, sorted_rows, *(f"{value:.2f}" for value in stats.values())])
+    await engine.dispose()
+
+    print_table(["tenders", "prefix", "found", "sorted", "mean ms", "p50 ms", "p95 ms", "p99 ms"], rows)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with benchmark_database() as database_uri:
+        asyncio.run(run(database_uri, args.sizes, args.limit, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from contextlib import contextmanager
+from statistics import mean, quantiles
+from time import perf_counter
+from typing import AsyncIterator, Awaitable, Callable, Iterator
+from uuid import UUID
+
+from alembic import command
+from alembic.config import Config
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy_utils import create_database, database_exists, drop_database
+
+from tenders.config import get_settings
+from tenders.db.base_schema import create_base_schema
+from tenders.db.connection import get_read_session, get_session
+
+
+@contextmanager
+def benchmark_database() -> Iterator[str]:
+    """
+    Create a temporary migrated database next to the configured one and drop it afterwards.
+    """
+    settings = get_settings()
+    sync_uri = f"{settings.database_uri_sync}_bench"
+    if database_exists(sync_uri):
+        drop_database(sync_uri)
+    create_database(sync_uri)
+
+    try:
+        create_base_schema(sync_uri)
+        alembic_cfg = Config("tenders/db/alembic.ini")
+        alembic_cfg.set_main_option("script_location", "tenders/db/migrator")
+        alembic_cfg.set_main_option("sqlalchemy.url", sync_uri)
+        command.upgrade(alembic_cfg, "head")
+
+        yield f"{settings.database_uri}_bench"
+    finally:
+        drop_database(sync_uri)
+
+
+def session_override(engine: AsyncEngine) -> Callable[[], AsyncIterator[AsyncSession]]:
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def get_session() -> AsyncIterator[AsyncSession]:
+        async with session_maker() as session:
+            yield session
+
+    return get_session
+
+
+def override_sessions(app: FastAPI, dependency: Callable[[], AsyncIterator[AsyncSession]]) -> None:
+    """
+    Serve both read and write sessions of the application from `dependency`.
+    """
+    app.dependency_overrides[get_session] = dependency
+    app.dependency_overrides[get_read_session] = dependency
+
+
+async def create_organization(engine: AsyncEngine, members: int = 1) -> tuple[UUID, list[UUID]]:
+    async with engine.begin() as connection:
+        organization_id = await connection.scalar(
+            text("INSERT INTO organization (name, type) VALUES ('bench', 'LLC') RETURNING id")
+        )
+        employees = await connection.scalars(
+            text(
+                """
+                INSERT INTO employee (username)
+                SELECT 'bench_' || md5(random()::text) FROM generate_series(1, :members)
+                RETURNING id
+                """
+            ),
+            {"members": members},
+        )
+        employee_ids = list(employees)
+        await connection.execute(
+            text("INSERT INTO organization_responsible (organization_id, user_id) VALUES (:organization_id, :user_id)"),
+            [{"organization_id": organization_id, "user_id": user_id} for user_id in employee_ids],
+        )
+
+    return organization_id, employee_ids
+
+
+async def seed_tenders(
+    engine: AsyncEngine, count: int, organization_id: UUID, creator_id: UUID, status: str = "PUBLISHED"
+) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(
+            text(
+                """
+                WITH new_tender AS (
+                    INSERT INTO tender (organization_id, status, creator_id)
+                    SELECT :organization_id, CAST(:status AS tenderstatus), :creator_id FROM generate_series(1, :count)
+                    RETURNING id
+                )
+                INSERT INTO tender_history (tender_id, name, description, service_type, history_number)
+                SELECT
+                    id,
+                    'tender ' || md5(id::text),
+                    'benchmark tender',
+                    (ARRAY['CONSTRUCTION', 'DELIVERY', 'MANUFACTURE'])[1 + abs(hashtext(id::text)) % 3]::servicetype,
+                    1
+                FROM new_tender
+                """
+            ),
+            {"organization_id": organization_id, "creator_id": creator_id, "status": status, "count": count},
+        )
+        await connection.execute(text("ANALYZE"))
+
+
+async def measure(call: Callable[[], Awaitable], repeat: int) -> dict[str, float]:
+    """
+    Run `call` `repeat` times sequentially and return latency statistics in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = perf_counter()
+        await call()
+        timings.append((perf_counter() - started) * 1000)
+    percentiles = quantiles(timings, n=100)
+
+    return {"mean": mean(timings), "p50": percentiles[49], "p95": percentiles[94], "p99": percentiles[98]}
+
+
+def print_table(header: list[str], rows: list[list]) -> None:
+    widths = [max(len(str(item)) for item in column) for column in zip(header, *rows)]
+    for row in [header, *rows]:
+        print("  ".join(str(item).rjust(width) for item, width in zip(row, widths)))
@@ -1,12 +1,44 @@
+from time import sleep
+
 from alembic.config import Config
 from alembic import command
 from fastapi import FastAPI
 from fastapi_pagination import add_pagination
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool
 from uvicorn import run
 
 from tenders.config import DefaultSettings, get_settings
+from tenders.db.connection import ReadYourWritesMiddleware
 from tenders.endpoints import list_of_routes
-from tenders.utils.common import get_hostname
+from tenders.utils.common import (
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    QueryStatsMiddleware,
+    SlowQueryRouteMiddleware,
+    get_hostname,
+    get_profiles,
+    get_slow_query_log,
+)
+
+
+def wait_for_database(dsn: str, attempts: int, delay: float = 1) -> None:
+    """
+    Wait until the database accepts connections: started together with the service, it may be not ready yet.
+    """
+    engine = create_engine(dsn, poolclass=NullPool)
+    try:
+        for attempt in range(1, attempts + 1):
+            try:
+                with engine.connect():
+                    return
+            except OperationalError:
+                if attempt >= attempts:
+                    raise
+                sleep(delay)
+    finally:
+        engine.dispose()
 
 
 def run_migrations(script_location: str, dsn: str):
@@ -43,6 +75,10 @@ def get_app() -> FastAPI:
             "name": "Bids",
             "description": "Bids information",
         },
+        {
+            "name": "Administration",
+            "description": "Diagnostics for the operators of the service",
+        },
     ]
 
     application = FastAPI(
@@ -56,6 +92,15 @@ def get_app() -> FastAPI:
     settings = get_settings()
     bind_routes(application, settings)
     add_pagination(application)
+    application.add_middleware(ReadYourWritesMiddleware)
+    if settings.DB_QUERY_STATS_HEADERS:
+        application.add_middleware(QueryStatsMiddleware)
+    if get_slow_query_log() is not None:
+        application.add_middleware(SlowQueryRouteMiddleware)
+    if settings.METRICS_ENABLED:
+        application.add_middleware(MetricsMiddleware)
+    if settings.PROFILING_ENABLED:
+        application.add_middleware(ProfilingMiddleware, interval=settings.PROFILING_INTERVAL, profiles=get_profiles())
     application.state.settings = settings
 
     return application
@@ -65,6 +110,7 @@ app = get_app()
 
 if __name__ == "__main__":
     settings_for_application = get_settings()
+    wait_for_database(settings_for_application.database_uri_sync, settings_for_application.DB_CONNECT_RETRY)
     run_migrations("tenders/db/migrator", settings_for_application.database_uri_sync)
     run(
         "tenders.__main__:app",
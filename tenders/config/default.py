@@ -1,6 +1,7 @@
 from os import environ
 
 from pydantic_settings import BaseSettings
+from sqlalchemy import make_url
 
 
 class DefaultSettings(BaseSettings):
@@ -24,13 +25,56 @@ class DefaultSettings(BaseSettings):
     POSTGRES_USER: str = environ.get("POSTGRES_USERNAME", "postgres")
     POSTGRES_PORT: int = int(environ.get("POSTGRES_PORT", "5432")[-4:])
     POSTGRES_PASSWORD: str = environ.get("POSTGRES_PASSWORD", "postgres")
-    DB_CONNECT_RETRY: int = environ.get("DB_CONNECT_RETRY", 20)
-    DB_POOL_SIZE: int = environ.get("DB_POOL_SIZE", 15)
+    POSTGRES_REPLICA_CONN: str | None = environ.get("POSTGRES_REPLICA_CONN")
+    READ_YOUR_WRITES_WINDOW: float = float(environ.get("READ_YOUR_WRITES_WINDOW", 5))
+    BULK_MAX_ITEMS: int = int(environ.get("BULK_MAX_ITEMS", 50_000))
+    EXPORT_BATCH_SIZE: int = int(environ.get("EXPORT_BATCH_SIZE", 1_000))
+    VERSION_APPEND_ATTEMPTS: int = int(environ.get("VERSION_APPEND_ATTEMPTS", 50))
+    HTTP_CACHE_CONTROL: str = environ.get("HTTP_CACHE_CONTROL", "private, no-cache")
+    FAST_SERIALIZATION: bool = environ.get("FAST_SERIALIZATION", "false").lower() == "true"
+    METRICS_ENABLED: bool = environ.get("METRICS_ENABLED", "true").lower() == "true"
+    DB_CONNECT_RETRY: int = int(environ.get("DB_CONNECT_RETRY", 20))
+    DB_POOL_SIZE: int = int(environ.get("DB_POOL_SIZE", 15))
+    DB_MAX_OVERFLOW: int = int(environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: float = float(environ.get("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(environ.get("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING: bool = environ.get("DB_POOL_PRE_PING", "true").lower() == "true"
+    DB_STATEMENT_CACHE_SIZE: int = int(environ.get("DB_STATEMENT_CACHE_SIZE", 100))
+    DB_COMMAND_TIMEOUT: float = float(environ.get("DB_COMMAND_TIMEOUT", 30))
+    DB_ECHO: bool = environ.get("DB_ECHO", "false").lower() == "true"
+    # without pg_trgm the tender name trigrams migration fails, unless suggestions may match prefixes only
+    PG_TRGM_OPTIONAL: bool = environ.get("PG_TRGM_OPTIONAL", "false").lower() == "true"
+    # the X-DB-* headers show any client how many statements its request ran and for how long: for tests and local runs
+    DB_QUERY_STATS_HEADERS: bool = environ.get("DB_QUERY_STATS_HEADERS", "false").lower() == "true"
+
+    SLOW_QUERY_LOG_ENABLED: bool = environ.get("SLOW_QUERY_LOG_ENABLED", "true").lower() == "true"
+    SLOW_QUERY_THRESHOLD: float = float(environ.get("SLOW_QUERY_THRESHOLD", 0.5))
+    SLOW_QUERY_LOG_SIZE: int = int(environ.get("SLOW_QUERY_LOG_SIZE", 100))
+    SLOW_QUERY_EXPLAIN_RATE: float = float(environ.get("SLOW_QUERY_EXPLAIN_RATE", 0))
+    SLOW_QUERY_EXPLAIN_TIMEOUT: float = float(environ.get("SLOW_QUERY_EXPLAIN_TIMEOUT", 10))
+
+    PROFILING_ENABLED: bool = environ.get("PROFILING_ENABLED", "false").lower() == "true"
+    PROFILING_INTERVAL: float = float(environ.get("PROFILING_INTERVAL", 0.001))
+    PROFILING_STORE_SIZE: int = int(environ.get("PROFILING_STORE_SIZE", 20))
+    PROFILING_STORE_TTL: float = float(environ.get("PROFILING_STORE_TTL", 3600))
+
+    # memberships are changed outside of the service, so nothing invalidates the cache:
+    # while it is enabled, a revoked responsible keeps access for up to MEMBERSHIP_CACHE_TTL seconds
+    MEMBERSHIP_CACHE_ENABLED: bool = environ.get("MEMBERSHIP_CACHE_ENABLED", "false").lower() == "true"
+    MEMBERSHIP_CACHE_SIZE: int = int(environ.get("MEMBERSHIP_CACHE_SIZE", 10_000))
+    MEMBERSHIP_CACHE_TTL: float = float(environ.get("MEMBERSHIP_CACHE_TTL", 60))
+
+    EMPLOYEE_CACHE_ENABLED: bool = environ.get("EMPLOYEE_CACHE_ENABLED", "true").lower() == "true"
+    EMPLOYEE_CACHE_SIZE: int = int(environ.get("EMPLOYEE_CACHE_SIZE", 10_000))
+    EMPLOYEE_CACHE_TTL: float = float(environ.get("EMPLOYEE_CACHE_TTL", 300))
+    EMPLOYEE_CACHE_NEGATIVE_TTL: float = float(environ.get("EMPLOYEE_CACHE_NEGATIVE_TTL", 5))
 
     # to get a string like this run: "openssl rand -hex 32"
     SECRET_KEY: str = environ.get("SECRET_KEY", "")
     ALGORITHM: str = environ.get("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", 1440))
+    # administrative endpoints are closed while the token is empty
+    ADMIN_TOKEN: str = environ.get("ADMIN_TOKEN", "")
 
     @property
     def database_settings(self) -> dict:
@@ -45,6 +89,44 @@ class DefaultSettings(BaseSettings):
             "port": self.POSTGRES_PORT,
         }
 
+    @property
+    def database_engine_settings(self) -> dict:
+        """
+        Get settings of the connection pool and of the asyncpg connections.
+        """
+        return {
+            "echo": self.DB_ECHO,
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+            "connect_args": {
+                "statement_cache_size": self.DB_STATEMENT_CACHE_SIZE,
+                "command_timeout": self.DB_COMMAND_TIMEOUT,
+            },
+        }
+
+    @property
+    def replica_database_engine_settings(self) -> dict:
+        """
+        Get settings of the replica engine: the same pool, but every transaction is read-only.
+        """
+        settings = self.database_engine_settings
+        settings["connect_args"]["server_settings"] = {"default_transaction_read_only": "on"}
+
+        return settings
+
+    @property
+    def replica_database_uri(self) -> str | None:
+        """
+        Get uri for connection with the read replica, if it is configured.
+        """
+        if not self.POSTGRES_REPLICA_CONN:
+            return None
+
+        return make_url(self.POSTGRES_REPLICA_CONN).set(drivername="postgresql+asyncpg").render_as_string(False)
+
     @property
     def database_uri(self) -> str:
         """
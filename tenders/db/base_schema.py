@@ -0,0 +1,46 @@
+from sqlalchemy import create_engine, text
+
+
+# Tables that already exist in the database before the first migration (see README)
+BASE_SCHEMA = [
+    'CREATE EXTENSION IF NOT EXISTS "uuid-ossp"',
+    """
+    CREATE TABLE employee (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+        username VARCHAR(50) UNIQUE NOT NULL,
+        first_name VARCHAR(50),
+        last_name VARCHAR(50),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    "CREATE TYPE organization_type AS ENUM ('IE', 'LLC', 'JSC')",
+    """
+    CREATE TABLE organization (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+        name VARCHAR(100) NOT NULL,
+        description TEXT,
+        type organization_type,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE organization_responsible (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+        organization_id UUID REFERENCES organization(id) ON DELETE CASCADE,
+        user_id UUID REFERENCES employee(id) ON DELETE CASCADE
+    )
+    """,
+]
+
+
+def create_base_schema(database_uri: str) -> None:
+    """
+    Create the tables that exist in the database before the first migration is applied.
+    """
+    engine = create_engine(database_uri)
+    with engine.begin() as connection:
+        for statement in BASE_SCHEMA:
+            connection.execute(text(statement))
+    engine.dispose()
@@ -1,7 +1,18 @@
-from .session import SessionManager, get_session
+from .session import (
+    READ_PRIMARY_COOKIE,
+    READ_PRIMARY_HEADER,
+    ReadYourWritesMiddleware,
+    SessionManager,
+    get_read_session,
+    get_session,
+)
 
 
 __all__ = [
+    "get_read_session",
     "get_session",
+    "READ_PRIMARY_COOKIE",
+    "READ_PRIMARY_HEADER",
+    "ReadYourWritesMiddleware",
     "SessionManager",
 ]
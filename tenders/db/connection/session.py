@@ -1,36 +1,147 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from http.cookies import SimpleCookie
+from math import ceil
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from tenders.config import get_settings
+from tenders.utils.common import RequestContext, TTLCache, get_slow_query_log, instrument_engine
+
+
+READ_PRIMARY_HEADER = "X-Read-Primary"
+READ_PRIMARY_COOKIE = "read_primary"
 
 
 class SessionManager:
     """
     A class that implements the necessary functionality for working with the database:
     issuing sessions, storing and updating connection settings.
+
+    The engines and the session factories are created once per process and shared by all requests.
+    Read-only sessions go to the replica if it is configured, except for clients that wrote recently
+    or asked for the primary explicitly, so that they can read their own writes.
     """
 
     def __init__(self) -> None:
-        self.refresh()
+        if not hasattr(self, "engine"):
+            self.create_engines()
 
     def __new__(cls):
         if not hasattr(cls, "instance"):
             cls.instance = super(SessionManager, cls).__new__(cls)
         return cls.instance  # noqa
 
-    def get_session_maker(self) -> sessionmaker:
-        return sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+    def get_session_maker(self) -> async_sessionmaker:
+        return self.session_maker
+
+    def get_read_session_maker(self, request: Request) -> async_sessionmaker:
+        if request.headers.get(READ_PRIMARY_HEADER, "").lower() in ("1", "true") or self.wrote_recently(request):
+            return self.session_maker
+
+        return self.replica_session_maker
+
+    def remember_write(self, request: Request, headers: MutableHeaders) -> None:
+        """
+        Send the writer's following reads to the primary: by a short-lived cookie, which covers writes
+        that name their user in the body, and by the username, which covers clients that drop cookies.
+        """
+        cookie = SimpleCookie()
+        cookie[READ_PRIMARY_COOKIE] = "1"
+        cookie[READ_PRIMARY_COOKIE].update(
+            {"max-age": max(1, ceil(self.read_your_writes_window)), "path": "/", "httponly": True, "samesite": "lax"}
+        )
+        headers.append("set-cookie", cookie.output(header="").strip())
+        username = request.query_params.get("username")
+        if username:
+            self.recent_writers.set(username, True)
+
+    def wrote_recently(self, request: Request) -> bool:
+        if READ_PRIMARY_COOKIE in request.cookies:
+            return True
+        username = request.query_params.get("username")
+
+        return bool(username) and self.recent_writers.get(username, False)
+
+    async def refresh(self) -> None:
+        """
+        Recreate the engines with the current settings, closing the connections of the old ones.
+        """
+        await self.dispose()
+        self.create_engines()
+
+    def create_engines(self) -> None:
+        settings = get_settings()
+        self.engine = create_async_engine(settings.database_uri, **settings.database_engine_settings)
+        self.instrument(self.engine)
+        self.session_maker = async_sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+
+        self.replica_engine = None
+        self.replica_session_maker = self.session_maker
+        if settings.replica_database_uri is not None:
+            self.replica_engine = create_async_engine(
+                settings.replica_database_uri, **settings.replica_database_engine_settings
+            )
+            self.instrument(self.replica_engine)
+            self.replica_session_maker = async_sessionmaker(
+                self.replica_engine, class_=AsyncSession, expire_on_commit=False
+            )
+        self.read_your_writes_window = settings.READ_YOUR_WRITES_WINDOW
+        self.recent_writers = TTLCache(maxsize=100_000, ttl=settings.READ_YOUR_WRITES_WINDOW)
 
-    def refresh(self) -> None:
-        self.engine = create_async_engine(get_settings().database_uri, echo=True, future=True)
+    @staticmethod
+    def instrument(engine: AsyncEngine) -> None:
+        instrument_engine(engine)
+        slow_query_log = get_slow_query_log()
+        if slow_query_log is not None:
+            slow_query_log.instrument(engine)
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+        if self.replica_engine is not None:
+            await self.replica_engine.dispose()
+
+
+class ReadYourWritesMiddleware:
+    """
+    Remember the clients whose writes succeeded, so that their following reads go to the primary.
+    A write is recorded once its response starts with a 2xx status: failed writes change nothing to read.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_remembering_write(message: Message) -> None:
+            if message["type"] == "http.response.start" and 200 <= message["status"] < 300:
+                SessionManager().remember_write(Request(scope), MutableHeaders(scope=message))
+            await send(message)
+
+        await self.app(scope, receive, send_remembering_write)
 
 
 async def get_session() -> AsyncSession:
-    session_maker = SessionManager().get_session_maker()
+    async with SessionManager().get_session_maker()() as session:
+        session.info["request_context"] = RequestContext()
+        yield session
+
+
+async def get_read_session(request: Request) -> AsyncSession:
+    session_maker = SessionManager().get_read_session_maker(request)
     async with session_maker() as session:
+        session.info["request_context"] = RequestContext()
         yield session
 
 
 __all__ = [
+    "get_read_session",
     "get_session",
+    "READ_PRIMARY_COOKIE",
+    "READ_PRIMARY_HEADER",
+    "ReadYourWritesMiddleware",
 ]
@@ -0,0 +1,53 @@
+"""unique history numbers
+
+Revision ID: 3f7a2c9d1b64
+Revises: 9e41d6f3c8a2
+Create Date: 2026-10-17 16:21:37.604812
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3f7a2c9d1b64"
+down_revision = "9e41d6f3c8a2"
+branch_labels = None
+depends_on = None
+
+
+HISTORIES = [("tender_history", "tender_id"), ("bid_history", "bid_id")]
+
+# Versions appended concurrently before the index existed may share a number:
+# keep the oldest row of each duplicate group and move the rest after the latest version.
+RENUMBER_DUPLICATES = """
+UPDATE {table} h
+SET history_number = d.latest + d.position
+FROM (
+    SELECT id, latest, row_number() OVER (PARTITION BY {key} ORDER BY created_at, id) AS position
+    FROM (
+        SELECT
+            id,
+            {key},
+            created_at,
+            max(history_number) OVER (PARTITION BY {key}) AS latest,
+            row_number() OVER (PARTITION BY {key}, history_number ORDER BY created_at, id) AS duplicate
+        FROM {table}
+    ) numbered
+    WHERE duplicate > 1
+) d
+WHERE h.id = d.id
+"""
+
+
+def upgrade():
+    for table, key in HISTORIES:
+        op.execute(RENUMBER_DUPLICATES.format(table=table, key=key))
+        op.drop_index(f"ix__{table}__{key}_history_number", table_name=table)
+        op.create_index(f"ix__{table}__{key}_history_number", table, [key, sa.text("history_number DESC")], unique=True)
+
+
+def downgrade():
+    for table, key in reversed(HISTORIES):
+        op.drop_index(f"ix__{table}__{key}_history_number", table_name=table)
+        op.create_index(f"ix__{table}__{key}_history_number", table, [key, sa.text("history_number DESC")])
@@ -0,0 +1,34 @@
+"""latest tender version indexes
+
+Revision ID: 5b0e7c2a91d4
+Revises: cd313817a14b
+Create Date: 2026-10-17 10:12:41.508133
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "5b0e7c2a91d4"
+down_revision = "cd313817a14b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix__tender_history__tender_id_history_number",
+        "tender_history",
+        ["tender_id", sa.text("history_number DESC")],
+    )
+    op.create_index(
+        "ix__tender_history__name_tender_id",
+        "tender_history",
+        [sa.text('name COLLATE "C"'), "tender_id"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix__tender_history__name_tender_id", table_name="tender_history")
+    op.drop_index("ix__tender_history__tender_id_history_number", table_name="tender_history")
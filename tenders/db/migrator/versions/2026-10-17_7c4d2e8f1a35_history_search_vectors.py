@@ -0,0 +1,43 @@
+"""history search vectors
+
+Revision ID: 7c4d2e8f1a35
+Revises: 3f7a2c9d1b64
+Create Date: 2026-10-17 19:04:12.381540
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "7c4d2e8f1a35"
+down_revision = "3f7a2c9d1b64"
+branch_labels = None
+depends_on = None
+
+
+HISTORIES = ["tender_history", "bid_history"]
+
+# Generated by PostgreSQL on every insert, so versions appended by edits and rollbacks are always searchable.
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('russian'::regconfig, coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('russian'::regconfig, coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'B')"
+)
+
+
+def upgrade():
+    for table in HISTORIES:
+        op.add_column(
+            table,
+            sa.Column("search_vector", postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True)),
+        )
+        op.create_index(f"ix__{table}__search_vector", table, ["search_vector"], postgresql_using="gin")
+
+
+def downgrade():
+    for table in reversed(HISTORIES):
+        op.drop_index(f"ix__{table}__search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,60 @@
+"""hot lookup indexes
+
+Revision ID: 9e41d6f3c8a2
+Revises: 5b0e7c2a91d4
+Create Date: 2026-10-17 13:47:05.219734
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "9e41d6f3c8a2"
+down_revision = "5b0e7c2a91d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f("ix__tender__status"), "tender", ["status"])
+    op.create_index(op.f("ix__tender__creator_id"), "tender", ["creator_id"])
+    op.create_index(op.f("ix__tender__organization_id"), "tender", ["organization_id"])
+    op.create_index(
+        "ix__tender_history__service_type_name_tender_id",
+        "tender_history",
+        ["service_type", sa.text('name COLLATE "C"'), "tender_id"],
+    )
+    op.create_index(op.f("ix__bid__tender_id"), "bid", ["tender_id"])
+    op.create_index("ix__bid__creator_id_creator_type", "bid", ["creator_id", "creator_type"])
+    op.create_index(
+        "ix__bid_history__bid_id_history_number",
+        "bid_history",
+        ["bid_id", sa.text("history_number DESC")],
+    )
+    op.create_index("ix__feedback__bid_id_creator_id", "feedback", ["bid_id", "creator_id"])
+    op.create_index(
+        "ix__feedback_history__feedback_id_history_number",
+        "feedback_history",
+        ["feedback_id", sa.text("history_number DESC")],
+    )
+    op.create_index(
+        "ix__organization_responsible__organization_id_user_id",
+        "organization_responsible",
+        ["organization_id", "user_id"],
+    )
+    op.create_index(op.f("ix__organization_responsible__user_id"), "organization_responsible", ["user_id"])
+
+
+def downgrade():
+    op.drop_index(op.f("ix__organization_responsible__user_id"), table_name="organization_responsible")
+    op.drop_index("ix__organization_responsible__organization_id_user_id", table_name="organization_responsible")
+    op.drop_index("ix__feedback_history__feedback_id_history_number", table_name="feedback_history")
+    op.drop_index("ix__feedback__bid_id_creator_id", table_name="feedback")
+    op.drop_index("ix__bid_history__bid_id_history_number", table_name="bid_history")
+    op.drop_index("ix__bid__creator_id_creator_type", table_name="bid")
+    op.drop_index(op.f("ix__bid__tender_id"), table_name="bid")
+    op.drop_index("ix__tender_history__service_type_name_tender_id", table_name="tender_history")
+    op.drop_index(op.f("ix__tender__organization_id"), table_name="tender")
+    op.drop_index(op.f("ix__tender__creator_id"), table_name="tender")
+    op.drop_index(op.f("ix__tender__status"), table_name="tender")
@@ -0,0 +1,52 @@
+"""tender name trigrams
+
+Revision ID: a81f3d5c9e27
+Revises: 7c4d2e8f1a35
+Create Date: 2026-10-17 21:37:05.116902
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from tenders.config import get_settings
+
+
+# revision identifiers, used by Alembic.
+revision = "a81f3d5c9e27"
+down_revision = "7c4d2e8f1a35"
+branch_labels = None
+depends_on = None
+
+
+# pg_trgm ships with the contrib modules of every PostgreSQL distribution, but minimal builds may lack it.
+# The migration fails then, unless PG_TRGM_OPTIONAL allows to go on with plain prefix suggestions.
+PG_TRGM_AVAILABLE = "SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')"
+
+
+def upgrade():
+    op.create_index(
+        "ix__tender_history__lower_name_tender_id",
+        "tender_history",
+        [sa.text('lower(name) COLLATE "C"'), "tender_id"],
+    )
+    if not op.get_bind().scalar(sa.text(PG_TRGM_AVAILABLE)):
+        if get_settings().PG_TRGM_OPTIONAL:
+            return
+        raise RuntimeError(
+            "the pg_trgm extension is not available: install the PostgreSQL contrib modules "
+            "or set PG_TRGM_OPTIONAL=true to suggest tenders by prefix only"
+        )
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # GiST rather than GIN: it returns the names in the order of distance to the prefix
+    op.create_index(
+        "ix__tender_history__name_trgm",
+        "tender_history",
+        ["name"],
+        postgresql_using="gist",
+        postgresql_ops={"name": "gist_trgm_ops"},
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix__tender_history__name_trgm")
+    op.drop_index("ix__tender_history__lower_name_tender_id", table_name="tender_history")
@@ -1,6 +1,6 @@
 from sqlalchemy import Column
 from sqlalchemy import Enum as SqlalchemyEnum
-from sqlalchemy import ForeignKey, text
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import INTEGER, TIMESTAMP, UUID
 
 from tenders.db import DeclarativeBase
@@ -12,7 +12,7 @@ class Bid(DeclarativeBase):
     __tablename__ = "bid"
 
     id = Column("id", UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v4()"))
-    tender_id = Column("tender_id", UUID(as_uuid=True), ForeignKey("tender.id"))
+    tender_id = Column("tender_id", UUID(as_uuid=True), ForeignKey("tender.id"), index=True)
     status = Column("status", SqlalchemyEnum(BidStatus))
     creator_type = Column("creator_type", SqlalchemyEnum(CreatorType))
     creator_id = Column("creator_id", UUID(as_uuid=True))
@@ -20,6 +20,8 @@ class Bid(DeclarativeBase):
     created_at = Column("created_at", TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column("updated_at", TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
 
+    __table_args__ = (Index("ix__bid__creator_id_creator_type", creator_id, creator_type),)
+
     def __repr__(self):
         columns = {column.name: getattr(self, column.name) for column in self.__table__.columns}
         return f'<{self.__tablename__}: {", ".join(map(lambda x: f"{x[0]}={x[1]}", columns.items()))}>'
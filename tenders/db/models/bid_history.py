@@ -1,8 +1,10 @@
 from sqlalchemy import Column
-from sqlalchemy import ForeignKey, text
-from sqlalchemy.dialects.postgresql import INTEGER, TEXT, TIMESTAMP, UUID, VARCHAR
+from sqlalchemy import Computed, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import INTEGER, TEXT, TIMESTAMP, TSVECTOR, UUID, VARCHAR
+from sqlalchemy.orm import deferred
 
 from tenders.db import DeclarativeBase
+from tenders.db.search import SEARCH_VECTOR
 
 
 class BidHistory(DeclarativeBase):
@@ -15,6 +17,12 @@ class BidHistory(DeclarativeBase):
     history_number = Column("history_number", INTEGER)
     created_at = Column("created_at", TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column("updated_at", TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
+    search_vector = deferred(Column("search_vector", TSVECTOR, Computed(SEARCH_VECTOR, persisted=True)))
+
+    __table_args__ = (
+        Index("ix__bid_history__bid_id_history_number", bid_id, history_number.desc(), unique=True),
+        Index("ix__bid_history__search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     def __repr__(self):
         columns = {column.name: getattr(self, column.name) for column in self.__table__.columns}
@@ -1,5 +1,5 @@
 from sqlalchemy import Column
-from sqlalchemy import ForeignKey, text
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
 
 from tenders.db import DeclarativeBase
@@ -14,6 +14,8 @@ class Feedback(DeclarativeBase):
     created_at = Column("created_at", TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column("updated_at", TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
 
+    __table_args__ = (Index("ix__feedback__bid_id_creator_id", bid_id, creator_id),)
+
     def __repr__(self):
         columns = {column.name: getattr(self, column.name) for column in self.__table__.columns}
         return f'<{self.__tablename__}: {", ".join(map(lambda x: f"{x[0]}={x[1]}", columns.items()))}>'
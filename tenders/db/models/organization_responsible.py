@@ -1,5 +1,5 @@
 from sqlalchemy import Column
-from sqlalchemy import ForeignKey, text
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from tenders.db import DeclarativeBase
@@ -10,7 +10,9 @@ class OrganizationResponsible(DeclarativeBase):
 
     id = Column("id", UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v4()"))
     organization_id = Column("organization_id", UUID(as_uuid=True), ForeignKey("organization.id"))
-    user_id = Column("user_id", UUID(as_uuid=True), ForeignKey("employee.id"))
+    user_id = Column("user_id", UUID(as_uuid=True), ForeignKey("employee.id"), index=True)
+
+    __table_args__ = (Index("ix__organization_responsible__organization_id_user_id", organization_id, user_id),)
 
     def __repr__(self):
         columns = {column.name: getattr(self, column.name) for column in self.__table__.columns}
@@ -11,9 +11,9 @@ class Tender(DeclarativeBase):
     __tablename__ = "tender"
 
     id = Column("id", UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v4()"))
-    organization_id = Column("organization_id", UUID(as_uuid=True), ForeignKey("organization.id"))
-    status = Column("status", SqlalchemyEnum(TenderStatus))
-    creator_id = Column("creator_id", UUID(as_uuid=True), ForeignKey("employee.id"))
+    organization_id = Column("organization_id", UUID(as_uuid=True), ForeignKey("organization.id"), index=True)
+    status = Column("status", SqlalchemyEnum(TenderStatus), index=True)
+    creator_id = Column("creator_id", UUID(as_uuid=True), ForeignKey("employee.id"), index=True)
     created_at = Column("created_at", TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column("updated_at", TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
 
@@ -1,10 +1,12 @@
-from sqlalchemy import Column
+from sqlalchemy import Column, Computed
 from sqlalchemy import Enum as SqlalchemyEnum
-from sqlalchemy import ForeignKey, text
-from sqlalchemy.dialects.postgresql import INTEGER, TEXT, TIMESTAMP, UUID, VARCHAR
+from sqlalchemy import ForeignKey, Index, func, text
+from sqlalchemy.dialects.postgresql import INTEGER, TEXT, TIMESTAMP, TSVECTOR, UUID, VARCHAR
+from sqlalchemy.orm import deferred
 
 from tenders.db import DeclarativeBase
 from tenders.db.enums import ServiceType
+from tenders.db.search import SEARCH_VECTOR
 
 
 class TenderHistory(DeclarativeBase):
@@ -18,6 +20,15 @@ class TenderHistory(DeclarativeBase):
     history_number = Column("history_number", INTEGER)
     created_at = Column("created_at", TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column("updated_at", TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
+    search_vector = deferred(Column("search_vector", TSVECTOR, Computed(SEARCH_VECTOR, persisted=True)))
+
+    __table_args__ = (
+        Index("ix__tender_history__tender_id_history_number", tender_id, history_number.desc(), unique=True),
+        Index("ix__tender_history__name_tender_id", name.collate("C"), tender_id),
+        Index("ix__tender_history__lower_name_tender_id", func.lower(name).collate("C"), tender_id),
+        Index("ix__tender_history__service_type_name_tender_id", service_type, name.collate("C"), tender_id),
+        Index("ix__tender_history__search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     def __repr__(self):
         columns = {column.name: getattr(self, column.name) for column in self.__table__.columns}
@@ -0,0 +1,16 @@
+SEARCH_CONFIGS = ("russian", "english")
+
+
+def weighted_search_vector(weights: dict[str, str]) -> str:
+    """
+    Build the SQL of a tsvector over text columns with their weights (A to D) in every search configuration,
+    so that Russian and English words are found by their stems.
+    """
+    return " || ".join(
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce({column}, '')), '{weight}')"
+        for column, weight in weights.items()
+        for config in SEARCH_CONFIGS
+    )
+
+
+SEARCH_VECTOR = weighted_search_vector({"name": "A", "description": "B"})
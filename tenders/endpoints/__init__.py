@@ -1,3 +1,4 @@
+from tenders.endpoints.admin import api_router as admin_router
 from tenders.endpoints.bid import api_router as bid_router
 from tenders.endpoints.ping import api_router as application_health_router
 from tenders.endpoints.tender import api_router as tender_router
@@ -7,6 +8,7 @@ list_of_routes = [
     application_health_router,
     tender_router,
     bid_router,
+    admin_router,
 ]
 
 
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette import status as http_status
+
+from tenders.schemas.admin import SlowQuery
+from tenders.utils.common import ADMIN_TOKEN_HEADER, PROFILE_FORMATS, get_profiles, get_slow_query_log, is_admin_token
+
+
+api_router = APIRouter(
+    prefix="/admin",
+    tags=["Administration"],
+)
+
+
+@api_router.get(
+    "/slow_queries",
+    response_model=list[SlowQuery],
+    status_code=http_status.HTTP_200_OK,
+)
+async def router_get_slow_queries(admin_token: str | None = Header(None, alias=ADMIN_TOKEN_HEADER)):
+    if not is_admin_token(admin_token):
+        return JSONResponse(status_code=http_status.HTTP_403_FORBIDDEN, content={"reason": "not enough rights"})
+    slow_query_log = get_slow_query_log()
+    if slow_query_log is None:
+        return JSONResponse(
+            status_code=http_status.HTTP_404_NOT_FOUND, content={"reason": "slow query log is disabled"}
+        )
+
+    return list(reversed(slow_query_log.entries))
+
+
+@api_router.get(
+    "/profiles/{profile_id}",
+    status_code=http_status.HTTP_200_OK,
+    responses={http_status.HTTP_200_OK: {"content": {"text/plain": {}, "application/json": {}}}},
+)
+async def router_get_profile(
+    profile_id: str,
+    profile_format: str = Query("collapsed", alias="format"),
+    admin_token: str | None = Header(None, alias=ADMIN_TOKEN_HEADER),
+):
+    if not is_admin_token(admin_token):
+        return JSONResponse(status_code=http_status.HTTP_403_FORBIDDEN, content={"reason": "not enough rights"})
+    if profile_format not in PROFILE_FORMATS:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid format"})
+    profile = get_profiles().get(profile_id)
+    if profile is None:
+        return JSONResponse(status_code=http_status.HTTP_404_NOT_FOUND, content={"reason": "profile was not found"})
+
+    if profile_format == "speedscope":
+        return JSONResponse(profile.speedscope())
+    return PlainTextResponse(profile.collapsed())
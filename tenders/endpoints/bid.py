@@ -1,25 +1,47 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status as http_status
 
-from tenders.db.connection import get_session
+from tenders.config import get_settings
+from tenders.db.connection import SessionManager, get_read_session, get_session
 from tenders.db.enums import BidStatus, CreatorType, Decision
 from tenders.schemas.bid import Bid, GetBidsResponse, GetFeedbacksResponse, NewBidRequest, PatchBidEditRequest
+from tenders.schemas.bulk import BulkResponse
+from tenders.schemas.pagination import CURSOR_DESCRIPTION, CursorPage
 from tenders.utils.bid import (
+    BID_FINGERPRINT,
     add_bid,
+    add_bids,
+    fetch_bids,
     get_bid_by_id,
-    get_tender_bids,
-    get_user_bids,
     get_user_tender_feedbacks,
+    make_bid,
     patch_bid_history,
     put_bid_decision,
     put_bid_status,
     put_feedback,
     rollback_version_bid,
+    select_exported_tender_bids,
+    select_found_user_bids,
+    select_tender_bids,
+    select_user_bids,
     validate_user_bid,
 )
+from tenders.utils.common import (
+    NDJSON_MEDIA_TYPE,
+    check_page_not_modified,
+    decode_cursor,
+    make_etag,
+    make_fingerprint,
+    make_items_etag,
+    make_page,
+    respond_fast,
+    respond_with_etag,
+    set_cache_headers,
+    stream_ndjson,
+)
 from tenders.utils.employee import get_employee_by_id, get_employee_by_username, validate_employee_organisation
 from tenders.utils.organization import get_organization_by_id
 from tenders.utils.tender import get_tender_by_id
@@ -58,41 +80,150 @@ async def router_post_bid(
     return await add_bid(request, session)
 
 
+@api_router.post(
+    "/bulk",
+    response_model=BulkResponse,
+    status_code=http_status.HTTP_200_OK,
+)
+async def router_post_bids_bulk(
+    bid_requests: list[NewBidRequest],
+    session: AsyncSession = Depends(get_session),
+):
+    if len(bid_requests) > get_settings().BULK_MAX_ITEMS:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "too many items"})
+
+    return await add_bids(bid_requests, session)
+
+
 @api_router.get(
     "/my",
-    response_model=GetBidsResponse,
+    response_model=GetBidsResponse | CursorPage[Bid],
     status_code=http_status.HTTP_200_OK,
 )
 async def router_get_my_bids(
+    request: Request,
+    response: Response,
     username: str,
     limit: int = 5,
     offset: int = 0,
-    session: AsyncSession = Depends(get_session),
+    cursor: str = Query(None, description=CURSOR_DESCRIPTION),
+    session: AsyncSession = Depends(get_read_session),
 ):
+    if limit < 0:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
+    if offset < 0:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid offset"})
     user = await get_employee_by_username(username, session)
-    if username is None:
+    if user is None:
         return JSONResponse(status_code=http_status.HTTP_401_UNAUTHORIZED, content={"reason": "user was not found"})
+    if cursor is None:
+        query = select_user_bids(user.id, limit, offset)
+    else:
+        if limit < 1:
+            return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid cursor"})
+        query = select_user_bids(user.id, limit + 1, 0, after)
 
-    return await get_user_bids(user.id, limit, offset, session)
+    not_modified = await check_page_not_modified(request, query, BID_FINGERPRINT, session)
+    if not_modified is not None:
+        return not_modified
+    bids = await fetch_bids(query, session)
+    set_cache_headers(response, make_items_etag(bids))
+
+    return respond_fast(response, bids if cursor is None else make_page(bids, limit))
 
 
 @api_router.get(
-    "/{tender_id}/list",
+    "/search",
     response_model=GetBidsResponse,
     status_code=http_status.HTTP_200_OK,
 )
+async def router_search_bids(
+    response: Response,
+    username: str,
+    q: str,
+    limit: int = 5,
+    offset: int = 0,
+    session: AsyncSession = Depends(get_read_session),
+):
+    if not q.strip():
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid query"})
+    if limit < 0:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
+    if offset < 0:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid offset"})
+    user = await get_employee_by_username(username, session)
+    if user is None:
+        return JSONResponse(status_code=http_status.HTTP_401_UNAUTHORIZED, content={"reason": "user was not found"})
+    bids = await fetch_bids(select_found_user_bids(user.id, q, limit, offset), session)
+
+    return respond_fast(response, bids)
+
+
+@api_router.get(
+    "/{tender_id}/list",
+    response_model=GetBidsResponse | CursorPage[Bid],
+    status_code=http_status.HTTP_200_OK,
+)
 async def router_get_bids(
+    request: Request,
+    response: Response,
     tender_id: UUID4,
     username: str,
     limit: int = 5,
     offset: int = 0,
-    session: AsyncSession = Depends(get_session),
+    cursor: str = Query(None, description=CURSOR_DESCRIPTION),
+    session: AsyncSession = Depends(get_read_session),
 ):
+    if limit < 0:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
+    if offset < 0:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid offset"})
     user = await get_employee_by_username(username, session)
     if user is None:
         return JSONResponse(status_code=http_status.HTTP_401_UNAUTHORIZED, content={"reason": "user was not found"})
+    if cursor is None:
+        query = await select_tender_bids(tender_id, user.id, limit, offset, session)
+    else:
+        if limit < 1:
+            return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid cursor"})
+        query = await select_tender_bids(tender_id, user.id, limit + 1, 0, session, after)
+
+    not_modified = await check_page_not_modified(request, query, BID_FINGERPRINT, session)
+    if not_modified is not None:
+        return not_modified
+    bids = await fetch_bids(query, session)
+    set_cache_headers(response, make_items_etag(bids))
 
-    return await get_tender_bids(tender_id, user.id, limit, offset, session)
+    return respond_fast(response, bids if cursor is None else make_page(bids, limit))
+
+
+@api_router.get(
+    "/{tender_id}/export",
+    response_class=StreamingResponse,
+    status_code=http_status.HTTP_200_OK,
+)
+async def router_export_bids(
+    request: Request,
+    tender_id: UUID4,
+    username: str,
+    session: AsyncSession = Depends(get_read_session),
+):
+    user = await get_employee_by_username(username, session)
+    if user is None:
+        return JSONResponse(status_code=http_status.HTTP_401_UNAUTHORIZED, content={"reason": "user was not found"})
+    session_maker = SessionManager().get_read_session_maker(request)
+    query = await select_exported_tender_bids(tender_id, user.id, session)
+    batch_size = get_settings().EXPORT_BATCH_SIZE
+
+    return StreamingResponse(stream_ndjson(session_maker, query, make_bid, batch_size), media_type=NDJSON_MEDIA_TYPE)
 
 
 @api_router.get(
@@ -101,9 +232,11 @@ async def router_get_bids(
     status_code=http_status.HTTP_200_OK,
 )
 async def router_get_bid_status(
+    request: Request,
+    response: Response,
     bid_id: UUID4,
     username: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     validation = await validate_user_bid(username, bid_id, session)
     if validation is not None:
@@ -111,7 +244,7 @@ async def router_get_bid_status(
 
     bid = await get_bid_by_id(bid_id, session)
 
-    return bid.status
+    return respond_with_etag(request, response, make_etag([make_fingerprint(bid.id, bid.status)]), bid.status)
 
 
 @api_router.put(
@@ -129,9 +262,7 @@ async def router_put_bid_status(
     if validation is not None:
         return validation
 
-    await put_bid_status(bid_id, status, session)
-
-    return await get_bid_by_id(bid_id, session)
+    return await put_bid_status(bid_id, status, session)
 
 
 @api_router.patch(
@@ -149,9 +280,7 @@ async def router_patch_bid(
     if validation is not None:
         return validation
 
-    bid = await get_bid_by_id(bid_id, session)
-
-    return await patch_bid_history(bid.id, request.name, request.description, session)
+    return await patch_bid_history(bid_id, request.name, request.description, session)
 
 
 @api_router.put(
@@ -187,7 +316,7 @@ async def router_get_reviews(
     requesterUsername: str,
     limit: int = 5,
     offset: int = 0,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     tender = await get_tender_by_id(tender_id, session)
     if tender is None:
@@ -222,9 +351,7 @@ async def router_rollback_bid_version(
     if validation is not None:
         return validation
 
-    await rollback_version_bid(bid_id, version, session)
-
-    return await get_bid_by_id(bid_id, session)
+    return await rollback_version_bid(bid_id, version, session)
 
 
 @api_router.put(
@@ -242,6 +369,4 @@ async def router_put_submit_decision(
     if validation is not None:
         return validation
 
-    await put_bid_decision(bid_id, decision, session)
-
-    return await get_bid_by_id(bid_id, session)
+    return await put_bid_decision(bid_id, decision, session)
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from tenders.db.connection import get_session
 from tenders.schemas import PingResponse
+from tenders.utils.common import METRICS_MEDIA_TYPE
 from tenders.utils.health_check import health_check_db
+from tenders.utils.metrics import render_metrics
 
 
 api_router = APIRouter(
@@ -39,3 +41,15 @@ async def ping_database(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         detail="Database isn't working",
     )
+
+
+@api_router.get(
+    "/metrics",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"content": {METRICS_MEDIA_TYPE: {}}, "description": "Prometheus text format"}},
+)
+async def get_metrics(
+    _: Request,
+):
+    return Response(render_metrics(), media_type=METRICS_MEDIA_TYPE)
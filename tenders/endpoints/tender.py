@@ -1,22 +1,45 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status as http_status
 
-from tenders.db.connection import get_session
+from tenders.config import get_settings
+from tenders.db.connection import SessionManager, get_read_session, get_session
 from tenders.db.enums import ServiceType, TenderStatus
+from tenders.schemas.bulk import BulkResponse
+from tenders.schemas.pagination import CURSOR_DESCRIPTION, CursorPage
 from tenders.schemas.tender import GetTendersResponse, NewTenderRequest, PatchTenderEditRequest, Tender
+from tenders.utils.common import (
+    NDJSON_MEDIA_TYPE,
+    check_page_not_modified,
+    decode_cursor,
+    make_etag,
+    make_fingerprint,
+    make_items_etag,
+    make_page,
+    respond_fast,
+    respond_with_etag,
+    set_cache_headers,
+    stream_ndjson,
+)
 from tenders.utils.employee import get_employee_by_username, validate_employee_organisation
 from tenders.utils.tender import (
+    SUGGEST_MIN_PREFIX_LENGTH,
+    TENDER_FINGERPRINT,
     add_tender,
+    add_tenders,
+    fetch_tenders,
     get_tender_by_id,
-    get_tenders,
-    get_tenders_by_user,
+    make_tender,
     patch_tender_history,
-    process_tender,
     put_tender_status,
     rollback_version_tender,
+    select_exported_tenders,
+    select_found_tenders,
+    select_suggested_tenders,
+    select_tenders,
+    select_user_tenders,
     validate_tender_user,
 )
 
@@ -29,18 +52,99 @@ api_router = APIRouter(
 
 @api_router.get(
     "",
-    response_model=GetTendersResponse,
+    response_model=GetTendersResponse | CursorPage[Tender],
     status_code=http_status.HTTP_200_OK,
 )
 async def router_get_tenders(
-    limit: int = 5, offset: int = 0, service_type: ServiceType = None, session: AsyncSession = Depends(get_session)
+    request: Request,
+    response: Response,
+    limit: int = 5,
+    offset: int = 0,
+    service_type: ServiceType = None,
+    cursor: str = Query(None, description=CURSOR_DESCRIPTION),
+    session: AsyncSession = Depends(get_read_session),
+):
+    if limit < 0:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
+    if offset < 0:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid offset"})
+    if cursor is None:
+        query = select_tenders(limit, offset, service_type)
+    else:
+        if limit < 1:
+            return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid cursor"})
+        query = select_tenders(limit + 1, 0, service_type, after)
+
+    not_modified = await check_page_not_modified(request, query, TENDER_FINGERPRINT, session)
+    if not_modified is not None:
+        return not_modified
+    tenders = await fetch_tenders(query, session)
+    set_cache_headers(response, make_items_etag(tenders))
+
+    return respond_fast(response, tenders if cursor is None else make_page(tenders, limit))
+
+
+@api_router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=http_status.HTTP_200_OK,
+)
+async def router_export_tenders(request: Request, service_type: ServiceType = None):
+    session_maker = SessionManager().get_read_session_maker(request)
+    query = select_exported_tenders(service_type)
+    batch_size = get_settings().EXPORT_BATCH_SIZE
+
+    return StreamingResponse(stream_ndjson(session_maker, query, make_tender, batch_size), media_type=NDJSON_MEDIA_TYPE)
+
+
+@api_router.get(
+    "/search",
+    response_model=GetTendersResponse,
+    status_code=http_status.HTTP_200_OK,
+)
+async def router_search_tenders(
+    response: Response,
+    q: str,
+    limit: int = 5,
+    offset: int = 0,
+    service_type: ServiceType = None,
+    session: AsyncSession = Depends(get_read_session),
 ):
+    if not q.strip():
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid query"})
     if limit < 0:
         return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
     if offset < 0:
         return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid offset"})
+    tenders = await fetch_tenders(select_found_tenders(q, limit, offset, service_type), session)
 
-    return await get_tenders(limit, offset, service_type, session)
+    return respond_fast(response, tenders)
+
+
+@api_router.get(
+    "/suggest",
+    response_model=GetTendersResponse,
+    status_code=http_status.HTTP_200_OK,
+)
+async def router_suggest_tenders(
+    response: Response,
+    prefix: str,
+    limit: int = 10,
+    session: AsyncSession = Depends(get_read_session),
+):
+    prefix = prefix.strip()
+    # shorter prefixes have no trigrams to look up and match a large share of the names
+    if len(prefix) < SUGGEST_MIN_PREFIX_LENGTH:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid prefix"})
+    if limit < 0:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
+    tenders = await fetch_tenders(await select_suggested_tenders(prefix, limit, session), session)
+
+    return respond_fast(response, tenders)
 
 
 @api_router.post(
@@ -63,13 +167,34 @@ async def router_post_tender(
     return await add_tender(tender_request, user.id, session)
 
 
+@api_router.post(
+    "/bulk",
+    response_model=BulkResponse,
+    status_code=http_status.HTTP_200_OK,
+)
+async def router_post_tenders_bulk(
+    tender_requests: list[NewTenderRequest],
+    session: AsyncSession = Depends(get_session),
+):
+    if len(tender_requests) > get_settings().BULK_MAX_ITEMS:
+        return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "too many items"})
+
+    return await add_tenders(tender_requests, session)
+
+
 @api_router.get(
     "/my",
-    response_model=GetTendersResponse,
+    response_model=GetTendersResponse | CursorPage[Tender],
     status_code=http_status.HTTP_200_OK,
 )
 async def router_get_my_tenders(
-    username: str, limit: int = 5, offset: int = 0, session: AsyncSession = Depends(get_session)
+    request: Request,
+    response: Response,
+    username: str,
+    limit: int = 5,
+    offset: int = 0,
+    cursor: str = Query(None, description=CURSOR_DESCRIPTION),
+    session: AsyncSession = Depends(get_read_session),
 ):
     if limit < 0:
         return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
@@ -79,7 +204,24 @@ async def router_get_my_tenders(
     if user is None:
         return JSONResponse(status_code=http_status.HTTP_401_UNAUTHORIZED, content={"reason": "user was not found"})
 
-    return await get_tenders_by_user(user.id, limit, offset, session)
+    if cursor is None:
+        query = select_user_tenders(user.id, limit, offset)
+    else:
+        if limit < 1:
+            return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid limit"})
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            return JSONResponse(status_code=http_status.HTTP_400_BAD_REQUEST, content={"reason": "invalid cursor"})
+        query = select_user_tenders(user.id, limit + 1, 0, after)
+
+    not_modified = await check_page_not_modified(request, query, TENDER_FINGERPRINT, session)
+    if not_modified is not None:
+        return not_modified
+    tenders = await fetch_tenders(query, session)
+    set_cache_headers(response, make_items_etag(tenders))
+
+    return respond_fast(response, tenders if cursor is None else make_page(tenders, limit))
 
 
 @api_router.get(
@@ -88,19 +230,24 @@ async def router_get_my_tenders(
     status_code=http_status.HTTP_200_OK,
 )
 async def router_get_tender_status(
-    tender_id: UUID4, username: str = None, session: AsyncSession = Depends(get_session)
+    request: Request,
+    response: Response,
+    tender_id: UUID4,
+    username: str = None,
+    session: AsyncSession = Depends(get_read_session),
 ):
     tender = await get_tender_by_id(tender_id, session)
     if tender is None:
         return JSONResponse(status_code=http_status.HTTP_404_NOT_FOUND, content={"reason": "tender was not found"})
+    etag = make_etag([make_fingerprint(tender.id, tender.status)])
     if tender.status == TenderStatus.PUBLISHED:
-        return tender.status
+        return respond_with_etag(request, response, etag, tender.status)
 
     user = await get_employee_by_username(username, session)
     if user is None:
         return JSONResponse(status_code=http_status.HTTP_401_UNAUTHORIZED, content={"reason": "user was not found"})
     if tender.creator_id == user.id or await validate_employee_organisation(user.id, tender.organization_id, session):
-        return tender.status
+        return respond_with_etag(request, response, etag, tender.status)
 
     return JSONResponse(status_code=http_status.HTTP_403_FORBIDDEN, content={"reason": "not enough rights"})
 
@@ -116,11 +263,8 @@ async def router_put_tender_status(
     validation = await validate_tender_user(tender_id, username, session)
     if validation is not None:
         return validation
-    await put_tender_status(tender_id, status, session)
-    tender = await get_tender_by_id(tender_id, session)
 
-    print(await process_tender(tender, session))
-    return await process_tender(tender, session)
+    return await put_tender_status(tender_id, status, session)
 
 
 @api_router.patch(
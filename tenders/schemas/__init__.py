@@ -1,9 +1,16 @@
+from tenders.schemas.admin import SlowQuery
+from tenders.schemas.bulk import BulkItemResult, BulkResponse
+from tenders.schemas.pagination import CursorPage
 from tenders.schemas.ping import PingResponse
 from tenders.schemas.tender import GetTendersResponse, NewTenderRequest, Tender
 
 
 __all__ = [
+    "BulkItemResult",
+    "BulkResponse",
+    "CursorPage",
     "PingResponse",
+    "SlowQuery",
     "Tender",
     "NewTenderRequest",
     "GetTendersResponse",
@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SlowQuery(BaseModel):
+    recorded_at: datetime
+    duration: float
+    route: str | None
+    statement: str
+    parameters: list[str]
+    plan: str | None
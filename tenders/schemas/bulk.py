@@ -0,0 +1,18 @@
+from pydantic import BaseModel, RootModel
+from pydantic.types import UUID4
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    id: UUID4 | None = None
+    reason: str | None = None
+
+
+class BulkResponse(RootModel):
+    root: list[BulkItemResult]
+
+    def __iter__(self):
+        return iter(self.root)
+
+    def __getitem__(self, item):
+        return self.root[item]
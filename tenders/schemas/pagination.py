@@ -0,0 +1,16 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+
+T = TypeVar("T")
+
+CURSOR_DESCRIPTION = (
+    "Opaque cursor for keyset pagination, pass an empty value for the first page. "
+    "When set, offset is ignored and the response is a page with next_cursor."
+)
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
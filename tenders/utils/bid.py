@@ -1,27 +1,52 @@
 from datetime import datetime
+from uuid import uuid4
 
 from pydantic import UUID4
-from sqlalchemy import select, update
+from sqlalchemy import Select, Update, and_, case, func, insert, literal, or_, select, tuple_, union, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, aliased
 from starlette import status as http_status
 from starlette.responses import JSONResponse
 
 from tenders.db.enums import BidStatus, CreatorType, Decision, TenderStatus
-from tenders.db.models import Bid, BidHistory, Feedback, FeedbackHistory, OrganizationResponsible, Tender
+from tenders.db.models import (
+    Bid,
+    BidHistory,
+    Employee,
+    Feedback,
+    FeedbackHistory,
+    Organization,
+    OrganizationResponsible,
+    Tender,
+)
 from tenders.schemas.bid import Bid as SchemaBid
 from tenders.schemas.bid import Feedback as SchemaFeedback
 from tenders.schemas.bid import NewBidRequest
-from tenders.utils.bid_history import add_new_version, rollback_version
-from tenders.utils.employee import get_employee_by_username, validate_employee_organisation
-from tenders.utils.organization import get_quorum
+from tenders.schemas.bulk import BulkItemResult
+from tenders.utils.bid_history import add_new_version, get_versions_loader, is_latest_version, rollback_version
+from tenders.utils.common import (
+    Cursor,
+    LatestVersionLoader,
+    VersionConflictError,
+    equals_any,
+    get_latest_version_loader,
+    get_request_context,
+    insert_with_first_version,
+    rank_by_search,
+    select_updated_with_latest_version,
+)
+from tenders.utils.employee import get_employee_by_username, get_user_organizations
 from tenders.utils.tender import get_tender_by_id
 
 
-async def process_bid(bid: Bid, session: AsyncSession):
-    query = select(BidHistory).where(BidHistory.bid_id == bid.id)
-    history = await session.scalars(query)
-    history = max(history, key=lambda x: x.history_number)
+def get_feedback_versions_loader(session: AsyncSession) -> LatestVersionLoader:
+    return get_latest_version_loader(FeedbackHistory.feedback_id, session)
 
+
+BID_FINGERPRINT = (Bid.id, Bid.status, BidHistory.history_number)
+
+
+def make_bid(bid: Bid, history: BidHistory) -> SchemaBid:
     return SchemaBid(
         id=bid.id,
         name=history.name,
@@ -35,11 +60,19 @@ async def process_bid(bid: Bid, session: AsyncSession):
     )
 
 
-async def process_feedback(feedback: Feedback, session: AsyncSession):
-    query = select(FeedbackHistory).where(FeedbackHistory.feedback_id == feedback.id)
-    history = await session.scalars(query)
-    history = max(history, key=lambda x: x.history_number)
+async def process_bid(bid: Bid, session: AsyncSession) -> SchemaBid:
+    history = await get_versions_loader(session).load(bid.id)
+
+    return make_bid(bid, history)
+
 
+async def process_bids(bids: list[Bid], session: AsyncSession) -> list[SchemaBid]:
+    versions = await get_versions_loader(session).load_many(bid.id for bid in bids)
+
+    return [make_bid(bid, versions[bid.id]) for bid in bids]
+
+
+def make_feedback(feedback: Feedback, history: FeedbackHistory) -> SchemaFeedback:
     return SchemaFeedback(
         id=feedback.id,
         description=history.description,
@@ -47,133 +80,209 @@ async def process_feedback(feedback: Feedback, session: AsyncSession):
     )
 
 
+async def process_feedbacks(feedbacks: list[Feedback], session: AsyncSession) -> list[SchemaFeedback]:
+    versions = await get_feedback_versions_loader(session).load_many(feedback.id for feedback in feedbacks)
+
+    return [make_feedback(feedback, versions[feedback.id]) for feedback in feedbacks]
+
+
 async def validate_user_bid(username: str, bid_id: UUID4, session: AsyncSession):
     user = await get_employee_by_username(username, session)
-    if username is None:
+    if user is None:
         return JSONResponse(status_code=http_status.HTTP_401_UNAUTHORIZED, content={"reason": "user was not found"})
 
     bid = await get_bid_by_id(bid_id, session)
     if bid is None:
         return JSONResponse(status_code=http_status.HTTP_404_NOT_FOUND, content={"reason": "bid was not found"})
 
+    organizations = await get_user_organizations(user.id, session)
     if not (
         (bid.authorType == CreatorType.USER and bid.authorId == user.id)
-        or (
-            bid.authorType == CreatorType.ORGANIZATION
-            and await validate_employee_organisation(user.id, bid.authorId, session)
-        )
+        or (bid.authorType == CreatorType.ORGANIZATION and bid.authorId in organizations)
     ):
-        query = select(Tender).where(Tender.id == bid.tenderId)
-        tender = await session.scalar(query)
-        if not await validate_employee_organisation(user.id, tender.organization_id, session):
+        tender = await get_tender_by_id(bid.tenderId, session)
+        if tender.organization_id not in organizations:
             return JSONResponse(status_code=http_status.HTTP_403_FORBIDDEN, content={"reason": "not enough rights"})
 
     return None
 
 
-async def add_bid(data: NewBidRequest, session: AsyncSession):
-    bid = Bid(
-        tender_id=data.tenderId,
-        status=BidStatus.CREATED,
-        creator_type=data.authorType,
-        creator_id=data.authorId,
+async def add_bid(data: NewBidRequest, session: AsyncSession) -> SchemaBid:
+    query = insert_with_first_version(
+        Bid,
+        {
+            "tender_id": data.tenderId,
+            "status": BidStatus.CREATED,
+            "creator_type": data.authorType,
+            "creator_id": data.authorId,
+        },
+        BidHistory.bid_id,
+        {"name": data.name, "description": data.description},
     )
-    session.add(bid)
-    await session.flush()
-    await session.refresh(bid)
-
-    bid_history = BidHistory(
-        bid_id=bid.id,
-        name=data.name,
-        description=data.description,
-        history_number=1,
+    bid, bid_history = (await session.execute(query)).one()
+    await session.commit()
+
+    return make_bid(bid, bid_history)
+
+
+def select_user_visible_bid_ids(user_id: UUID4) -> Select:
+    organizations = select(OrganizationResponsible.organization_id).where(OrganizationResponsible.user_id == user_id)
+
+    return union(
+        select(Bid.id).where(Bid.creator_id == user_id, Bid.creator_type == CreatorType.USER),
+        select(Bid.id).where(Bid.creator_id.in_(organizations), Bid.creator_type == CreatorType.ORGANIZATION),
+        select(Bid.id).join(Tender, Tender.id == Bid.tender_id).where(Tender.organization_id.in_(organizations)),
     )
-    session.add(bid_history)
-    await session.flush()
-    await session.refresh(bid_history)
 
-    await session.commit()
 
-    return {
-        "id": bid.id,
-        "name": data.name,
-        "description": data.description,
-        "status": bid.status,
-        "tenderId": data.tenderId,
-        "authorType": data.authorType,
-        "authorId": data.authorId,
-        "version": bid_history.history_number,
-        "createdAt": bid.created_at,
+def paginate_by_name(query: Select, limit: int, offset: int, after: Cursor | None) -> Select:
+    key = (BidHistory.name.collate("C"), BidHistory.bid_id)
+    if after is not None:
+        query = query.where(tuple_(*key) > tuple_(*after))
+
+    return query.order_by(*key).offset(offset).limit(limit)
+
+
+async def fetch_bids(query: Select, session: AsyncSession) -> list[SchemaBid]:
+    rows = await session.execute(query)
+    loader = get_versions_loader(session)
+    bids = []
+    for bid, history in rows:
+        loader.prime(bid.id, history)
+        bids.append(make_bid(bid, history))
+
+    return bids
+
+
+async def get_existing_ids(column: InstrumentedAttribute, ids: set[UUID4], session: AsyncSession) -> set[UUID4]:
+    if not ids:
+        return set()
+    query = select(column).where(equals_any(column, ids))
+
+    return set(await session.scalars(query))
+
+
+async def add_bids(data: list[NewBidRequest], session: AsyncSession) -> list[BulkItemResult]:
+    tenders = await get_existing_ids(Tender.id, {item.tenderId for item in data}, session)
+    authors = {
+        author_type: {item.authorId for item in data if item.authorType == author_type} for author_type in CreatorType
     }
+    users = await get_existing_ids(Employee.id, authors[CreatorType.USER], session)
+    organizations = await get_existing_ids(Organization.id, authors[CreatorType.ORGANIZATION], session)
+
+    results, bids, histories = [], [], []
+    for index, item in enumerate(data):
+        if item.tenderId not in tenders:
+            results.append(BulkItemResult(index=index, reason="tender was not found"))
+        elif item.authorType == CreatorType.USER and item.authorId not in users:
+            results.append(BulkItemResult(index=index, reason="user was not found"))
+        elif item.authorType == CreatorType.ORGANIZATION and item.authorId not in organizations:
+            results.append(BulkItemResult(index=index, reason="organization was not found"))
+        else:
+            bid_id = uuid4()
+            bids.append(
+                {
+                    "id": bid_id,
+                    "tender_id": item.tenderId,
+                    "status": BidStatus.CREATED,
+                    "creator_type": item.authorType,
+                    "creator_id": item.authorId,
+                }
+            )
+            histories.append(
+                {"bid_id": bid_id, "name": item.name, "description": item.description, "history_number": 1}
+            )
+            results.append(BulkItemResult(index=index, id=bid_id))
+
+    if bids:
+        await session.execute(insert(Bid.__table__), bids)
+        await session.execute(insert(BidHistory.__table__), histories)
+        await session.commit()
+
+    return results
+
+
+def select_user_visible_bids(user_id: UUID4) -> Select:
+    visible = select_user_visible_bid_ids(user_id).subquery()
+
+    return (
+        select(Bid, BidHistory)
+        .join(visible, visible.c.id == Bid.id)
+        .join(BidHistory, BidHistory.bid_id == Bid.id)
+        .where(is_latest_version(BidHistory))
+    )
+
+
+def select_user_bids(user_id: UUID4, limit: int, offset: int, after: Cursor | None = None) -> Select:
+    return paginate_by_name(select_user_visible_bids(user_id), limit, offset, after)
+
 
+def select_found_user_bids(user_id: UUID4, text: str, limit: int, offset: int) -> Select:
+    query = select_user_visible_bids(user_id)
 
-async def get_user_bids(user_id: UUID4, limit: int, offset: int, session: AsyncSession):
-    query = select(Bid).where(Bid.creator_id == user_id, Bid.creator_type == CreatorType.USER)
-    bids = await session.scalars(query)
-    bids = [await process_bid(bid, session) for bid in bids]
+    return rank_by_search(query, BidHistory.search_vector, BidHistory.bid_id, text, limit, offset)
 
-    query = select(OrganizationResponsible).where(OrganizationResponsible.user_id == user_id)
-    organizations = await session.scalars(query)
-    for organization in organizations:
-        query = select(Bid).where(
-            Bid.creator_id == organization.organization_id, Bid.creator_type == CreatorType.ORGANIZATION
+
+async def select_visible_tender_bids(tender_id: UUID4, user_id: UUID4, session: AsyncSession) -> Select:
+    organizations = await get_user_organizations(user_id, session)
+
+    return (
+        select(Bid, BidHistory)
+        .join(BidHistory, BidHistory.bid_id == Bid.id)
+        .join(Tender, Tender.id == Bid.tender_id)
+        .where(
+            Bid.tender_id == tender_id,
+            is_latest_version(BidHistory),
+            or_(
+                Bid.status == BidStatus.PUBLISHED,
+                and_(Bid.creator_type == CreatorType.USER, Bid.creator_id == user_id),
+                and_(Bid.creator_type == CreatorType.ORGANIZATION, Bid.creator_id.in_(organizations)),
+                Tender.organization_id.in_(organizations),
+            ),
         )
-        current_bids = await session.scalars(query)
-        current_bids = [await process_bid(bid, session) for bid in current_bids]
-        bids += current_bids
-
-        query = select(Tender).where(Tender.organization_id == organization.organization_id)
-        tenders = await session.scalars(query)
-        for tender in tenders:
-            query = select(Bid).where(Bid.tender_id == tender.id)
-            current_bids = await session.scalars(query)
-            current_bids = [await process_bid(bid, session) for bid in current_bids]
-            bids += current_bids
-
-    bids = list(set(bids))
-    bids.sort(key=lambda x: x.name)
-
-    return bids[offset : (offset + limit)]
-
-
-async def get_tender_bids(tender_id: UUID4, user_id: UUID4, limit: int, offset: int, session: AsyncSession):
-    query = select(Bid).where(Bid.tender_id == tender_id)
-    bids = await session.scalars(query)
-    bids = [await process_bid(bid, session) for bid in bids]
-    new_bids = []
-    for bid in bids:
-        if (
-            bid.status == BidStatus.PUBLISHED
-            or (bid.authorType == CreatorType.USER and bid.authorId == user_id)
-            or (
-                bid.authorType == CreatorType.ORGANIZATION
-                and await validate_employee_organisation(user_id, bid.authorId, session)
-            )
-        ):
-            new_bids.append(bid)
-        else:
-            query = select(Tender).where(Tender.id == bid.tenderId)
-            tender = await session.scalar(query)
-            if await validate_employee_organisation(user_id, tender.organization_id, session):
-                new_bids.append(bid)
-    bids = new_bids
-    bids.sort(key=lambda x: x.name)
+    )
+
+
+async def select_tender_bids(
+    tender_id: UUID4, user_id: UUID4, limit: int, offset: int, session: AsyncSession, after: Cursor | None = None
+) -> Select:
+    query = await select_visible_tender_bids(tender_id, user_id, session)
+
+    return paginate_by_name(query, limit, offset, after)
+
+
+async def select_exported_tender_bids(tender_id: UUID4, user_id: UUID4, session: AsyncSession) -> Select:
+    query = await select_visible_tender_bids(tender_id, user_id, session)
 
-    return bids[offset : (offset + limit)]
+    return query.order_by(Bid.id)
+
+
+def select_updated_bid(statement: Update) -> Select:
+    return select_updated_with_latest_version(statement, BidHistory.bid_id, is_latest_version)
+
+
+def remember_bid(bid: Bid, bid_history: BidHistory, session: AsyncSession) -> SchemaBid:
+    get_request_context(session).set(Bid.id, bid.id, bid)
+    get_versions_loader(session).prime(bid.id, bid_history)
+
+    return make_bid(bid, bid_history)
 
 
 async def get_bid_by_id(bid_id: UUID4, session: AsyncSession):
-    query = select(Bid).where(Bid.id == bid_id)
-    bid = await session.scalar(query)
+    bid = await get_request_context(session).load(Bid.id, bid_id, session)
+    if bid is None:
+        return None
 
     return await process_bid(bid, session)
 
 
-async def put_bid_status(bid_id: UUID4, status: BidStatus, session: AsyncSession):
+async def put_bid_status(bid_id: UUID4, status: BidStatus, session: AsyncSession) -> SchemaBid:
     query = update(Bid).where(Bid.id == bid_id).values(updated_at=datetime.now(), status=status)
-    await session.execute(query)
+    bid, bid_history = (await session.execute(select_updated_bid(query))).one()
     await session.commit()
 
+    return remember_bid(bid, bid_history, session)
+
 
 async def patch_bid_history(
     bid_id: UUID4,
@@ -181,15 +290,12 @@ async def patch_bid_history(
     description: str,
     session: AsyncSession,
 ):
-    bid = await get_bid_by_id(bid_id, session)
-    await add_new_version(bid, name, description, session)
-    bid.version += 1
-    if name is not None:
-        bid.name = name
-    if description is not None:
-        bid.description = description
+    try:
+        bid, bid_history = await add_new_version(bid_id, name, description, session)
+    except VersionConflictError:
+        return JSONResponse(status_code=http_status.HTTP_409_CONFLICT, content={"reason": "bid is being edited"})
 
-    return bid
+    return make_bid(bid, bid_history)
 
 
 async def put_feedback(
@@ -198,23 +304,13 @@ async def put_feedback(
     description: str,
     session: AsyncSession,
 ):
-    feedback = Feedback(
-        bid_id=bid_id,
-        creator_id=user_id,
-    )
-    session.add(feedback)
-    await session.flush()
-    await session.refresh(feedback)
-
-    history = FeedbackHistory(
-        feedback_id=feedback.id,
-        description=description,
-        history_number=1,
+    query = insert_with_first_version(
+        Feedback,
+        {"bid_id": bid_id, "creator_id": user_id},
+        FeedbackHistory.feedback_id,
+        {"description": description},
     )
-    session.add(history)
-    await session.flush()
-    await session.refresh(history)
-
+    await session.execute(query)
     await session.commit()
 
 
@@ -223,47 +319,92 @@ async def rollback_version_bid(
     version: int,
     session: AsyncSession,
 ):
-    bid = await get_bid_by_id(bid_id, session)
-    await rollback_version(bid, version, session)
-    bid = await get_bid_by_id(bid_id, session)
+    try:
+        row = await rollback_version(bid_id, version, session)
+    except VersionConflictError:
+        return JSONResponse(status_code=http_status.HTTP_409_CONFLICT, content={"reason": "bid is being edited"})
+    if row is None:
+        return JSONResponse(status_code=http_status.HTTP_404_NOT_FOUND, content={"reason": "version was not found"})
 
-    return bid
+    return make_bid(*row)
 
 
 async def get_user_bid_feedbacks(bid_id: UUID4, user_id: UUID4, session: AsyncSession):
     query = select(Feedback).where(Feedback.bid_id == bid_id, Feedback.creator_id == user_id)
     feedbacks = await session.scalars(query)
-    return [await process_feedback(feedback, session) for feedback in feedbacks]
+
+    return await process_feedbacks(feedbacks.all(), session)
 
 
 async def get_user_tender_feedbacks(tender_id: UUID4, user_id: UUID4, limit: int, offset: int, session: AsyncSession):
-    query = select(Bid).where(Bid.tender_id == tender_id)
-    bids = await session.scalars(query)
-    feedbacks = []
-    for bid in bids:
-        feedbacks += await get_user_bid_feedbacks(bid.id, user_id, session)
+    query = (
+        select(Feedback)
+        .join(Bid, Bid.id == Feedback.bid_id)
+        .where(Bid.tender_id == tender_id, Feedback.creator_id == user_id)
+    )
+    feedbacks = await session.scalars(query)
+    feedbacks = await process_feedbacks(feedbacks.all(), session)
     feedbacks.sort(key=lambda x: x.description)
 
     return feedbacks[offset : (offset + limit)]
 
 
-async def put_bid_decision(bid_id: UUID4, decision: Decision, session: AsyncSession):
+def select_approved_bid(bid_id: UUID4) -> Select:
+    """
+    Build one statement that counts an approval of the bid and, once the quorum of the tender organization is reached,
+    cancels the bid and closes the tender instead. The bid is locked by the update itself, so concurrent approvals
+    are applied one after another to the latest counter, and approvals of a canceled bid change nothing.
+    """
+    quorum = (
+        select(Bid.id.label("bid_id"), func.least(3, func.count(OrganizationResponsible.user_id)).label("value"))
+        .join(Tender, Tender.id == Bid.tender_id)
+        .outerjoin(OrganizationResponsible, OrganizationResponsible.organization_id == Tender.organization_id)
+        .where(Bid.id == bid_id)
+        .group_by(Bid.id)
+        .cte("quorum")
+    )
+    quorum_reached = Bid.approved_num + 1 >= quorum.c.value
+    approved_bid = (
+        update(Bid)
+        .where(Bid.id == quorum.c.bid_id, Bid.status != BidStatus.CANCELED)
+        .values(
+            approved_num=case((quorum_reached, Bid.approved_num), else_=Bid.approved_num + 1),
+            status=case((quorum_reached, literal(BidStatus.CANCELED, Bid.status.type)), else_=Bid.status),
+        )
+        .returning(*Bid.__table__.c, (Bid.status == BidStatus.CANCELED).label("quorum_reached"))
+        .cte("approved_bid")
+    )
+    closed_tender = (
+        update(Tender)
+        .where(Tender.id == approved_bid.c.tender_id, approved_bid.c.quorum_reached)
+        .values(status=TenderStatus.CLOSED)
+        .returning(Tender.id)
+        .cte("closed_tender")
+    )
+
+    bid_history = aliased(BidHistory)
+
+    return (
+        select(aliased(Bid, approved_bid), bid_history, closed_tender.c.id)
+        .join(bid_history, bid_history.bid_id == approved_bid.c.id)
+        .outerjoin(closed_tender, closed_tender.c.id == approved_bid.c.tender_id)
+        .where(is_latest_version(bid_history))
+        .execution_options(populate_existing=True)
+    )
+
+
+async def put_bid_decision(bid_id: UUID4, decision: Decision, session: AsyncSession) -> SchemaBid:
     if decision == Decision.REJECTED:
         query = update(Bid).where(Bid.id == bid_id).values(status=BidStatus.CANCELED)
-        await session.execute(query)
-        await session.commit()
+        bid, bid_history = (await session.execute(select_updated_bid(query))).one()
     else:
-        bid_query = select(Bid).where(Bid.id == bid_id)
-        bid = await session.scalar(bid_query)
-        tender = await get_tender_by_id(bid.tender_id, session)
-        quorum = await get_quorum(tender.organization_id, session)
-        if bid.approved_num + 1 >= min(3, quorum):
-            query = update(Bid).where(Bid.id == bid_id).values(status=BidStatus.CANCELED)
-            await session.execute(query)
-            query = update(Tender).where(Tender.id == tender.id).values(status=TenderStatus.CLOSED)
-            await session.execute(query)
-            await session.commit()
-        else:
-            query = update(Bid).where(Bid.id == bid_id).values(approved_num=bid.approved_num + 1)
-            await session.execute(query)
-            await session.commit()
+        approved = (await session.execute(select_approved_bid(bid_id))).one_or_none()
+        if approved is None:
+            get_request_context(session).forget(Bid.id, bid_id)
+            return await get_bid_by_id(bid_id, session)
+        bid, bid_history, closed_tender_id = approved
+        if closed_tender_id is not None:
+            get_request_context(session).forget(Tender.id, closed_tender_id)
+    await session.commit()
+
+    return remember_bid(bid, bid_history, session)
@@ -1,35 +1,37 @@
-from sqlalchemy import select
+from pydantic import UUID4
+from sqlalchemy import ColumnElement, Row, exists
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from tenders.db.models import BidHistory
-from tenders.schemas.bid import Bid as SchemaBid
-
-
-async def add_new_version(
-    bid: SchemaBid,
-    name: str,
-    description: str,
-    session: AsyncSession,
-):
-    if name is None:
-        name = bid.name
-    if description is None:
-        description = bid.description
-    bid_history = BidHistory(
-        bid_id=bid.id,
-        name=name,
-        description=description,
-        history_number=bid.version + 1,
-    )
-    session.add(bid_history)
-    await session.commit()
-
-
-async def rollback_version(
-    bid: SchemaBid,
-    version: int,
-    session: AsyncSession,
-):
-    query = select(BidHistory).where(BidHistory.bid_id == bid.id, BidHistory.history_number == version)
-    bid_history = await session.scalar(query)
-    await add_new_version(bid, bid_history.name, bid_history.description, session)
+from tenders.db.models import Bid, BidHistory
+from tenders.utils.common import LatestVersionLoader, append_version, get_latest_version_loader
+
+
+async def add_new_version(bid_id: UUID4, name: str, description: str, session: AsyncSession) -> Row | None:
+    values = {"name": name, "description": description}
+    values = {key: value for key, value in values.items() if value is not None}
+
+    return await append_bid_version(bid_id, values, session)
+
+
+async def rollback_version(bid_id: UUID4, version: int, session: AsyncSession) -> Row | None:
+    return await append_bid_version(bid_id, {}, session, version)
+
+
+async def append_bid_version(
+    bid_id: UUID4, values: dict, session: AsyncSession, version: int | None = None
+) -> Row | None:
+    row = await append_version(Bid, BidHistory.bid_id, bid_id, values, session, version)
+    if row is not None:
+        get_versions_loader(session).prime(bid_id, row[1])
+
+    return row
+
+
+def get_versions_loader(session: AsyncSession) -> LatestVersionLoader:
+    return get_latest_version_loader(BidHistory.bid_id, session)
+
+
+def is_latest_version(history: type[BidHistory]) -> ColumnElement[bool]:
+    newer = aliased(BidHistory)
+    return ~exists().where(newer.bid_id == history.bid_id, newer.history_number > history.history_number)
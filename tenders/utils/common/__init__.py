@@ -1,6 +1,98 @@
+from .admin import ADMIN_TOKEN_HEADER, get_admin_token, is_admin_token
+from .bulk import equals_any
+from .cache import TTLCache
+from .context import RequestContext, get_latest_version_loader, get_request_context
+from .creation import insert_with_first_version
+from .etag import (
+    check_page_not_modified,
+    make_etag,
+    make_fingerprint,
+    make_items_etag,
+    respond_with_etag,
+    set_cache_headers,
+)
+from .export import NDJSON_MEDIA_TYPE, stream_ndjson
 from .hostname import get_hostname
+from .instrumentation import QueryStats, QueryStatsMiddleware, count_queries, instrument_engine
+from .loader import LatestVersionLoader
+from .metrics import (
+    METRICS_MEDIA_TYPE,
+    REQUEST_METRICS,
+    MetricsMiddleware,
+    MetricsWriter,
+    RequestMetrics,
+    write_cache_metrics,
+    write_pool_metrics,
+    write_request_metrics,
+)
+from .pagination import Cursor, decode_cursor, encode_cursor, make_page
+from .profiling import PROFILE_FORMATS, PROFILE_HEADER, PROFILE_ID_HEADER, Profile, ProfilingMiddleware, get_profiles
+from .search import escape_like, has_extension, make_search_query, rank_by_search
+from .serialization import FastJSONResponse, dump_json, is_fast_serialization_enabled, respond_fast
+from .slow_queries import SlowQueryLog, SlowQueryRouteMiddleware, get_slow_query_log
+from .versioning import (
+    VersionConflictError,
+    append_version,
+    select_appended_version,
+    select_updated_with_latest_version,
+)
 
 
 __all__ = [
+    "ADMIN_TOKEN_HEADER",
+    "METRICS_MEDIA_TYPE",
+    "NDJSON_MEDIA_TYPE",
+    "PROFILE_FORMATS",
+    "PROFILE_HEADER",
+    "PROFILE_ID_HEADER",
+    "REQUEST_METRICS",
+    "append_version",
+    "check_page_not_modified",
+    "count_queries",
+    "Cursor",
+    "decode_cursor",
+    "dump_json",
+    "encode_cursor",
+    "equals_any",
+    "escape_like",
+    "FastJSONResponse",
+    "get_admin_token",
     "get_hostname",
+    "get_latest_version_loader",
+    "get_profiles",
+    "get_request_context",
+    "get_slow_query_log",
+    "has_extension",
+    "insert_with_first_version",
+    "is_admin_token",
+    "instrument_engine",
+    "is_fast_serialization_enabled",
+    "LatestVersionLoader",
+    "make_etag",
+    "make_fingerprint",
+    "make_items_etag",
+    "make_page",
+    "make_search_query",
+    "MetricsMiddleware",
+    "MetricsWriter",
+    "Profile",
+    "ProfilingMiddleware",
+    "QueryStats",
+    "QueryStatsMiddleware",
+    "rank_by_search",
+    "RequestContext",
+    "RequestMetrics",
+    "respond_fast",
+    "respond_with_etag",
+    "select_appended_version",
+    "select_updated_with_latest_version",
+    "set_cache_headers",
+    "SlowQueryLog",
+    "SlowQueryRouteMiddleware",
+    "stream_ndjson",
+    "TTLCache",
+    "VersionConflictError",
+    "write_cache_metrics",
+    "write_pool_metrics",
+    "write_request_metrics",
 ]
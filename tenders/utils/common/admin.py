@@ -0,0 +1,20 @@
+from functools import cache
+from hmac import compare_digest
+
+from tenders.config import get_settings
+
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+@cache
+def get_admin_token() -> str:
+    return get_settings().ADMIN_TOKEN
+
+
+def is_admin_token(token: str | None) -> bool:
+    expected = get_admin_token()
+    if not expected or token is None:
+        return False
+
+    return compare_digest(token.encode(), expected.encode())
@@ -0,0 +1,13 @@
+from typing import Iterable
+
+from sqlalchemy import ColumnElement, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def equals_any(column: InstrumentedAttribute, values: Iterable) -> ColumnElement[bool]:
+    """
+    `column = ANY(:values)` with the values bound as one array: unlike IN, the statement has a single
+    parameter however many values there are, so bulk requests do not run into the limit of 32767 parameters.
+    """
+    return column == any_(literal(list(values), ARRAY(column.type)))
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """
+    Bounded in-process cache: the least recently used entry is evicted when the cache is full,
+    entries older than `ttl` seconds are treated as missing. `on_drop` is called with the key and the value
+    of every entry that is evicted, expires or is invalidated.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = monotonic,
+        on_drop: Callable[[Hashable, Any], None] | None = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.on_drop = on_drop
+        self.entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable, default: Any = None, count_miss: bool = True) -> Any:
+        entry = self.entries.get(key)
+        if entry is None or entry[0] <= self.clock():
+            self.invalidate(key)
+            self.misses += count_miss
+            return default
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.entries[key] = (self.clock() + self.ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.drop(*self.entries.popitem(last=False))
+
+    def invalidate(self, key: Hashable) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.drop(key, entry)
+
+    def drop(self, key: Hashable, entry: tuple[float, Any]) -> None:
+        if self.on_drop is not None:
+            self.on_drop(key, entry[1])
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self.entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,55 @@
+from typing import Any, Hashable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from .loader import LatestVersionLoader
+
+
+class RequestContext:
+    """
+    Request-scoped identity map attached to the session.
+
+    Entities are memoized by the column they were looked up by, including misses,
+    so that validation and the handler itself do not read the same rows twice.
+    Whoever changes an entity within the request must `forget` it.
+    """
+
+    def __init__(self) -> None:
+        self.entities: dict[tuple[str, str, Hashable], Any] = {}
+        self.loaders: dict[str, LatestVersionLoader] = {}
+        self.user_organizations: dict[UUID, frozenset[UUID]] = {}
+
+    @staticmethod
+    def make_key(column: InstrumentedAttribute, value: Hashable) -> tuple[str, str, Hashable]:
+        return column.class_.__tablename__, column.key, value
+
+    def get(self, column: InstrumentedAttribute, value: Hashable, default: Any = None) -> Any:
+        return self.entities.get(self.make_key(column, value), default)
+
+    def set(self, column: InstrumentedAttribute, value: Hashable, entity: Any) -> None:
+        self.entities[self.make_key(column, value)] = entity
+
+    async def load(self, column: InstrumentedAttribute, value: Hashable, session: AsyncSession) -> Any:
+        key = self.make_key(column, value)
+        if key not in self.entities:
+            self.entities[key] = await session.scalar(select(column.class_).where(column == value))
+
+        return self.entities[key]
+
+    def forget(self, column: InstrumentedAttribute, value: Hashable) -> None:
+        self.entities.pop(self.make_key(column, value), None)
+
+
+def get_request_context(session: AsyncSession) -> RequestContext:
+    return session.info.setdefault("request_context", RequestContext())
+
+
+def get_latest_version_loader(key: InstrumentedAttribute, session: AsyncSession) -> LatestVersionLoader:
+    loaders = get_request_context(session).loaders
+    if key.key not in loaders:
+        loaders[key.key] = LatestVersionLoader(key, session)
+
+    return loaders[key.key]
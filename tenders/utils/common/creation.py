@@ -0,0 +1,25 @@
+from typing import Any
+
+from sqlalchemy import Select, insert, select
+from sqlalchemy.orm import InstrumentedAttribute, aliased
+
+
+def insert_with_first_version(
+    model: type, values: dict[str, Any], history_key: InstrumentedAttribute, history_values: dict[str, Any]
+) -> Select:
+    """
+    Build one statement that inserts an entity together with its first history row
+    and selects both of them back as ORM objects.
+    """
+    history_model = history_key.class_
+    new_entity = insert(model).values(values).returning(*model.__table__.c).cte(f"new_{model.__tablename__}")
+    new_history = (
+        insert(history_model)
+        .values({history_key.key: select(new_entity.c.id).scalar_subquery(), "history_number": 1, **history_values})
+        .returning(*history_model.__table__.c)
+        .cte(f"new_{history_model.__tablename__}")
+    )
+
+    return select(aliased(model, new_entity), aliased(history_model, new_history)).where(
+        new_history.c[history_key.key] == new_entity.c.id
+    )
@@ -0,0 +1,100 @@
+from functools import cache
+from hashlib import blake2b
+from typing import Any, Iterable
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from starlette import status as http_status
+from starlette.requests import Request
+from starlette.responses import Response
+
+from tenders.config import get_settings
+
+
+def make_fingerprint(entity_id: Any, status: Any, version: int | None = None) -> str:
+    """
+    Identify the state of an entity as seen by clients: history rows are immutable,
+    so an id, a status and a version number determine the whole representation.
+    """
+    parts = [str(entity_id), status.name]
+    if version is not None:
+        parts.append(str(version))
+
+    return ":".join(parts)
+
+
+def make_etag(fingerprints: Iterable[str]) -> str:
+    digest = blake2b(",".join(sorted(fingerprints)).encode(), digest_size=16).hexdigest()
+
+    return f'"{digest}"'
+
+
+def make_items_etag(items: Iterable[Any]) -> str:
+    return make_etag(make_fingerprint(item.id, item.status, item.version) for item in items)
+
+
+def select_page_fingerprints(
+    query: Select, entity_id: InstrumentedAttribute, status: InstrumentedAttribute, version: InstrumentedAttribute
+) -> Select:
+    """
+    Build one aggregate over a page query that joins the fingerprints of its rows,
+    so that a page can be revalidated without loading and serializing it.
+    """
+    fingerprints = query.with_only_columns(func.concat_ws(":", entity_id, status, version).label("fingerprint"))
+    fingerprints = fingerprints.subquery()
+
+    return select(func.string_agg(fingerprints.c.fingerprint, ","))
+
+
+def get_if_none_match(request: Request) -> set[str] | None:
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return None
+
+    return {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    tags = get_if_none_match(request)
+
+    return tags is not None and ("*" in tags or etag in tags)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers=make_cache_headers(etag))
+
+
+@cache
+def get_cache_control() -> str:
+    return get_settings().HTTP_CACHE_CONTROL
+
+
+def make_cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": get_cache_control()}
+
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    response.headers.update(make_cache_headers(etag))
+
+
+def respond_with_etag(request: Request, response: Response, etag: str, content: Any) -> Any:
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag)
+
+    return content
+
+
+async def check_page_not_modified(
+    request: Request, query: Select, columns: tuple[InstrumentedAttribute, ...], session: AsyncSession
+) -> Response | None:
+    """
+    Answer a conditional request for a page with 304 if its fingerprints did not change.
+    """
+    if get_if_none_match(request) is None:
+        return None
+    fingerprints = await session.scalar(select_page_fingerprints(query, *columns))
+    etag = make_etag(fingerprints.split(",") if fingerprints else [])
+
+    return not_modified(etag) if is_not_modified(request, etag) else None
@@ -0,0 +1,28 @@
+from typing import Any, AsyncIterator, Callable
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from .serialization import dump_json
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def stream_ndjson(
+    session_maker: async_sessionmaker, query: Select, make_item: Callable[..., Any], batch_size: int
+) -> AsyncIterator[bytes]:
+    """
+    Stream the rows of `query` from a server-side cursor as NDJSON, one chunk per `batch_size` rows.
+
+    The session is opened here, since dependencies are closed before a streamed body is sent.
+    When the client disconnects, the streaming task is cancelled, and leaving the block
+    closes the cursor and returns the connection to the pool.
+    """
+    async with session_maker() as session:
+        result = await session.stream(query.execution_options(yield_per=batch_size))
+        try:
+            async for rows in result.partitions():
+                yield b"".join(dump_json(make_item(*row)) + b"\n" for row in rows)
+        finally:
+            await result.close()
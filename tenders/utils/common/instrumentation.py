@@ -0,0 +1,87 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+QUERIES_HEADER = "X-DB-Queries"
+TIME_HEADER = "X-DB-Time"
+ROWS_HEADER = "X-DB-Rows"
+
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    time: float = 0.0
+    rows: int = 0
+
+    def headers(self) -> list[tuple[bytes, bytes]]:
+        return [
+            (QUERIES_HEADER.lower().encode(), str(self.queries).encode()),
+            (TIME_HEADER.lower().encode(), f"{self.time * 1000:.3f}".encode()),
+            (ROWS_HEADER.lower().encode(), str(self.rows).encode()),
+        ]
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """
+    Count the statements executed by the current task and the tasks it starts inside the block.
+    """
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+def before_cursor_execute(conn, cursor, statement: str, parameters: Any, context, executemany: bool) -> None:
+    context.started_at = perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement: str, parameters: Any, context, executemany: bool) -> None:
+    stats = current_query_stats.get()
+    if stats is None:
+        return
+    stats.queries += 1
+    stats.time += perf_counter() - context.started_at
+    if cursor.description is not None and cursor.rowcount > 0:
+        stats.rows += cursor.rowcount
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """
+    Count the statements, the time spent in the database and the rows fetched while serving each request,
+    and report them in the response headers. Statements of a streamed body run after the headers are sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = [*message.get("headers", []), *stats.headers()]
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
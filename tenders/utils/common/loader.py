@@ -0,0 +1,47 @@
+from typing import Any, Iterable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+class LatestVersionLoader:
+    """
+    DataLoader-like resolver of the latest history rows of entities (tenders, bids, feedbacks).
+
+    All requested keys are resolved with one DISTINCT ON query, results are memoized
+    for the lifetime of the session, which is the lifetime of the request.
+    """
+
+    def __init__(self, key: InstrumentedAttribute, session: AsyncSession) -> None:
+        self.key = key
+        self.model = key.class_
+        self.session = session
+        self.cache: dict[UUID, Any] = {}
+
+    async def load(self, entity_id: UUID) -> Any | None:
+        versions = await self.load_many([entity_id])
+
+        return versions.get(entity_id)
+
+    async def load_many(self, entity_ids: Iterable[UUID]) -> dict[UUID, Any]:
+        entity_ids = list(entity_ids)
+        missing = {entity_id for entity_id in entity_ids if entity_id not in self.cache}
+        if missing:
+            query = (
+                select(self.model)
+                .where(self.key.in_(missing))
+                .distinct(self.key)
+                .order_by(self.key, self.model.history_number.desc())
+            )
+            for history in await self.session.scalars(query):
+                self.cache[getattr(history, self.key.key)] = history
+
+        return {entity_id: self.cache[entity_id] for entity_id in entity_ids if entity_id in self.cache}
+
+    def prime(self, entity_id: UUID, history: Any) -> None:
+        self.cache[entity_id] = history
+
+    def clear(self, entity_id: UUID) -> None:
+        self.cache.pop(entity_id, None)
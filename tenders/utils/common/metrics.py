@@ -0,0 +1,189 @@
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import accumulate
+from operator import attrgetter
+from time import perf_counter
+from typing import Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .cache import TTLCache
+
+
+METRICS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """
+    Latency histogram with fixed buckets. Observations are counted in their own bucket only,
+    the buckets are accumulated when the histogram is rendered.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class RequestMetrics:
+    """
+    Per-process request counters, updated from the event loop only and therefore without locks.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.in_flight = 0
+        self.requests: defaultdict[tuple[str, str, int], int] = defaultdict(int)
+        self.latency: dict[tuple[str, str], Histogram] = {}
+
+    def observe(self, method: str, route: str, status_code: int, duration: float) -> None:
+        self.requests[method, route, status_code] += 1
+        histogram = self.latency.get((method, route))
+        if histogram is None:
+            histogram = self.latency[method, route] = Histogram(self.buckets)
+        histogram.observe(duration)
+
+    def clear(self) -> None:
+        self.in_flight = 0
+        self.requests.clear()
+        self.latency.clear()
+
+
+REQUEST_METRICS = RequestMetrics()
+
+
+class MetricsMiddleware:
+    """
+    Count requests by route template, method and status code and observe their latency up to the end of the body.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = REQUEST_METRICS) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self.metrics.in_flight += 1
+        started_at = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.metrics.in_flight -= 1
+            route = scope.get("route")
+            self.metrics.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status_code,
+                perf_counter() - started_at,
+            )
+
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def escape_label(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(**labels: object) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in labels.items()) + "}"
+
+
+class MetricsWriter:
+    """
+    Collects metric families in the Prometheus text exposition format.
+    """
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def family(self, name: str, kind: str, description: str) -> None:
+        self.lines.append(f"# HELP {name} {description}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value: float, labels: str = "") -> None:
+        """
+        Adds a sample with labels formatted by `format_labels`.
+        """
+        self.lines.append(f"{name}{labels} {format_value(value)}")
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def write_request_metrics(writer: MetricsWriter, metrics: RequestMetrics) -> None:
+    writer.family("tenders_http_requests_in_flight", "gauge", "Requests being served.")
+    writer.sample("tenders_http_requests_in_flight", metrics.in_flight)
+
+    writer.family("tenders_http_requests_total", "counter", "Served requests by route template and status code.")
+    for (method, route, status_code), count in sorted(metrics.requests.items()):
+        writer.sample(
+            "tenders_http_requests_total", count, format_labels(method=method, route=route, status=status_code)
+        )
+
+    writer.family("tenders_http_request_duration_seconds", "histogram", "Time to serve a request, body included.")
+    bounds = [format_labels(le=bound)[1:] for bound in (*map(format_value, metrics.buckets), "+Inf")]
+    for (method, route), histogram in sorted(metrics.latency.items()):
+        labels = format_labels(method=method, route=route)
+        for bound, count in zip(bounds, accumulate(histogram.counts)):
+            writer.sample("tenders_http_request_duration_seconds_bucket", count, f"{labels[:-1]},{bound}")
+        writer.sample("tenders_http_request_duration_seconds_sum", histogram.sum, labels)
+        writer.sample("tenders_http_request_duration_seconds_count", sum(histogram.counts), labels)
+
+
+def write_pool_metrics(writer: MetricsWriter, pools: dict[str, object]) -> None:
+    """
+    Connections of the SQLAlchemy queue pools by engine name. Overflow is negative
+    while the pool has not opened all of its `pool_size` connections yet.
+    """
+    gauges = [
+        ("tenders_db_pool_size", "Configured size of the connection pool.", "size"),
+        ("tenders_db_pool_checked_out", "Connections in use.", "checkedout"),
+        ("tenders_db_pool_idle", "Open connections waiting in the pool.", "checkedin"),
+        ("tenders_db_pool_overflow", "Connections opened beyond the pool size.", "overflow"),
+    ]
+    for name, description, method in gauges:
+        writer.family(name, "gauge", description)
+        for engine, pool in pools.items():
+            if hasattr(pool, method):
+                writer.sample(name, getattr(pool, method)(), format_labels(engine=engine))
+
+
+def write_cache_metrics(writer: MetricsWriter, caches: Iterable[tuple[str, TTLCache]]) -> None:
+    caches = list(caches)
+    families = [
+        ("tenders_cache_hits_total", "counter", "Lookups that found a fresh entry.", attrgetter("hits")),
+        ("tenders_cache_misses_total", "counter", "Lookups that found no fresh entry.", attrgetter("misses")),
+        ("tenders_cache_entries", "gauge", "Entries held, expired ones included.", len),
+        ("tenders_cache_hit_ratio", "gauge", "Share of lookups that were hits since start.", cache_hit_ratio),
+    ]
+    for name, kind, description, value in families:
+        writer.family(name, kind, description)
+        for cache_name, cache in caches:
+            writer.sample(name, value(cache), format_labels(cache=cache_name))
+
+
+def cache_hit_ratio(cache: TTLCache) -> float:
+    lookups = cache.hits + cache.misses
+    return cache.hits / lookups if lookups else 0.0
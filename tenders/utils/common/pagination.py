@@ -0,0 +1,43 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from typing import Protocol
+from uuid import UUID
+
+from tenders.schemas.pagination import CursorPage
+
+
+Cursor = tuple[str, UUID]
+
+
+class Named(Protocol):
+    id: UUID
+    name: str
+
+
+def encode_cursor(name: str, entity_id: UUID) -> str:
+    return urlsafe_b64encode(json.dumps([name, str(entity_id)]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Cursor | None:
+    """
+    Decode (name, id) of the last seen item. An empty cursor means the first page.
+    """
+    if not cursor:
+        return None
+    try:
+        name, entity_id = json.loads(urlsafe_b64decode(cursor.encode()))
+        return str(name), UUID(entity_id)
+    except (BinasciiError, TypeError, ValueError) as error:
+        raise ValueError("invalid cursor") from error
+
+
+def make_page(items: list[Named], limit: int) -> CursorPage:
+    """
+    Build a page from `limit + 1` fetched items: the extra item only signals that there is a next page.
+    """
+    if len(items) <= limit:
+        return CursorPage(items=items)
+    items = items[:limit]
+
+    return CursorPage(items=items, next_cursor=encode_cursor(items[-1].name, items[-1].id) if items else None)
@@ -0,0 +1,170 @@
+import sys
+from asyncio import to_thread
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import cache
+from threading import Event, Thread, get_ident
+from time import perf_counter
+from types import CodeType, FrameType
+from urllib.parse import parse_qsl
+from uuid import uuid4
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .admin import ADMIN_TOKEN_HEADER, is_admin_token
+from .cache import TTLCache
+from tenders.config import get_settings
+
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_FLAG = "profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_FORMATS = ("collapsed", "speedscope")
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+StackFrame = tuple[str, str, int]
+
+
+@dataclass
+class Profile:
+    route: str
+    interval: float
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    duration: float = 0.0
+    stacks: Counter[tuple[StackFrame, ...]] = field(default_factory=Counter)
+
+    def collapsed(self) -> str:
+        """
+        One line per distinct stack, from the root to the leaf, with the number of samples:
+        the input of flamegraph.pl and speedscope.
+        """
+        return "".join(
+            ";".join(f"{name} ({filename}:{line})" for name, filename, line in stack) + f" {count}\n"
+            for stack, count in self.stacks.most_common()
+        )
+
+    def speedscope(self) -> dict:
+        frames: dict[StackFrame, int] = {}
+        samples = [[frames.setdefault(frame, len(frames)) for frame in stack] for stack in self.stacks]
+        weights = [count * self.interval for count in self.stacks.values()]
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": self.route,
+            "exporter": "tenders",
+            "shared": {"frames": [{"name": name, "file": filename, "line": line} for name, filename, line in frames]},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": self.route,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+
+class StackSampler(Thread):
+    """
+    Samples the stack of the thread `thread_id` every `interval` seconds until it is stopped.
+
+    The event loop serves other requests concurrently, so their frames get into the samples too.
+    At least one sample is taken, even if the sampler is stopped before it starts.
+    """
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        super().__init__(name="stack-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[tuple[StackFrame, ...]] = Counter()
+        self.frames: dict[CodeType, StackFrame] = {}
+        self.stopped = Event()
+
+    def run(self) -> None:
+        while True:
+            frame = sys._current_frames().get(self.thread_id)  # noqa
+            if frame is not None:
+                self.stacks[self.get_stack(frame)] += 1
+            if self.stopped.wait(self.interval):
+                return
+
+    def get_stack(self, frame: FrameType | None) -> tuple[StackFrame, ...]:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            if code not in self.frames:
+                self.frames[code] = (code.co_qualname, code.co_filename, code.co_firstlineno)
+            stack.append(self.frames[code])
+            frame = frame.f_back
+
+        return tuple(reversed(stack))
+
+    async def stop(self) -> None:
+        # a sample in progress may take a while on a deep stack, so the event loop does not wait for it
+        self.stopped.set()
+        await to_thread(self.join)
+
+
+def is_profile_requested(scope: Scope) -> bool:
+    if any(name == PROFILE_HEADER.lower().encode() for name, _ in scope["headers"]):
+        return True
+    query = scope.get("query_string", b"")
+
+    return PROFILE_QUERY_FLAG.encode() in query and any(
+        name == PROFILE_QUERY_FLAG for name, _ in parse_qsl(query.decode("latin-1"), keep_blank_values=True)
+    )
+
+
+class ProfilingMiddleware:
+    """
+    Profile the requests that ask for it with the X-Profile header or the `profile` query flag
+    and carry the admin token. The profile is stored in `profiles` under the id sent in X-Profile-Id.
+    Other requests only pay for looking at their headers and query string.
+    """
+
+    def __init__(self, app: ASGIApp, interval: float, profiles: TTLCache) -> None:
+        self.app = app
+        self.interval = interval
+        self.profiles = profiles
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not is_profile_requested(scope):
+            await self.app(scope, receive, send)
+            return
+        if not is_admin_token(Headers(scope=scope).get(ADMIN_TOKEN_HEADER)):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid4().hex
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (PROFILE_ID_HEADER.lower().encode(), profile_id.encode()),
+                ]
+            await send(message)
+
+        profile = Profile(route=f"{scope['method']} {scope['path']}", interval=self.interval)
+        sampler = StackSampler(get_ident(), self.interval)
+        started_at = perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            await sampler.stop()
+            profile.duration = perf_counter() - started_at
+            profile.stacks = sampler.stacks
+            self.profiles.set(profile_id, profile)
+
+
+@cache
+def get_profiles() -> TTLCache:
+    settings = get_settings()
+
+    return TTLCache(settings.PROFILING_STORE_SIZE, settings.PROFILING_STORE_TTL)
@@ -0,0 +1,50 @@
+from functools import reduce
+
+from sqlalchemy import ColumnElement, Select, column, exists, func, select, table
+from sqlalchemy.dialects.postgresql import TSQUERY, websearch_to_tsquery
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from .cache import TTLCache
+from tenders.db.search import SEARCH_CONFIGS
+
+
+pg_extension = table("pg_extension", column("extname"))
+
+# Extensions are installed by migrations, which may skip the optional ones if the server does not provide them.
+INSTALLED_EXTENSIONS = TTLCache(maxsize=16, ttl=300)
+
+
+def make_search_query(text: str) -> ColumnElement:
+    """
+    Parse `text` with the web search syntax (quotes, "or", "-") in every search configuration
+    and match any of them, so that words are found by their Russian and English stems alike.
+    """
+    queries = [websearch_to_tsquery(config, text) for config in SEARCH_CONFIGS]
+
+    return reduce(lambda left, right: left.op("||", return_type=TSQUERY)(right), queries)
+
+
+def rank_by_search(
+    query: Select, search_vector: InstrumentedAttribute, key: InstrumentedAttribute, text: str, limit: int, offset: int
+) -> Select:
+    """
+    Keep the rows of `query` whose `search_vector` matches `text` and page them from the most relevant one.
+    """
+    search_query = make_search_query(text)
+    rank = func.ts_rank_cd(search_vector, search_query)
+
+    return query.where(search_vector.bool_op("@@")(search_query)).order_by(rank.desc(), key).offset(offset).limit(limit)
+
+
+async def has_extension(name: str, session: AsyncSession) -> bool:
+    installed = INSTALLED_EXTENSIONS.get(name)
+    if installed is None:
+        installed = await session.scalar(select(exists().where(pg_extension.c.extname == name)))
+        INSTALLED_EXTENSIONS.set(name, installed)
+
+    return installed
+
+
+def escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,57 @@
+from functools import cache
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.responses import Response
+
+from tenders.config import get_settings
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+@cache
+def is_fast_serialization_enabled() -> bool:
+    return get_settings().FAST_SERIALIZATION
+
+
+def encode_default(value: Any) -> Any:
+    """
+    Encode what orjson does not know natively: schemas, including constructed ones,
+    and UUID subclasses such as the one asyncpg returns.
+    """
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dump_json(content: Any) -> bytes:
+    if orjson is None:
+        return to_json(content)
+
+    return orjson.dumps(content, default=encode_default)
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+def respond_fast(response: Response, content: Any) -> Any:
+    """
+    Return `content` for FastAPI to validate against `response_model` and encode, or, on the fast path,
+    encode it right away: a returned response is sent as is, keeping the headers set on `response`.
+    """
+    if not is_fast_serialization_enabled():
+        return content
+
+    return FastJSONResponse(content, headers=response.headers)
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import re
+from collections import deque
+from contextvars import Context, ContextVar
+from datetime import datetime, timezone
+from functools import cache
+from random import random
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from tenders.config import get_settings
+
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_MAX_LENGTH = 10_000
+QUOTED_CONSTANT = re.compile(r"'(?:[^']|'')*'")
+# the conditions of the plan nodes, e.g. "Index Cond: (id = 42)" or "Filter: (approved_num >= 3)"
+CONDITION = re.compile(r"^(.*(?:Cond|Filter): )(.*)$", re.MULTILINE)
+NUMERIC_CONSTANT = re.compile(r"(?<![\w$.])\d+(?:\.\d+)?(?![\w.])")
+
+current_scope: ContextVar[Scope | None] = ContextVar("current_scope", default=None)
+
+
+def redact_parameters(parameters: Any, executemany: bool) -> list[str]:
+    """
+    Keep only the types of the bound parameters, and of the first row for executemany.
+    """
+    if executemany:
+        return [f"{len(parameters)} rows", *redact_parameters(parameters[0] if parameters else (), False)]
+    if isinstance(parameters, dict):
+        return [f"{key}: {type(value).__name__}" for key, value in parameters.items()]
+
+    return [type(value).__name__ for value in parameters or ()]
+
+
+def redact_plan(plan: str) -> str:
+    """
+    The plan shows the values of the parameters as constants: mask the quoted ones, such as strings,
+    identifiers and dates, and the numbers in the conditions of the nodes.
+    """
+    plan = QUOTED_CONSTANT.sub("'?'", plan)
+
+    return CONDITION.sub(lambda match: match[1] + NUMERIC_CONSTANT.sub("?", match[2]), plan)
+
+
+def is_read_only(context: Any) -> bool:
+    """
+    Whether the statement only reads and can be explained in a read-only transaction: neither INSERT, UPDATE
+    or DELETE, nor a SELECT with data-modifying CTEs. Textual statements are not parsed and are not explained.
+    """
+    compiled = context.compiled
+    if compiled is None or context.isinsert or context.isupdate or context.isdelete:
+        return False
+
+    return compiled.statement.is_select and not any(cte.element.is_dml for cte in compiled.ctes or ())
+
+
+def get_route(scope: Scope | None) -> str | None:
+    if scope is None:
+        return None
+    route = scope.get("route")
+
+    return f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+
+class SlowQueryLog:
+    """
+    Logs the statements that ran longer than `threshold` seconds and keeps the last `size` of them.
+
+    A sampled share of the slow read-only statements is run again under EXPLAIN (ANALYZE, BUFFERS) in the background
+    on a separate connection, in a read-only transaction limited by `explain_timeout`.
+    At most one statement is explained at a time, so that a slow database is not loaded twice as much.
+    """
+
+    def __init__(self, threshold: float, size: int, explain_rate: float, explain_timeout: float) -> None:
+        self.threshold = threshold
+        self.explain_rate = explain_rate
+        self.explain_timeout = explain_timeout
+        self.entries: deque[dict] = deque(maxlen=size)
+        self.explains: set[asyncio.Task] = set()
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """
+        Listen to the statements of `engine`; their start time is set by `instrument_engine`.
+        """
+
+        def after_cursor_execute(conn, cursor, statement: str, parameters: Any, context, executemany: bool) -> None:
+            started_at = getattr(context, "started_at", None)
+            if started_at is None or not context.execution_options.get("slow_query_log", True):
+                return
+            duration = perf_counter() - started_at
+            if duration >= self.threshold:
+                self.record(engine, statement, parameters, executemany, duration, is_read_only(context))
+
+        event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+    def record(
+        self, engine: AsyncEngine, statement: str, parameters: Any, executemany: bool, duration: float, read_only: bool
+    ) -> None:
+        entry = {
+            "recorded_at": datetime.now(timezone.utc),
+            "duration": round(duration * 1000, 3),
+            "route": get_route(current_scope.get()),
+            "statement": statement[:STATEMENT_MAX_LENGTH],
+            "parameters": redact_parameters(parameters, executemany),
+            "plan": None,
+        }
+        self.entries.append(entry)
+        logger.warning(
+            "slow statement, %.1f ms in %s: %s; parameters: %s",
+            entry["duration"],
+            entry["route"],
+            entry["statement"],
+            entry["parameters"],
+        )
+
+        if self.should_explain(read_only, executemany):
+            # a new context, so that the explain is not counted in the stats of the request
+            task = asyncio.get_running_loop().create_task(
+                self.explain(engine, statement, parameters, entry), context=Context()
+            )
+            self.explains.add(task)
+            task.add_done_callback(self.explains.discard)
+
+    def should_explain(self, read_only: bool, executemany: bool) -> bool:
+        return read_only and not executemany and not self.explains and random() < self.explain_rate
+
+    async def explain(self, engine: AsyncEngine, statement: str, parameters: Any, entry: dict) -> None:
+        try:
+            async with engine.connect() as connection:
+                connection = await connection.execution_options(slow_query_log=False)
+                await connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+                await connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(self.explain_timeout * 1000)}")
+                result = await connection.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+                entry["plan"] = redact_plan("\n".join(row[0] for row in result))
+                await connection.rollback()
+        except Exception:  # noqa
+            logger.exception("could not explain the slow statement: %s", entry["statement"])
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+class SlowQueryRouteMiddleware:
+    """
+    Make the route of the request known to the statements it executes.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_scope.reset(token)
+
+
+@cache
+def get_slow_query_log() -> SlowQueryLog | None:
+    settings = get_settings()
+    if not settings.SLOW_QUERY_LOG_ENABLED:
+        return None
+
+    return SlowQueryLog(
+        settings.SLOW_QUERY_THRESHOLD,
+        settings.SLOW_QUERY_LOG_SIZE,
+        settings.SLOW_QUERY_EXPLAIN_RATE,
+        settings.SLOW_QUERY_EXPLAIN_TIMEOUT,
+    )
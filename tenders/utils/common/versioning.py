@@ -0,0 +1,116 @@
+from functools import cache
+from typing import Any, Callable
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Row, Select, Update, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, aliased
+
+from tenders.config import get_settings
+
+
+NOT_COPIED = {"id", "history_number", "created_at", "updated_at"}
+
+
+class VersionConflictError(Exception):
+    """
+    Concurrent edits kept taking the next version number of the same entity.
+    """
+
+
+def select_appended_version(
+    model: type, history_key: InstrumentedAttribute, entity_id: UUID, values: dict[str, Any], version: int | None = None
+) -> Select:
+    """
+    Build one statement that copies a history row (the latest one or `version`) as the next version,
+    overriding `values`, and selects the entity together with the new version back as ORM objects.
+
+    Generated columns are not copied but computed again for the new row.
+    The next number is taken from the table itself, and a concurrent append of the same number
+    is skipped by the unique (entity, history_number) index, so the statement returns no rows then.
+    """
+    history_model = history_key.class_
+    source = aliased(history_model)
+    latest = select(func.max(history_model.history_number)).where(history_key == entity_id).scalar_subquery()
+    columns = [
+        column
+        for column in history_model.__table__.c
+        if column.key not in NOT_COPIED | {history_key.key} and column.computed is None
+    ]
+    copied = select(
+        getattr(source, history_key.key),
+        *(
+            literal(values[column.key], column.type) if column.key in values else getattr(source, column.key)
+            for column in columns
+        ),
+        latest + 1,
+    ).where(
+        getattr(source, history_key.key) == entity_id,
+        source.history_number == (latest if version is None else version),
+    )
+    new_history = (
+        insert(history_model)
+        .from_select([history_key.key, *(column.key for column in columns), "history_number"], copied)
+        .on_conflict_do_nothing(index_elements=[history_key.key, "history_number"])
+        .returning(*history_model.__table__.c)
+        .cte(f"new_{history_model.__tablename__}")
+    )
+
+    return select(model, aliased(history_model, new_history)).join(
+        new_history, new_history.c[history_key.key] == model.id
+    )
+
+
+def select_updated_with_latest_version(
+    statement: Update, history_key: InstrumentedAttribute, is_latest: Callable[[type], ColumnElement[bool]]
+) -> Select:
+    """
+    Wrap an ORM UPDATE of entities into one statement that selects the updated entities back
+    together with their latest versions, refreshing the instances already loaded into the session.
+    """
+    model = statement.entity_description["entity"]
+    updated = statement.returning(*model.__table__.c).cte(f"updated_{model.__tablename__}")
+    history = aliased(history_key.class_)
+
+    return (
+        select(aliased(model, updated), history)
+        .join(history, getattr(history, history_key.key) == updated.c.id)
+        .where(is_latest(history))
+        .execution_options(populate_existing=True)
+    )
+
+
+@cache
+def get_version_append_attempts() -> int:
+    return get_settings().VERSION_APPEND_ATTEMPTS
+
+
+async def append_version(
+    model: type,
+    history_key: InstrumentedAttribute,
+    entity_id: UUID,
+    values: dict[str, Any],
+    session: AsyncSession,
+    version: int | None = None,
+) -> Row | None:
+    """
+    Append the next version and commit it, retrying while concurrent edits win the race for its number.
+    Return None if there is no `version` to copy.
+    """
+    query = select_appended_version(model, history_key, entity_id, values, version)
+    for _ in range(get_version_append_attempts()):
+        row = (await session.execute(query)).one_or_none()
+        if row is not None:
+            await session.commit()
+            return row
+        if version is not None and not await version_exists(history_key, entity_id, version, session):
+            return None
+
+    raise VersionConflictError(entity_id)
+
+
+async def version_exists(history_key: InstrumentedAttribute, entity_id: UUID, version: int, session: AsyncSession):
+    query = select(exists().where(history_key == entity_id, history_key.class_.history_number == version))
+
+    return await session.scalar(query)
@@ -3,32 +3,79 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tenders.db.models import Employee, OrganizationResponsible
+from tenders.utils.common import equals_any, get_request_context
+from tenders.utils.employee_cache import MISSING, get_employee_cache
+from tenders.utils.membership import get_membership_index
+
+
+async def get_user_organizations(user_id: UUID4, session: AsyncSession) -> frozenset[UUID4]:
+    memberships = get_request_context(session).user_organizations
+    if user_id in memberships:
+        return memberships[user_id]
+
+    index = get_membership_index()
+    organizations = index.get_organizations(user_id) if index is not None else None
+    if organizations is None:
+        query = select(OrganizationResponsible.organization_id).where(OrganizationResponsible.user_id == user_id)
+        organizations = frozenset(await session.scalars(query))
+        if index is not None:
+            index.set_organizations(user_id, organizations)
+    memberships[user_id] = organizations
+
+    return memberships[user_id]
 
 
 async def validate_employee_organisation(user_id: UUID4, organization_id: UUID4, session: AsyncSession) -> bool:
-    query = select(OrganizationResponsible).where(
-        OrganizationResponsible.organization_id == organization_id, OrganizationResponsible.user_id == user_id
+    return organization_id in await get_user_organizations(user_id, session)
+
+
+async def get_employees_by_usernames(usernames: set[str], session: AsyncSession) -> dict[str, Employee]:
+    if not usernames:
+        return {}
+    query = select(Employee).where(equals_any(Employee.username, usernames))
+    employees = await session.scalars(query)
+
+    return {employee.username: employee for employee in employees}
+
+
+async def get_memberships(user_ids: set[UUID4], session: AsyncSession) -> set[tuple[UUID4, UUID4]]:
+    if not user_ids:
+        return set()
+    query = select(OrganizationResponsible.user_id, OrganizationResponsible.organization_id).where(
+        equals_any(OrganizationResponsible.user_id, user_ids)
     )
-    result = await session.scalar(query)
+    rows = await session.execute(query)
 
-    return result is not None
+    return {(user_id, organization_id) for user_id, organization_id in rows}
+
+
+async def get_employee(key: str, value: str | UUID4, session: AsyncSession) -> Employee | None:
+    context = get_request_context(session)
+    if (user := context.get(getattr(Employee, key), value, MISSING)) is not MISSING:
+        return user
+
+    employees = get_employee_cache()
+    if employees is None or (user := employees.get(key, value)) is MISSING:
+        query = select(Employee).where(getattr(Employee, key) == value)
+        user = await session.scalar(query)
+        if employees is not None:
+            if user is not None:
+                session.expunge(user)
+            employees.set(key, value, user)
+    context.set(getattr(Employee, key), value, user)
+
+    return user
 
 
 async def get_employee_by_username(username: str, session: AsyncSession) -> Employee | None:
     if username is None:
         return None
 
-    query = select(Employee).where(Employee.username == username)
-    user = await session.scalar(query)
-
-    return user
+    return await get_employee("username", username, session)
 
 
 async def get_employee_by_id(user_id: UUID4, session: AsyncSession) -> Employee | None:
     if user_id is None:
         return None
 
-    query = select(Employee).where(Employee.id == user_id)
-    user = await session.scalar(query)
-
-    return user
+    return await get_employee("id", user_id, session)
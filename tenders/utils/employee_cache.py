@@ -0,0 +1,75 @@
+from functools import cache
+from typing import Hashable
+
+from tenders.config import get_settings
+from tenders.db.models import Employee
+from tenders.utils.common import TTLCache
+
+
+MISSING = object()
+
+
+class EmployeeCache:
+    """
+    Process-wide cache of employees by username and by id.
+
+    Employees are cached detached from any session and must be treated as read-only.
+    Unknown usernames and ids are remembered for a shorter `negative_ttl`,
+    so that requests with a wrong username do not reach the database every time.
+    """
+
+    KEYS = ("username", "id")
+
+    def __init__(self, maxsize: int, ttl: float, negative_ttl: float) -> None:
+        self.known = {key: TTLCache(maxsize, ttl) for key in self.KEYS}
+        self.unknown = TTLCache(maxsize, negative_ttl)
+
+    def get(self, key: str, value: Hashable) -> Employee | None | object:
+        """
+        Returns the cached employee, None for a known-unknown value or MISSING if the value is not cached.
+        """
+        employee = self.known[key].get(value, count_miss=False)
+        if employee is not None:
+            return employee
+
+        employee = self.unknown.get((key, value), MISSING, count_miss=False)
+        if employee is MISSING:
+            # one miss per lookup, on the cache the employee would have been found in
+            self.known[key].misses += 1
+
+        return employee
+
+    def set(self, key: str, value: Hashable, employee: Employee | None) -> None:
+        if employee is None:
+            self.unknown.set((key, value), None)
+            return
+
+        for name in self.KEYS:
+            self.unknown.invalidate((name, getattr(employee, name)))
+            self.known[name].set(getattr(employee, name), employee)
+
+    def invalidate(self, key: str, value: Hashable) -> None:
+        self.unknown.invalidate((key, value))
+        entry = self.known[key].entries.get(value)
+        if entry is not None:
+            for name in self.KEYS:
+                self.known[name].invalidate(getattr(entry[1], name))
+
+    def clear(self) -> None:
+        for known in self.known.values():
+            known.clear()
+        self.unknown.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {**{f"by_{key}": known.stats() for key, known in self.known.items()}, "unknown": self.unknown.stats()}
+
+
+@cache
+def get_employee_cache() -> EmployeeCache | None:
+    settings = get_settings()
+    if not settings.EMPLOYEE_CACHE_ENABLED:
+        return None
+
+    return EmployeeCache(
+        settings.EMPLOYEE_CACHE_SIZE, settings.EMPLOYEE_CACHE_TTL, settings.EMPLOYEE_CACHE_NEGATIVE_TTL
+    )
@@ -0,0 +1,62 @@
+from functools import cache
+from typing import Iterable
+
+from pydantic import UUID4
+
+from tenders.config import get_settings
+from tenders.utils.common import TTLCache
+
+
+class MembershipIndex:
+    """
+    Process-wide index of organization_responsible: user -> organization ids.
+
+    The table changes rarely, so entries live for `ttl` seconds; whoever changes memberships
+    must call the invalidation hooks to make the change visible immediately. The service itself
+    never changes them, so the index is off by default: a revoked membership stays visible until it expires.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.organizations = TTLCache(maxsize, ttl, on_drop=self.forget_members)
+        self.members: dict[UUID4, set[UUID4]] = {}
+
+    def get_organizations(self, user_id: UUID4) -> frozenset[UUID4] | None:
+        return self.organizations.get(user_id)
+
+    def set_organizations(self, user_id: UUID4, organizations: Iterable[UUID4]) -> None:
+        self.organizations.invalidate(user_id)
+        organizations = frozenset(organizations)
+        self.organizations.set(user_id, organizations)
+        for organization_id in organizations:
+            self.members.setdefault(organization_id, set()).add(user_id)
+
+    def forget_members(self, user_id: UUID4, organizations: frozenset[UUID4]) -> None:
+        for organization_id in organizations:
+            members = self.members.get(organization_id)
+            if members is not None:
+                members.discard(user_id)
+                if not members:
+                    del self.members[organization_id]
+
+    def invalidate_user(self, user_id: UUID4) -> None:
+        self.organizations.invalidate(user_id)
+
+    def invalidate_organization(self, organization_id: UUID4) -> None:
+        for user_id in list(self.members.get(organization_id, ())):
+            self.organizations.invalidate(user_id)
+
+    def clear(self) -> None:
+        self.organizations.clear()
+        self.members.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {"organizations": self.organizations.stats()}
+
+
+@cache
+def get_membership_index() -> MembershipIndex | None:
+    settings = get_settings()
+    if not settings.MEMBERSHIP_CACHE_ENABLED:
+        return None
+
+    return MembershipIndex(settings.MEMBERSHIP_CACHE_SIZE, settings.MEMBERSHIP_CACHE_TTL)
@@ -0,0 +1,47 @@
+from typing import Iterator
+
+from tenders.db.connection import SessionManager
+from tenders.utils.common import (
+    REQUEST_METRICS,
+    MetricsWriter,
+    TTLCache,
+    write_cache_metrics,
+    write_pool_metrics,
+    write_request_metrics,
+)
+from tenders.utils.common.search import INSTALLED_EXTENSIONS
+from tenders.utils.employee_cache import get_employee_cache
+from tenders.utils.membership import get_membership_index
+
+
+def iterate_caches(manager: SessionManager) -> Iterator[tuple[str, TTLCache]]:
+    employee_cache = get_employee_cache()
+    if employee_cache is not None:
+        for key, known in employee_cache.known.items():
+            yield f"employee_by_{key}", known
+        yield "employee_unknown", employee_cache.unknown
+
+    membership_index = get_membership_index()
+    if membership_index is not None:
+        yield "membership_organizations", membership_index.organizations
+
+    yield "recent_writers", manager.recent_writers
+    yield "installed_extensions", INSTALLED_EXTENSIONS
+
+
+def render_metrics() -> str:
+    """
+    Renders the metrics of this process: requests, connection pools and caches.
+    Everything is read from in-memory counters, so a scrape does not touch the database.
+    """
+    manager = SessionManager()
+    pools = {"primary": manager.engine.sync_engine.pool}
+    if manager.replica_engine is not None:
+        pools["replica"] = manager.replica_engine.sync_engine.pool
+
+    writer = MetricsWriter()
+    write_request_metrics(writer, REQUEST_METRICS)
+    write_pool_metrics(writer, pools)
+    write_cache_metrics(writer, iterate_caches(manager))
+
+    return writer.render()
@@ -1,7 +1,8 @@
 from datetime import datetime
+from uuid import uuid4
 
 from pydantic import UUID4
-from sqlalchemy import select, update
+from sqlalchemy import Float, Select, func, insert, literal, select, tuple_, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 from starlette.responses import JSONResponse
@@ -9,17 +10,29 @@ from starlette.responses import JSONResponse
 from tenders.db.enums import ServiceType, TenderStatus
 from tenders.db.models import TenderHistory
 from tenders.db.models.tender import Tender
+from tenders.schemas.bulk import BulkItemResult
 from tenders.schemas.tender import NewTenderRequest
 from tenders.schemas.tender import Tender as SchemaTender
-from tenders.utils.employee import get_employee_by_username, validate_employee_organisation
-from tenders.utils.tender_history import add_new_version, rollback_version
+from tenders.utils.common import (
+    Cursor,
+    VersionConflictError,
+    escape_like,
+    get_request_context,
+    has_extension,
+    insert_with_first_version,
+    rank_by_search,
+    select_updated_with_latest_version,
+)
+from tenders.utils.employee import (
+    get_employee_by_username,
+    get_employees_by_usernames,
+    get_memberships,
+    validate_employee_organisation,
+)
+from tenders.utils.tender_history import add_new_version, get_versions_loader, is_latest_version, rollback_version
 
 
-async def process_tender(tender: Tender, session: AsyncSession) -> SchemaTender:
-    query = select(TenderHistory).where(TenderHistory.tender_id == tender.id)
-    history = await session.scalars(query)
-    history = max(history, key=lambda x: x.history_number)
-
+def make_tender(tender: Tender, history: TenderHistory) -> SchemaTender:
     return SchemaTender(
         id=tender.id,
         name=history.name,
@@ -32,6 +45,12 @@ async def process_tender(tender: Tender, session: AsyncSession) -> SchemaTender:
     )
 
 
+async def process_tender(tender: Tender, session: AsyncSession) -> SchemaTender:
+    history = await get_versions_loader(session).load(tender.id)
+
+    return make_tender(tender, history)
+
+
 async def validate_tender_user(tender_id: UUID4, username: str, session: AsyncSession):
     tender = await get_tender_by_id(tender_id, session)
     if tender is None:
@@ -47,101 +66,211 @@ async def validate_tender_user(tender_id: UUID4, username: str, session: AsyncSe
     return None
 
 
-async def get_tenders(limit: int, offset: int, service_type: ServiceType | None, session: AsyncSession) -> list[Tender]:
-    query = select(Tender).where(Tender.status == TenderStatus.PUBLISHED.value)
-    tenders = await session.scalars(query)
-    tenders = [await process_tender(tender, session) for tender in tenders]
-    tenders.sort(key=lambda x: x.name)
-    return_tenders = []
+TENDER_FINGERPRINT = (Tender.id, Tender.status, TenderHistory.history_number)
+
+
+def select_latest_tenders() -> Select:
+    return (
+        select(Tender, TenderHistory)
+        .join(TenderHistory, TenderHistory.tender_id == Tender.id)
+        .where(is_latest_version(TenderHistory))
+    )
+
+
+def paginate_by_name(query: Select, limit: int, offset: int, after: Cursor | None) -> Select:
+    key = (TenderHistory.name.collate("C"), TenderHistory.tender_id)
+    if after is not None:
+        query = query.where(tuple_(*key) > tuple_(*after))
+
+    return query.order_by(*key).offset(offset).limit(limit)
+
+
+async def fetch_tenders(query: Select, session: AsyncSession) -> list[SchemaTender]:
+    rows = await session.execute(query)
+    loader = get_versions_loader(session)
+    tenders = []
+    for tender, history in rows:
+        loader.prime(tender.id, history)
+        tenders.append(make_tender(tender, history))
+
+    return tenders
+
+
+def select_published_tenders(service_type: ServiceType | None) -> Select:
+    query = select_latest_tenders().where(Tender.status == TenderStatus.PUBLISHED)
     if service_type is not None:
-        for i in filter(lambda x: x.serviceType == service_type, tenders):
-            return_tenders.append(i)
-            if len(return_tenders) >= limit + offset:
-                break
-    else:
-        return_tenders = tenders
+        query = query.where(TenderHistory.service_type == service_type)
+
+    return query
+
+
+def select_tenders(limit: int, offset: int, service_type: ServiceType | None, after: Cursor | None = None) -> Select:
+    return paginate_by_name(select_published_tenders(service_type), limit, offset, after)
+
+
+def select_exported_tenders(service_type: ServiceType | None) -> Select:
+    return select_published_tenders(service_type).order_by(Tender.id)
 
-    return return_tenders[offset : (limit + offset)]
 
+def select_found_tenders(text: str, limit: int, offset: int, service_type: ServiceType | None) -> Select:
+    query = select_published_tenders(service_type)
 
-async def add_tender(data: NewTenderRequest, creator_id: UUID4, session: AsyncSession):
-    tender = Tender(
-        organization_id=data.organizationId,
-        status=TenderStatus("Created"),
-        creator_id=creator_id,
+    return rank_by_search(query, TenderHistory.search_vector, TenderHistory.tender_id, text, limit, offset)
+
+
+SUGGEST_MIN_PREFIX_LENGTH = 3
+
+
+def select_prefixed_tenders(prefix: str, limit: int) -> Select:
+    """
+    Build a query for the names that start with `prefix` in any case, served by the index on lower(name).
+    """
+    lower_name = func.lower(TenderHistory.name).collate("C")
+
+    return (
+        select_published_tenders(None)
+        .where(lower_name.like(func.lower(f"{escape_like(prefix)}%"), escape="\\"))
+        .order_by(lower_name, TenderHistory.tender_id)
+        .limit(limit)
     )
-    session.add(tender)
-    await session.flush()
-    await session.refresh(tender)
-
-    tender_history = TenderHistory(
-        tender_id=tender.id,
-        name=data.name,
-        description=data.description,
-        service_type=data.serviceType,
-        history_number=1,
+
+
+async def select_suggested_tenders(prefix: str, limit: int, session: AsyncSession) -> Select:
+    """
+    Build a query for names that start with `prefix`, followed by names that contain a word similar to it,
+    which tolerates typos. Without pg_trgm only names that start with `prefix` are found.
+
+    Both parts are limited before they are merged, so that the similar names are taken from the trigram index
+    in the order of distance instead of sorting all of them.
+    """
+    prefixed = select_prefixed_tenders(prefix, limit)
+    if not await has_extension("pg_trgm", session):
+        return prefixed
+
+    lower_name = func.lower(TenderHistory.name).collate("C")
+    distance = TenderHistory.name.op("<->>", return_type=Float)(prefix)
+    similar = (
+        select_published_tenders(None)
+        .where(
+            TenderHistory.name.bool_op("%>")(prefix),
+            lower_name.not_like(func.lower(f"{escape_like(prefix)}%"), escape="\\"),
+        )
+        .order_by(distance, TenderHistory.tender_id)
+        .limit(limit)
+    )
+    matches = union_all(
+        prefixed.with_only_columns(
+            TenderHistory.id,
+            literal(0).label("part"),
+            func.row_number().over(order_by=(lower_name, TenderHistory.tender_id)).label("position"),
+        ),
+        similar.with_only_columns(
+            TenderHistory.id,
+            literal(1).label("part"),
+            func.row_number().over(order_by=(distance, TenderHistory.tender_id)).label("position"),
+        ),
+    ).subquery("matches")
+
+    return (
+        select(Tender, TenderHistory)
+        .join(TenderHistory, TenderHistory.tender_id == Tender.id)
+        .join(matches, matches.c.id == TenderHistory.id)
+        .order_by(matches.c.part, matches.c.position)
+        .limit(limit)
     )
-    session.add(tender_history)
-    await session.flush()
-    await session.refresh(tender_history)
 
+
+async def add_tender(data: NewTenderRequest, creator_id: UUID4, session: AsyncSession) -> SchemaTender:
+    query = insert_with_first_version(
+        Tender,
+        {"organization_id": data.organizationId, "status": TenderStatus("Created"), "creator_id": creator_id},
+        TenderHistory.tender_id,
+        {"name": data.name, "description": data.description, "service_type": data.serviceType},
+    )
+    tender, tender_history = (await session.execute(query)).one()
     await session.commit()
 
-    return {
-        "id": tender.id,
-        "name": data.name,
-        "description": data.description,
-        "status": tender.status,
-        "organizationId": data.organizationId,
-        "serviceType": data.serviceType,
-        "version": tender_history.history_number,
-        "createdAt": tender.created_at,
-    }
+    return make_tender(tender, tender_history)
+
+
+async def add_tenders(data: list[NewTenderRequest], session: AsyncSession) -> list[BulkItemResult]:
+    creators = await get_employees_by_usernames({item.creatorUsername for item in data}, session)
+    memberships = await get_memberships({creator.id for creator in creators.values()}, session)
+
+    results, tenders, histories = [], [], []
+    for index, item in enumerate(data):
+        creator = creators.get(item.creatorUsername)
+        if creator is None:
+            results.append(BulkItemResult(index=index, reason="user was not found"))
+        elif (creator.id, item.organizationId) not in memberships:
+            results.append(BulkItemResult(index=index, reason="user not authorized for this organization"))
+        else:
+            tender_id = uuid4()
+            tenders.append(
+                {
+                    "id": tender_id,
+                    "organization_id": item.organizationId,
+                    "status": TenderStatus.CREATED,
+                    "creator_id": creator.id,
+                }
+            )
+            histories.append(
+                {
+                    "tender_id": tender_id,
+                    "name": item.name,
+                    "description": item.description,
+                    "service_type": item.serviceType,
+                    "history_number": 1,
+                }
+            )
+            results.append(BulkItemResult(index=index, id=tender_id))
+
+    if tenders:
+        await session.execute(insert(Tender.__table__), tenders)
+        await session.execute(insert(TenderHistory.__table__), histories)
+        await session.commit()
 
+    return results
 
-async def get_tenders_by_user(user_id: UUID4, limit: int, offset: int, session: AsyncSession) -> list[Tender]:
-    query = select(Tender).where(Tender.creator_id == user_id)
-    tenders = await session.scalars(query)
-    tenders = [await process_tender(tender, session) for tender in tenders]
-    tenders.sort(key=lambda x: x.name)
 
-    return tenders[offset : (offset + limit)]
+def select_user_tenders(user_id: UUID4, limit: int, offset: int, after: Cursor | None = None) -> Select:
+    query = select_latest_tenders().where(Tender.creator_id == user_id)
 
+    return paginate_by_name(query, limit, offset, after)
 
-async def get_tender_by_id(tender_id: UUID4, session: AsyncSession) -> SchemaTender:
-    query = select(Tender).where(Tender.id == tender_id)
-    tender = await session.scalar(query)
 
-    return tender
+async def get_tender_by_id(tender_id: UUID4, session: AsyncSession) -> Tender | None:
+    return await get_request_context(session).load(Tender.id, tender_id, session)
 
 
-async def put_tender_status(tender_id: UUID4, tender_status: TenderStatus, session: AsyncSession):
+async def put_tender_status(tender_id: UUID4, tender_status: TenderStatus, session: AsyncSession) -> SchemaTender:
     query = update(Tender).where(Tender.id == tender_id).values(updated_at=datetime.now(), status=tender_status)
-    await session.execute(query)
+    query = select_updated_with_latest_version(query, TenderHistory.tender_id, is_latest_version)
+    tender, tender_history = (await session.execute(query)).one()
     await session.commit()
+    get_request_context(session).set(Tender.id, tender_id, tender)
+    get_versions_loader(session).prime(tender_id, tender_history)
+
+    return make_tender(tender, tender_history)
 
 
 async def patch_tender_history(
     tender_id: UUID4, name: str, description: str, service_type: ServiceType, session: AsyncSession
 ):
-    tender = await get_tender_by_id(tender_id, session)
-    tender = await process_tender(tender, session)
-    await add_new_version(tender, name, description, service_type, session)
-    tender.version += 1
-    if name is not None:
-        tender.name = name
-    if description is not None:
-        tender.description = description
-    if service_type is not None:
-        tender.serviceType = service_type
+    try:
+        tender, tender_history = await add_new_version(tender_id, name, description, service_type, session)
+    except VersionConflictError:
+        return JSONResponse(status_code=status.HTTP_409_CONFLICT, content={"reason": "tender is being edited"})
 
-    return tender
+    return make_tender(tender, tender_history)
 
 
 async def rollback_version_tender(tender_id: UUID4, version: int, session: AsyncSession):
-    tender = await get_tender_by_id(tender_id, session)
-    tender = await process_tender(tender, session)
-    await rollback_version(tender, version, session)
-    tender = await get_tender_by_id(tender_id, session)
+    try:
+        row = await rollback_version(tender_id, version, session)
+    except VersionConflictError:
+        return JSONResponse(status_code=status.HTTP_409_CONFLICT, content={"reason": "tender is being edited"})
+    if row is None:
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"reason": "version was not found"})
 
-    return await process_tender(tender, session)
+    return make_tender(*row)
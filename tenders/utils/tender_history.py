@@ -1,32 +1,42 @@
-from sqlalchemy import select
+from pydantic import UUID4
+from sqlalchemy import ColumnElement, Row, exists
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from tenders.db.enums import ServiceType
+from tenders.db.models.tender import Tender
 from tenders.db.models.tender_history import TenderHistory
-from tenders.schemas.tender import Tender as SchemaTender
+from tenders.utils.common import LatestVersionLoader, append_version, get_latest_version_loader
 
 
 async def add_new_version(
-    tender: SchemaTender, name: str, description: str, service_type: ServiceType, session: AsyncSession
-):
-    if name is None:
-        name = tender.name
-    if description is None:
-        description = tender.description
-    if service_type is None:
-        service_type = tender.serviceType
-    tender_history = TenderHistory(
-        tender_id=tender.id,
-        name=name,
-        description=description,
-        service_type=service_type,
-        history_number=tender.version + 1,
-    )
-    session.add(tender_history)
-    await session.commit()
-
-
-async def rollback_version(tender: SchemaTender, version: int, session: AsyncSession):
-    query = select(TenderHistory).where(TenderHistory.tender_id == tender.id, TenderHistory.history_number == version)
-    tender_history = await session.scalar(query)
-    await add_new_version(tender, tender_history.name, tender_history.description, tender_history.service_type, session)
+    tender_id: UUID4, name: str, description: str, service_type: ServiceType, session: AsyncSession
+) -> Row | None:
+    values = {"name": name, "description": description, "service_type": service_type}
+    values = {key: value for key, value in values.items() if value is not None}
+
+    return await append_tender_version(tender_id, values, session)
+
+
+async def rollback_version(tender_id: UUID4, version: int, session: AsyncSession) -> Row | None:
+    return await append_tender_version(tender_id, {}, session, version)
+
+
+async def append_tender_version(
+    tender_id: UUID4, values: dict, session: AsyncSession, version: int | None = None
+) -> Row | None:
+    row = await append_version(Tender, TenderHistory.tender_id, tender_id, values, session, version)
+    if row is not None:
+        get_versions_loader(session).prime(tender_id, row[1])
+
+    return row
+
+
+def get_versions_loader(session: AsyncSession) -> LatestVersionLoader:
+    return get_latest_version_loader(TenderHistory.tender_id, session)
+
+
+def is_latest_version(history: type[TenderHistory]) -> ColumnElement[bool]:
+    newer = aliased(TenderHistory)
+
+    return ~exists().where(newer.tender_id == history.tender_id, newer.history_number > history.history_number)
@@ -15,7 +15,9 @@ from tests.utils import make_alembic_config
 import tenders.utils as utils_module
 from tenders.__main__ import get_app
 from tenders.config.utils import get_settings
+from tenders.db.base_schema import create_base_schema
 from tenders.db.connection import SessionManager
+from tenders.utils.employee_cache import get_employee_cache
 
 
 @pytest.fixture(name="event_loop", scope="session")
@@ -37,6 +39,7 @@ def get_postgres() -> str:
 
     if not database_exists(tmp_url):
         create_database(tmp_url)
+        create_base_schema(tmp_url)
 
     try:
         yield settings.database_uri
@@ -53,14 +56,17 @@ async def run_async_upgrade(config: Config, database_uri: str):
     async_engine = create_async_engine(database_uri, echo=True)
     async with async_engine.begin() as conn:
         await conn.run_sync(run_upgrade, config)
+    await async_engine.dispose()
 
 
 @pytest.fixture(name="alembic_config")
-def get_alembic_config(postgres) -> Config:
+def get_alembic_config(postgres, monkeypatch) -> Config:
     """
     Создает файл конфигурации для alembic.
+    Миграции применяются и на сервере без pg_trgm, тесты опечаток тогда пропускаются.
     """
-    cmd_options = SimpleNamespace(config="bookmarker/db/", name="alembic", pg_url=postgres, raiseerr=False, x=None)
+    monkeypatch.setenv("PG_TRGM_OPTIONAL", "true")
+    cmd_options = SimpleNamespace(config="tenders/db/", name="alembic", pg_url=postgres, raiseerr=False, x=None)
     return make_alembic_config(cmd_options)
 
 
@@ -81,6 +87,26 @@ async def get_migrated_postgres(postgres, alembic_config: Config):
     await run_async_upgrade(alembic_config, postgres)
 
 
+@pytest.fixture(name="replica_postgres")
+async def get_replica_postgres(migrated_postgres, alembic_config: Config, monkeypatch) -> str:
+    """
+    Создает вторую базу данных с той же схемой и подключает ее к приложению как реплику.
+    """
+    settings = get_settings()
+    tmp_url = f"{settings.database_uri_sync}_replica"
+
+    if not database_exists(tmp_url):
+        create_database(tmp_url)
+        create_base_schema(tmp_url)
+    await run_async_upgrade(alembic_config, f"{settings.database_uri}_replica")
+    monkeypatch.setenv("POSTGRES_REPLICA_CONN", tmp_url)
+
+    try:
+        yield f"{settings.database_uri}_replica"
+    finally:
+        drop_database(tmp_url)
+
+
 @pytest.fixture(name="client")
 async def get_client(migrated_postgres, manager: SessionManager = SessionManager()) -> AsyncClient:
     """
@@ -89,9 +115,12 @@ async def get_client(migrated_postgres, manager: SessionManager = SessionManager
     if migrated_postgres:  # без этой строки не проходит линтер
         pass
     app = get_app()
-    manager.refresh()  # без вызова метода изменения конфига внутри фикстуры postgres не подтягиваются в класс
+    await manager.refresh()  # без вызова метода изменения конфига внутри фикстуры postgres не подтягиваются в класс
     utils_module.check_website_exist = AsyncMock(return_value=(True, "Status code < 400"))
+    if get_employee_cache() is not None:
+        get_employee_cache().clear()  # пользователи с теми же username создаются заново в каждом тесте
     yield AsyncClient(app=app, base_url="http://test")
+    await manager.dispose()
 
 
 @pytest.fixture(name="engine_async")
@@ -0,0 +1,197 @@
+import asyncio
+
+import pytest
+from sqlalchemy import insert, update
+from starlette import status
+
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+
+
+@pytest.fixture(name="bids")
+async def get_bids(migrated_postgres, session) -> dict[str, Bid]:
+    """
+    Пользователь alice состоит в организации, bob - сторонний пользователь.
+    """
+    alice, bob = Employee(username="alice"), Employee(username="bob")
+    session.add_all([alice, bob])
+    await session.flush()
+    own, other = [
+        await session.scalar(insert(Organization).values(name=name).returning(Organization.id))
+        for name in ("own", "other")
+    ]
+    session.add(OrganizationResponsible(organization_id=own, user_id=alice.id))
+
+    own_tender = Tender(organization_id=own, status=TenderStatus.PUBLISHED, creator_id=alice.id)
+    other_tender = Tender(organization_id=other, status=TenderStatus.PUBLISHED, creator_id=bob.id)
+    session.add_all([own_tender, other_tender])
+    await session.flush()
+    for tender in (own_tender, other_tender):
+        session.add(
+            TenderHistory(tender_id=tender.id, name="tender", service_type=ServiceType.DELIVERY, history_number=1)
+        )
+
+    bids = {
+        # видна и как заявка пользователя, и как заявка на тендер его организации
+        "by user on own tender": Bid(tender_id=own_tender.id, creator_type=CreatorType.USER, creator_id=alice.id),
+        "by organization": Bid(tender_id=other_tender.id, creator_type=CreatorType.ORGANIZATION, creator_id=own),
+        "by stranger on own tender": Bid(tender_id=own_tender.id, creator_type=CreatorType.USER, creator_id=bob.id),
+        "by stranger": Bid(tender_id=other_tender.id, creator_type=CreatorType.USER, creator_id=bob.id),
+    }
+    for bid in bids.values():
+        bid.status = BidStatus.CREATED
+    session.add_all(bids.values())
+    await session.flush()
+    for name, bid in bids.items():
+        session.add(BidHistory(bid_id=bid.id, name=name, description="", history_number=1))
+        session.add(BidHistory(bid_id=bid.id, name=f"{name} v2", description="", history_number=2))
+    await session.commit()
+
+    return bids
+
+
+class TestUserBidsHandler:
+    @staticmethod
+    def get_url() -> str:
+        return "/api/bids/my"
+
+    async def test_user_bids_are_deduplicated_and_sorted(self, client, bids):
+        response = await client.get(url=self.get_url(), params={"username": "alice", "limit": 50})
+        assert response.status_code == status.HTTP_200_OK
+        assert [(bid["name"], bid["version"]) for bid in response.json()] == [
+            ("by organization v2", 2),
+            ("by stranger on own tender v2", 2),
+            ("by user on own tender v2", 2),
+        ]
+
+    async def test_user_bids_are_paginated(self, client, bids):
+        response = await client.get(url=self.get_url(), params={"username": "alice", "limit": 1, "offset": 1})
+        assert response.status_code == status.HTTP_200_OK
+        assert [bid["id"] for bid in response.json()] == [str(bids["by stranger on own tender"].id)]
+
+    async def test_unknown_user(self, client, bids):
+        response = await client.get(url=self.get_url(), params={"username": "nobody"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestTenderBidsHandler:
+    @staticmethod
+    def get_url(tender_id) -> str:
+        return f"/api/bids/{tender_id}/list"
+
+    @pytest.mark.parametrize(
+        "username, tender_of, visible",
+        [
+            ("alice", "by user on own tender", ["by stranger on own tender v2", "by user on own tender v2"]),
+            ("alice", "by stranger", ["by organization v2"]),
+            ("bob", "by user on own tender", ["by stranger on own tender v2"]),
+            ("bob", "by stranger", ["by stranger v2"]),
+        ],
+    )
+    async def test_tender_bids_visibility(self, client, bids, username, tender_of, visible):
+        response = await client.get(url=self.get_url(bids[tender_of].tender_id), params={"username": username})
+        assert response.status_code == status.HTTP_200_OK
+        assert [bid["name"] for bid in response.json()] == visible
+
+
+@pytest.mark.parametrize("url", ["/api/bids/my", "/api/bids/{tender_id}/list"])
+@pytest.mark.parametrize("params, reason", [({"limit": -1}, "invalid limit"), ({"offset": -1}, "invalid offset")])
+async def test_offset_pages_reject_negative_values(client, bids, url, params, reason):
+    tender_id = bids["by user on own tender"].tender_id
+    response = await client.get(url.format(tender_id=tender_id), params={"username": "alice", **params})
+    assert (response.status_code, response.json()) == (status.HTTP_400_BAD_REQUEST, {"reason": reason})
+
+
+class TestBidStatusHandler:
+    @staticmethod
+    def get_url(bid_id) -> str:
+        return f"/api/bids/{bid_id}/status"
+
+    async def test_changed_status_is_returned(self, client, bids):
+        bid_id = bids["by user on own tender"].id
+        response = await client.put(url=self.get_url(bid_id), params={"username": "alice", "status": "Published"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == "Published"
+        assert (response.json()["name"], response.json()["version"]) == ("by user on own tender v2", 2)
+
+        response = await client.get(url=self.get_url(bid_id), params={"username": "alice"})
+        assert response.json() == "Published"
+
+
+@pytest.fixture(name="approvers")
+async def get_approvers(migrated_postgres, session) -> dict:
+    """
+    В организации пять ответственных, поэтому для решения по заявке нужно три одобрения.
+    """
+    approvers = [Employee(username=f"approver {i}") for i in range(5)]
+    session.add_all(approvers)
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add_all(OrganizationResponsible(organization_id=organization_id, user_id=user.id) for user in approvers)
+    tender = Tender(organization_id=organization_id, status=TenderStatus.PUBLISHED, creator_id=approvers[0].id)
+    session.add(tender)
+    await session.flush()
+    session.add(
+        TenderHistory(
+            tender_id=tender.id, name="tender", description="", service_type=ServiceType.DELIVERY, history_number=1
+        )
+    )
+    bid = Bid(
+        tender_id=tender.id, status=BidStatus.PUBLISHED, creator_type=CreatorType.USER, creator_id=approvers[0].id
+    )
+    session.add(bid)
+    await session.flush()
+    session.add(BidHistory(bid_id=bid.id, name="bid", description="", history_number=1))
+    await session.commit()
+
+    return {"usernames": [user.username for user in approvers], "tender": tender.id, "bid": bid.id}
+
+
+class TestBidDecisionHandler:
+    @staticmethod
+    def get_url(bid_id) -> str:
+        return f"/api/bids/{bid_id}/submit_decision"
+
+    async def get_state(self, session, approvers) -> tuple:
+        bid = await session.get(Bid, approvers["bid"], populate_existing=True)
+        tender = await session.get(Tender, approvers["tender"], populate_existing=True)
+
+        return bid.approved_num, bid.status, tender.status
+
+    async def test_quorum_closes_tender(self, client, session, approvers):
+        url = self.get_url(approvers["bid"])
+        for username in approvers["usernames"][:2]:
+            response = await client.put(url, params={"username": username, "decision": "Approved"})
+            assert response.status_code == status.HTTP_200_OK
+        assert await self.get_state(session, approvers) == (2, BidStatus.PUBLISHED, TenderStatus.PUBLISHED)
+
+        response = await client.put(url, params={"username": approvers["usernames"][2], "decision": "Approved"})
+        assert response.json()["status"] == "Canceled"
+        assert await self.get_state(session, approvers) == (2, BidStatus.CANCELED, TenderStatus.CLOSED)
+
+        await session.execute(
+            update(Tender).where(Tender.id == approvers["tender"]).values(status=TenderStatus.PUBLISHED)
+        )
+        await session.commit()
+        response = await client.put(url, params={"username": approvers["usernames"][3], "decision": "Approved"})
+        assert response.json()["status"] == "Canceled"
+        assert await self.get_state(session, approvers) == (2, BidStatus.CANCELED, TenderStatus.PUBLISHED)
+
+    async def test_parallel_approvals_are_not_lost(self, client, session, approvers):
+        url = self.get_url(approvers["bid"])
+        responses = await asyncio.gather(
+            *(
+                client.put(url, params={"username": username, "decision": "Approved"})
+                for username in approvers["usernames"] * 2
+            )
+        )
+        assert {response.status_code for response in responses} == {status.HTTP_200_OK}
+        assert await self.get_state(session, approvers) == (2, BidStatus.CANCELED, TenderStatus.CLOSED)
+
+    async def test_rejection(self, client, session, approvers):
+        response = await client.put(
+            self.get_url(approvers["bid"]), params={"username": approvers["usernames"][1], "decision": "Rejected"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert (response.json()["status"], response.json()["version"]) == ("Canceled", 1)
+        assert await self.get_state(session, approvers) == (0, BidStatus.CANCELED, TenderStatus.PUBLISHED)
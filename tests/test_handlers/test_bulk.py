@@ -0,0 +1,120 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, insert, select
+from starlette import status
+
+from tenders.config.utils import get_settings
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+
+
+@pytest.fixture(name="organization")
+async def get_organization(migrated_postgres, session) -> dict:
+    """
+    Пользователь alice состоит в организации own и не состоит в other.
+    """
+    alice = Employee(username="alice")
+    session.add(alice)
+    await session.flush()
+    own, other = [
+        await session.scalar(insert(Organization).values(name=name).returning(Organization.id))
+        for name in ("own", "other")
+    ]
+    session.add(OrganizationResponsible(organization_id=own, user_id=alice.id))
+    await session.commit()
+
+    return {"own": own, "other": other, "alice": alice.id}
+
+
+def make_tender(organization_id, username="alice") -> dict:
+    return {
+        "name": "tender",
+        "description": "bulk",
+        "serviceType": "Delivery",
+        "organizationId": str(organization_id),
+        "creatorUsername": username,
+    }
+
+
+def make_bid(tender_id, author_type, author_id) -> dict:
+    return {
+        "name": "bid",
+        "description": "bulk",
+        "tenderId": str(tender_id),
+        "authorType": author_type,
+        "authorId": str(author_id),
+    }
+
+
+class TestBulkHandlers:
+    async def test_tenders_bulk(self, client, session, organization):
+        response = await client.post(
+            "/api/tenders/bulk",
+            json=[
+                make_tender(organization["own"]),
+                make_tender(organization["own"], username="nobody"),
+                make_tender(organization["other"]),
+                make_tender(organization["own"]),
+            ],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()
+        assert [result["reason"] for result in results] == [
+            None,
+            "user was not found",
+            "user not authorized for this organization",
+            None,
+        ]
+
+        created = {results[0]["id"], results[3]["id"]}
+        rows = await session.execute(select(Tender.id, TenderHistory.history_number).join(TenderHistory))
+        assert {(str(tender_id), number) for tender_id, number in rows} == {(tender_id, 1) for tender_id in created}
+
+    async def test_bids_bulk(self, client, session, organization):
+        response = await client.post("/api/tenders/bulk", json=[make_tender(organization["own"])])
+        tender_id = response.json()[0]["id"]
+
+        response = await client.post(
+            "/api/bids/bulk",
+            json=[
+                make_bid(tender_id, "User", organization["alice"]),
+                make_bid(tender_id, "Organization", organization["own"]),
+                make_bid(tender_id, "User", uuid4()),
+                make_bid(tender_id, "Organization", uuid4()),
+                make_bid(uuid4(), "User", organization["alice"]),
+            ],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [result["reason"] for result in response.json()] == [
+            None,
+            None,
+            "user was not found",
+            "organization was not found",
+            "tender was not found",
+        ]
+        assert await session.scalar(select(func.count()).select_from(Bid)) == 2
+        assert await session.scalar(select(func.count()).select_from(BidHistory)) == 2
+
+    async def test_tenders_bulk_at_the_cap(self, client, session, organization):
+        size = get_settings().BULK_MAX_ITEMS
+        response = await client.post(
+            "/api/tenders/bulk",
+            json=[make_tender(organization["own"], username="alice" if i % 2 else f"user{i}") for i in range(size)],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert sum(result["reason"] is None for result in response.json()) == size // 2
+        assert await session.scalar(select(func.count()).select_from(TenderHistory)) == size // 2
+
+    async def test_bids_bulk_at_the_cap(self, client, session, organization):
+        size = get_settings().BULK_MAX_ITEMS
+        response = await client.post(
+            "/api/bids/bulk",
+            json=[make_bid(uuid4(), "User" if i % 2 else "Organization", uuid4()) for i in range(size)],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert {result["reason"] for result in response.json()} == {"tender was not found"}
+
+    async def test_tenders_bulk_over_the_cap(self, client, organization):
+        size = get_settings().BULK_MAX_ITEMS + 1
+        response = await client.post("/api/tenders/bulk", json=[make_tender(organization["own"])] * size)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
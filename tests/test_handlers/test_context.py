@@ -0,0 +1,78 @@
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import AsyncClient
+from pydantic import UUID4
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.utils import count_statements
+
+from tenders.db.connection import SessionManager, get_session
+from tenders.db.enums import BidStatus, CreatorType, Decision, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+from tenders.utils.bid import get_bid_by_id, put_bid_decision, put_bid_status
+from tenders.utils.tender import get_tender_by_id
+
+
+async def read_write_read(tender_id: UUID4, bid_id: UUID4, session: AsyncSession = Depends(get_session)) -> dict:
+    async def read() -> list[str]:
+        tender, bid = await get_tender_by_id(tender_id, session), await get_bid_by_id(bid_id, session)
+        return [tender.status, bid.status]
+
+    states = {"before": await read()}
+    with count_statements(SessionManager().engine) as statements:
+        states["again"] = await read()
+    states["again queries"] = len(statements)
+    await put_bid_status(bid_id, BidStatus.PUBLISHED, session)
+    states["after status"] = await read()
+    await put_bid_decision(bid_id, Decision.APPROVED, session)
+    states["after decision"] = await read()
+
+    return states
+
+
+@pytest.fixture(name="context_client")
+async def get_context_client(client) -> AsyncClient:
+    """
+    Клиент приложения с одним обработчиком, который в одном запросе читает тендер и заявку, меняет их и читает снова.
+    """
+    app = FastAPI()
+    app.add_api_route("/context/{tender_id}/{bid_id}", read_write_read, methods=["PUT"])
+
+    async with AsyncClient(app=app, base_url="http://test") as context_client:
+        yield context_client
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> dict:
+    """
+    Опубликованный тендер организации с единственным ответственным, поэтому первое одобрение закрывает тендер.
+    """
+    alice = Employee(username="alice")
+    session.add(alice)
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add(OrganizationResponsible(organization_id=organization_id, user_id=alice.id))
+    tender = Tender(organization_id=organization_id, status=TenderStatus.PUBLISHED, creator_id=alice.id)
+    session.add(tender)
+    await session.flush()
+    session.add(TenderHistory(tender_id=tender.id, name="tender", service_type=ServiceType.DELIVERY, history_number=1))
+    bid = Bid(tender_id=tender.id, status=BidStatus.CREATED, creator_type=CreatorType.USER, creator_id=alice.id)
+    session.add(bid)
+    await session.flush()
+    session.add(BidHistory(bid_id=bid.id, name="bid", description="", history_number=1))
+    await session.commit()
+
+    return {"tender": tender.id, "bid": bid.id}
+
+
+async def test_reads_after_writes_see_fresh_state(context_client, entities):
+    response = await context_client.put(f"/context/{entities['tender']}/{entities['bid']}")
+
+    assert response.json() == {
+        "before": ["Published", "Created"],
+        "again": ["Published", "Created"],
+        "again queries": 0,
+        "after status": ["Published", "Published"],
+        "after decision": ["Closed", "Canceled"],
+    }
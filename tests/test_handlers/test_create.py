@@ -0,0 +1,175 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select
+from starlette import status
+
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import (
+    Bid,
+    BidHistory,
+    Employee,
+    Feedback,
+    FeedbackHistory,
+    Organization,
+    OrganizationResponsible,
+    Tender,
+    TenderHistory,
+)
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> dict:
+    """
+    Организации own и other, alice отвечает за own, bob и carol - сторонние пользователи.
+    На тендер own есть заявка bob.
+    """
+    alice, bob, carol = Employee(username="alice"), Employee(username="bob"), Employee(username="carol")
+    session.add_all([alice, bob, carol])
+    await session.flush()
+    own, other = [
+        await session.scalar(insert(Organization).values(name=name).returning(Organization.id))
+        for name in ("own", "other")
+    ]
+    session.add(OrganizationResponsible(organization_id=own, user_id=alice.id))
+    tender = Tender(organization_id=own, status=TenderStatus.PUBLISHED, creator_id=alice.id)
+    session.add(tender)
+    await session.flush()
+    session.add(TenderHistory(tender_id=tender.id, name="tender", service_type=ServiceType.DELIVERY, history_number=1))
+    bid = Bid(tender_id=tender.id, status=BidStatus.CREATED, creator_type=CreatorType.USER, creator_id=bob.id)
+    session.add(bid)
+    await session.flush()
+    session.add(BidHistory(bid_id=bid.id, name="bid", description="", history_number=1))
+    await session.commit()
+
+    return {"alice": alice.id, "bob": bob.id, "own": own, "other": other, "tender": tender.id, "bid": bid.id}
+
+
+class TestNewTenderHandler:
+    @staticmethod
+    def get_body(organization_id, username: str = "alice") -> dict:
+        return {
+            "name": "new tender",
+            "description": "first version",
+            "serviceType": "Construction",
+            "organizationId": str(organization_id),
+            "creatorUsername": username,
+        }
+
+    async def test_created_tender_is_returned_and_stored(self, client, session, entities):
+        response = await client.post("/api/tenders/new", json=self.get_body(entities["own"]))
+        assert response.status_code == status.HTTP_200_OK
+        tender = response.json()
+        assert {key: tender[key] for key in ("name", "description", "status", "serviceType", "version")} == {
+            "name": "new tender",
+            "description": "first version",
+            "status": "Created",
+            "serviceType": "Construction",
+            "version": 1,
+        }
+        assert tender["organizationId"] == str(entities["own"])
+
+        stored = await session.execute(
+            select(Tender.creator_id, TenderHistory.name, TenderHistory.history_number)
+            .join(TenderHistory, TenderHistory.tender_id == Tender.id)
+            .where(Tender.id == tender["id"])
+        )
+        assert stored.all() == [(entities["alice"], "new tender", 1)]
+
+    @pytest.mark.parametrize(
+        "username, organization, status_code",
+        [
+            ("nobody", "own", status.HTTP_401_UNAUTHORIZED),
+            ("alice", "other", status.HTTP_403_FORBIDDEN),
+            ("bob", "own", status.HTTP_403_FORBIDDEN),
+        ],
+    )
+    async def test_rejected_tender_is_not_stored(self, client, session, entities, username, organization, status_code):
+        response = await client.post("/api/tenders/new", json=self.get_body(entities[organization], username))
+        assert response.status_code == status_code
+        assert await session.scalar(select(Tender.id).where(Tender.id != entities["tender"])) is None
+
+
+class TestNewBidHandler:
+    @staticmethod
+    def get_body(tender_id, author_type: str, author_id) -> dict:
+        return {
+            "name": "new bid",
+            "description": "first version",
+            "tenderId": str(tender_id),
+            "authorType": author_type,
+            "authorId": str(author_id),
+        }
+
+    @pytest.mark.parametrize("author_type, author", [("User", "alice"), ("Organization", "other")])
+    async def test_created_bid_is_returned_and_stored(self, client, session, entities, author_type, author):
+        body = self.get_body(entities["tender"], author_type, entities[author])
+        response = await client.post("/api/bids/new", json=body)
+        assert response.status_code == status.HTTP_200_OK
+        bid = response.json()
+        assert {key: bid[key] for key in ("name", "description", "status", "authorType", "version")} == {
+            "name": "new bid",
+            "description": "first version",
+            "status": "Created",
+            "authorType": author_type,
+            "version": 1,
+        }
+        assert (bid["tenderId"], bid["authorId"]) == (str(entities["tender"]), str(entities[author]))
+
+        stored = await session.execute(
+            select(BidHistory.name, BidHistory.description, BidHistory.history_number).where(
+                BidHistory.bid_id == bid["id"]
+            )
+        )
+        assert stored.all() == [("new bid", "first version", 1)]
+
+    @pytest.mark.parametrize(
+        "tender, author_type, author, status_code",
+        [
+            (None, "User", "alice", status.HTTP_404_NOT_FOUND),
+            ("tender", "User", None, status.HTTP_401_UNAUTHORIZED),
+            ("tender", "Organization", None, status.HTTP_403_FORBIDDEN),
+        ],
+    )
+    async def test_rejected_bid_is_not_stored(
+        self, client, session, entities, tender, author_type, author, status_code
+    ):
+        body = self.get_body(entities.get(tender, uuid4()), author_type, entities.get(author, uuid4()))
+        response = await client.post("/api/bids/new", json=body)
+        assert response.status_code == status_code
+        assert await session.scalar(select(Bid.id).where(Bid.id != entities["bid"])) is None
+
+
+class TestBidFeedbackHandler:
+    @staticmethod
+    def get_url(bid_id) -> str:
+        return f"/api/bids/{bid_id}/feedback"
+
+    async def test_feedback_is_stored_as_first_version(self, client, session, entities):
+        response = await client.put(
+            self.get_url(entities["bid"]), params={"username": "alice", "bidFeedback": "looks good"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert (response.json()["id"], response.json()["name"]) == (str(entities["bid"]), "bid")
+
+        stored = await session.execute(
+            select(
+                Feedback.bid_id, Feedback.creator_id, FeedbackHistory.description, FeedbackHistory.history_number
+            ).join(FeedbackHistory, FeedbackHistory.feedback_id == Feedback.id)
+        )
+        assert stored.all() == [(entities["bid"], entities["alice"], "looks good", 1)]
+
+    @pytest.mark.parametrize(
+        "bid, username, status_code",
+        [
+            ("bid", "nobody", status.HTTP_401_UNAUTHORIZED),
+            (None, "alice", status.HTTP_404_NOT_FOUND),
+            ("bid", "carol", status.HTTP_403_FORBIDDEN),
+        ],
+    )
+    async def test_rejected_feedback_is_not_stored(self, client, session, entities, bid, username, status_code):
+        response = await client.put(
+            self.get_url(entities.get(bid, uuid4())), params={"username": username, "bidFeedback": "looks good"}
+        )
+        assert response.status_code == status_code
+        assert await session.scalar(select(Feedback.id)) is None
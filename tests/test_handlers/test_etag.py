@@ -0,0 +1,97 @@
+import pytest
+from sqlalchemy import insert
+from starlette import status
+
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> dict:
+    """
+    Два опубликованных тендера организации alice и заявка alice на первый из них.
+    """
+    alice = Employee(username="alice")
+    session.add(alice)
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add(OrganizationResponsible(organization_id=organization_id, user_id=alice.id))
+    tenders = [
+        Tender(organization_id=organization_id, status=TenderStatus.PUBLISHED, creator_id=alice.id) for _ in "ab"
+    ]
+    session.add_all(tenders)
+    await session.flush()
+    for name, tender in zip("ab", tenders):
+        session.add(
+            TenderHistory(
+                tender_id=tender.id, name=name, description="", service_type=ServiceType.DELIVERY, history_number=1
+            )
+        )
+    bid = Bid(tender_id=tenders[0].id, status=BidStatus.CREATED, creator_type=CreatorType.USER, creator_id=alice.id)
+    session.add(bid)
+    await session.flush()
+    session.add(BidHistory(bid_id=bid.id, name="bid", description="", history_number=1))
+    await session.commit()
+
+    return {"tenders": [tender.id for tender in tenders], "bid": bid.id}
+
+
+async def revalidate(client, url, params) -> tuple[str, int]:
+    response = await client.get(url, params=params)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["cache-control"] == "private, no-cache"
+    etag = response.headers["etag"]
+
+    response = await client.get(url, params=params, headers={"If-None-Match": etag})
+
+    return etag, response.status_code
+
+
+class TestConditionalGet:
+    @pytest.mark.parametrize(
+        "url, params",
+        [
+            ("/api/tenders", {}),
+            ("/api/tenders", {"limit": 1, "cursor": ""}),
+            ("/api/tenders/my", {"username": "alice"}),
+            ("/api/bids/my", {"username": "alice"}),
+        ],
+    )
+    async def test_unchanged_page_is_not_modified(self, client, entities, url, params):
+        _, status_code = await revalidate(client, url, params)
+        assert status_code == status.HTTP_304_NOT_MODIFIED
+
+    async def test_changed_page_is_sent_again(self, client, entities):
+        params = {"username": "alice"}
+        etag, _ = await revalidate(client, "/api/tenders", {})
+        await client.patch(f"/api/tenders/{entities['tenders'][1]}/edit", params=params, json={"name": "c"})
+
+        response = await client.get("/api/tenders", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert [tender["name"] for tender in response.json()] == ["a", "c"]
+        etag = response.headers["etag"]
+
+        await client.put(f"/api/tenders/{entities['tenders'][0]}/status", params={**params, "status": "Closed"})
+        response = await client.get("/api/tenders", headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert [tender["name"] for tender in response.json()] == ["c"]
+
+    async def test_status(self, client, entities):
+        bid_url = f"/api/bids/{entities['bid']}/status"
+        params = {"username": "alice"}
+        etag, status_code = await revalidate(client, bid_url, params)
+        assert status_code == status.HTTP_304_NOT_MODIFIED
+
+        await client.put(bid_url, params={**params, "status": "Published"})
+        response = await client.get(bid_url, params=params, headers={"If-None-Match": etag})
+        assert (response.status_code, response.json()) == (status.HTTP_200_OK, "Published")
+
+        _, status_code = await revalidate(client, f"/api/tenders/{entities['tenders'][0]}/status", {})
+        assert status_code == status.HTTP_304_NOT_MODIFIED
+
+    async def test_not_modified_requires_access(self, client, entities):
+        bid_url = f"/api/bids/{entities['bid']}/status"
+        etag, _ = await revalidate(client, bid_url, {"username": "alice"})
+
+        response = await client.get(bid_url, params={"username": "nobody"}, headers={"If-None-Match": etag})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette import status
+
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+from tenders.utils.common import stream_ndjson
+from tenders.utils.tender import make_tender, select_exported_tenders
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> dict:
+    """
+    Пять опубликованных и один черновой тендер организации alice, по две версии каждого,
+    и заявки на первый тендер: опубликованная и черновик bob.
+    """
+    alice, bob = Employee(username="alice"), Employee(username="bob")
+    session.add_all([alice, bob])
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add(OrganizationResponsible(organization_id=organization_id, user_id=alice.id))
+    statuses = [TenderStatus.PUBLISHED] * 5 + [TenderStatus.CREATED]
+    tenders = [Tender(organization_id=organization_id, status=status, creator_id=alice.id) for status in statuses]
+    session.add_all(tenders)
+    await session.flush()
+    for i, tender in enumerate(tenders):
+        for version in (1, 2):
+            session.add(
+                TenderHistory(
+                    tender_id=tender.id,
+                    name=f"tender {i} v{version}",
+                    description="",
+                    service_type=ServiceType.DELIVERY,
+                    history_number=version,
+                )
+            )
+    bids = [
+        Bid(tender_id=tenders[0].id, status=status, creator_type=CreatorType.USER, creator_id=bob.id)
+        for status in (BidStatus.PUBLISHED, BidStatus.CREATED)
+    ]
+    session.add_all(bids)
+    await session.flush()
+    for i, bid in enumerate(bids):
+        session.add(BidHistory(bid_id=bid.id, name=f"bid {i}", description="", history_number=1))
+    await session.commit()
+
+    return {"tenders": tenders, "bids": bids}
+
+
+def parse_ndjson(content: bytes) -> list[dict]:
+    assert content.endswith(b"\n")
+
+    return [json.loads(line) for line in content.splitlines()]
+
+
+class TestExport:
+    async def test_export_tenders(self, client, entities, monkeypatch):
+        monkeypatch.setenv("EXPORT_BATCH_SIZE", "2")
+        response = await client.get("/api/tenders/export")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        exported = parse_ndjson(response.content)
+        published = sorted(entities["tenders"][:5], key=lambda tender: tender.id)
+        assert [tender["id"] for tender in exported] == [str(tender.id) for tender in published]
+        assert {tender["version"] for tender in exported} == {2}
+        assert all(tender["name"].endswith("v2") for tender in exported)
+
+        listed = (await client.get("/api/tenders", params={"limit": 10})).json()
+        assert sorted(exported, key=lambda tender: tender["id"]) == sorted(listed, key=lambda tender: tender["id"])
+
+    async def test_export_tenders_by_service_type(self, client, entities):
+        response = await client.get("/api/tenders/export", params={"service_type": "Construction"})
+        assert (response.status_code, response.content) == (status.HTTP_200_OK, b"")
+
+    @pytest.mark.parametrize("username, names", [("alice", ["bid 0", "bid 1"]), ("bob", ["bid 0", "bid 1"])])
+    async def test_export_bids(self, client, entities, username, names):
+        tender_id = entities["tenders"][0].id
+        response = await client.get(f"/api/bids/{tender_id}/export", params={"username": username})
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(bid["name"] for bid in parse_ndjson(response.content)) == names
+
+    async def test_export_bids_hides_drafts(self, client, entities, session):
+        session.add(Employee(username="carol"))
+        await session.commit()
+        tender_id = entities["tenders"][0].id
+        response = await client.get(f"/api/bids/{tender_id}/export", params={"username": "carol"})
+        assert [bid["name"] for bid in parse_ndjson(response.content)] == ["bid 0"]
+
+    async def test_export_bids_unknown_user(self, client, entities):
+        tender_id = entities["tenders"][0].id
+        response = await client.get(f"/api/bids/{tender_id}/export", params={"username": "nobody"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_abandoned_stream_releases_connection(self, entities, engine_async):
+        stream = stream_ndjson(async_sessionmaker(engine_async), select_exported_tenders(None), make_tender, 1)
+        first = await anext(stream)
+        assert len(parse_ndjson(first)) == 1
+        assert engine_async.pool.checkedout() == 1
+
+        await stream.aclose()
+        assert engine_async.pool.checkedout() == 0
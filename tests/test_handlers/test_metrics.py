@@ -0,0 +1,61 @@
+from uuid import uuid4
+
+import pytest
+from starlette import status
+
+from tenders.utils.common import METRICS_MEDIA_TYPE, REQUEST_METRICS
+
+
+@pytest.fixture(name="metrics_client")
+def get_metrics_client(client):
+    """
+    Клиент приложения со сброшенными счетчиками запросов.
+    """
+    REQUEST_METRICS.clear()
+    return client
+
+
+async def scrape(client) -> dict[str, float]:
+    response = await client.get("/api/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == METRICS_MEDIA_TYPE
+
+    samples = {}
+    for line in response.text.splitlines():
+        if not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+
+    return samples
+
+
+async def test_requests_are_counted_by_route(metrics_client):
+    await metrics_client.get("/api/tenders")
+    await metrics_client.get("/api/tenders", params={"limit": -1})
+    await metrics_client.get(f"/api/tenders/{uuid4()}/status")
+    await metrics_client.get("/api/unknown")
+
+    samples = await scrape(metrics_client)
+
+    assert samples['tenders_http_requests_total{method="GET",route="/api/tenders",status="200"}'] == 1
+    assert samples['tenders_http_requests_total{method="GET",route="/api/tenders",status="400"}'] == 1
+    assert (
+        samples['tenders_http_requests_total{method="GET",route="/api/tenders/{tender_id}/status",status="404"}'] == 1
+    )
+    assert samples['tenders_http_requests_total{method="GET",route="unmatched",status="404"}'] == 1
+    assert samples['tenders_http_request_duration_seconds_count{method="GET",route="/api/tenders"}'] == 2
+    assert samples['tenders_http_request_duration_seconds_bucket{method="GET",route="/api/tenders",le="+Inf"}'] == 2
+    assert samples["tenders_http_requests_in_flight"] == 1
+
+
+async def test_pool_and_cache_metrics(metrics_client):
+    await metrics_client.get("/api/tenders/my", params={"username": "nobody"})
+    await metrics_client.get("/api/tenders/my", params={"username": "nobody"})
+
+    samples = await scrape(metrics_client)
+
+    assert samples['tenders_db_pool_checked_out{engine="primary"}'] == 0
+    assert samples['tenders_db_pool_idle{engine="primary"}'] >= 1
+    assert 'tenders_db_pool_overflow{engine="primary"}' in samples
+    assert samples['tenders_cache_hits_total{cache="employee_unknown"}'] == 1
+    assert samples['tenders_cache_hit_ratio{cache="employee_unknown"}'] > 0
@@ -0,0 +1,102 @@
+from base64 import urlsafe_b64encode
+from math import ceil
+
+import pytest
+from sqlalchemy import insert
+from starlette import status
+
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+
+
+NAMES = ["b", "B", "a", "Ä", "same", "same", "same"]
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> dict:
+    """
+    Опубликованные тендеры alice и ее заявки на первый из них с именами, порядок которых зависит от сортировки,
+    и повторяющимися именами. Первая версия каждой сущности называется иначе, чем последняя.
+    """
+    alice = Employee(username="alice")
+    session.add(alice)
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add(OrganizationResponsible(organization_id=organization_id, user_id=alice.id))
+    tenders = [
+        Tender(organization_id=organization_id, status=TenderStatus.PUBLISHED, creator_id=alice.id) for _ in NAMES
+    ]
+    session.add_all(tenders)
+    await session.flush()
+    bids = [
+        Bid(tender_id=tenders[0].id, status=BidStatus.PUBLISHED, creator_type=CreatorType.USER, creator_id=alice.id)
+        for _ in NAMES
+    ]
+    session.add_all(bids)
+    await session.flush()
+    for tender, bid, name in zip(tenders, bids, NAMES):
+        for number, version_name in enumerate(["~old", name], start=1):
+            session.add(
+                TenderHistory(
+                    tender_id=tender.id,
+                    name=version_name,
+                    description="",
+                    service_type=ServiceType.DELIVERY,
+                    history_number=number,
+                )
+            )
+            session.add(BidHistory(bid_id=bid.id, name=version_name, description="", history_number=number))
+    await session.commit()
+
+    def ordered(entities: list) -> list[str]:
+        return [str(entity.id) for _, entity in sorted(zip(NAMES, entities), key=lambda x: (x[0].encode(), x[1].id))]
+
+    return {"tender": tenders[0].id, "tenders": ordered(tenders), "bids": ordered(bids)}
+
+
+URLS = [
+    ("/api/tenders", "tenders"),
+    ("/api/tenders/my", "tenders"),
+    ("/api/bids/my", "bids"),
+    ("/api/bids/{tender_id}/list", "bids"),
+]
+
+
+@pytest.mark.parametrize("url, kind", URLS)
+@pytest.mark.parametrize("limit", [1, 3, len(NAMES)])
+async def test_cursor_walks_every_item_once_in_name_order(client, entities, url, kind, limit):
+    url, ids, cursor, pages = url.format(tender_id=entities["tender"]), [], "", 0
+    while cursor is not None:
+        response = await client.get(url, params={"username": "alice", "limit": limit, "cursor": cursor})
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        ids.extend(item["id"] for item in page["items"])
+        cursor, pages = page["next_cursor"], pages + 1
+        assert len(page["items"]) == limit or cursor is None
+
+    assert ids == entities[kind]
+    assert pages == ceil(len(NAMES) / limit)
+
+
+@pytest.mark.parametrize("url, kind", URLS)
+@pytest.mark.parametrize("limit", [0, -1])
+async def test_cursor_pages_require_positive_limit(client, entities, url, kind, limit):
+    url = url.format(tender_id=entities["tender"])
+    response = await client.get(url, params={"username": "alice", "limit": limit, "cursor": ""})
+    assert (response.status_code, response.json()) == (status.HTTP_400_BAD_REQUEST, {"reason": "invalid limit"})
+
+
+@pytest.mark.parametrize("url, kind", URLS)
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "%%%",
+        urlsafe_b64encode(b"not json").decode(),
+        urlsafe_b64encode(b'["a"]').decode(),
+        urlsafe_b64encode(b'["a", "not uuid"]').decode(),
+    ],
+)
+async def test_malformed_cursor_is_rejected(client, entities, url, kind, cursor):
+    url = url.format(tender_id=entities["tender"])
+    response = await client.get(url, params={"username": "alice", "limit": 1, "cursor": cursor})
+    assert (response.status_code, response.json()) == (status.HTTP_400_BAD_REQUEST, {"reason": "invalid cursor"})
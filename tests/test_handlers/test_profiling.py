@@ -0,0 +1,79 @@
+import pytest
+from starlette import status
+
+from tenders.utils.common import ADMIN_TOKEN_HEADER, PROFILE_HEADER, PROFILE_ID_HEADER, get_admin_token, get_profiles
+
+
+ADMIN_HEADERS = {ADMIN_TOKEN_HEADER: "secret"}
+
+
+@pytest.fixture(name="profiling")
+def get_profiling(monkeypatch):
+    """
+    Включает профилирование запросов по заголовку или флагу в строке запроса.
+    """
+    monkeypatch.setenv("PROFILING_ENABLED", "true")
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    get_profiles.cache_clear()
+    get_admin_token.cache_clear()
+    yield
+    monkeypatch.undo()
+    get_profiles.cache_clear()
+    get_admin_token.cache_clear()
+
+
+async def get_profile(client, profile_id: str, **params):
+    return await client.get(f"/api/admin/profiles/{profile_id}", params=params, headers=ADMIN_HEADERS)
+
+
+@pytest.mark.parametrize(
+    "params, headers",
+    [({}, {PROFILE_HEADER: "1", **ADMIN_HEADERS}), ({"profile": ""}, ADMIN_HEADERS)],
+)
+async def test_profile_is_stored(profiling, client, params, headers):
+    response = await client.get("/api/tenders", params=params, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    profile_id = response.headers[PROFILE_ID_HEADER]
+
+    response = await get_profile(client, profile_id)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert "ProfilingMiddleware.__call__" in response.text
+
+    response = await get_profile(client, profile_id, format="speedscope")
+    assert response.status_code == status.HTTP_200_OK
+    speedscope = response.json()
+    (profile,) = speedscope["profiles"]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"]) == len(lines)
+    assert {index for sample in profile["samples"] for index in sample} == set(
+        range(len(speedscope["shared"]["frames"]))
+    )
+
+
+@pytest.mark.parametrize("headers", [{PROFILE_HEADER: "1"}, {PROFILE_HEADER: "1", ADMIN_TOKEN_HEADER: "wrong"}, {}])
+async def test_request_is_not_profiled(profiling, client, headers):
+    response = await client.get("/api/tenders", params={"myprofile": ""}, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert PROFILE_ID_HEADER not in response.headers
+
+
+async def test_profiling_is_disabled_by_default(client):
+    response = await client.get("/api/tenders", headers={PROFILE_HEADER: "1", **ADMIN_HEADERS})
+    assert response.status_code == status.HTTP_200_OK
+    assert PROFILE_ID_HEADER not in response.headers
+
+
+@pytest.mark.parametrize(
+    "params, headers, code, reason",
+    [
+        ({}, {}, status.HTTP_403_FORBIDDEN, "not enough rights"),
+        ({"format": "pstats"}, ADMIN_HEADERS, status.HTTP_400_BAD_REQUEST, "invalid format"),
+        ({}, ADMIN_HEADERS, status.HTTP_404_NOT_FOUND, "profile was not found"),
+    ],
+)
+async def test_get_profile_errors(profiling, client, params, headers, code, reason):
+    response = await client.get("/api/admin/profiles/unknown", params=params, headers=headers)
+    assert (response.status_code, response.json()) == (code, {"reason": reason})
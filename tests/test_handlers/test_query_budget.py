@@ -0,0 +1,109 @@
+import pytest
+from sqlalchemy import insert
+from starlette import status
+
+from tests.utils import assert_query_budget
+
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+from tenders.utils.common.search import INSTALLED_EXTENSIONS
+from tenders.utils.employee_cache import get_employee_cache
+from tenders.utils.membership import get_membership_index
+
+
+@pytest.fixture(name="seed")
+async def get_seed(migrated_postgres, session):
+    """
+    Возвращает функцию, которая добавляет опубликованные тендеры организации alice с двумя версиями
+    и заявками bob на каждый из них.
+    """
+    alice, bob = Employee(username="alice"), Employee(username="bob")
+    session.add_all([alice, bob])
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add(OrganizationResponsible(organization_id=organization_id, user_id=alice.id))
+    await session.commit()
+    tender_ids = []
+
+    async def seed(count: int) -> list:
+        for _ in range(count):
+            tender = Tender(organization_id=organization_id, status=TenderStatus.PUBLISHED, creator_id=alice.id)
+            session.add(tender)
+            await session.flush()
+            for version in (1, 2):
+                session.add(
+                    TenderHistory(
+                        tender_id=tender.id,
+                        name=f"tender {len(tender_ids)}",
+                        description="",
+                        service_type=ServiceType.DELIVERY,
+                        history_number=version,
+                    )
+                )
+            bid = Bid(tender_id=tender.id, status=BidStatus.PUBLISHED, creator_type=CreatorType.USER, creator_id=bob.id)
+            session.add(bid)
+            await session.flush()
+            session.add(BidHistory(bid_id=bid.id, name="bid", description="", history_number=1))
+            tender_ids.append(tender.id)
+        await session.commit()
+
+        return tender_ids
+
+    return seed
+
+
+@pytest.fixture(name="query_stats_headers")
+def get_query_stats_headers(monkeypatch) -> None:
+    """
+    Включает заголовки X-DB-*, по которым считаются запросы к базе данных.
+    """
+    monkeypatch.setenv("DB_QUERY_STATS_HEADERS", "true")
+
+
+def clear_caches() -> None:
+    INSTALLED_EXTENSIONS.clear()
+    for cache in (get_employee_cache(), get_membership_index()):
+        if cache is not None:
+            cache.clear()
+
+
+ENDPOINTS = [
+    ("/api/tenders", {"limit": 50}, 1),
+    ("/api/tenders", {"limit": 50, "cursor": ""}, 1),
+    ("/api/tenders/my", {"username": "alice", "limit": 50}, 2),
+    ("/api/tenders/search", {"q": "tender", "limit": 50}, 1),
+    ("/api/tenders/suggest", {"prefix": "tender", "limit": 50}, 2),
+    ("/api/bids/my", {"username": "bob", "limit": 50}, 2),
+    ("/api/bids/search", {"username": "bob", "q": "bid", "limit": 50}, 2),
+    ("/api/bids/{tender_id}/list", {"username": "alice", "limit": 50}, 3),
+    ("/api/tenders/{tender_id}/status", {"username": "alice"}, 3),
+]
+
+
+@pytest.mark.parametrize("url, params, budget", ENDPOINTS)
+async def test_query_budget_does_not_grow_with_data(query_stats_headers, client, seed, url, params, budget):
+    queries = []
+    for count in (1, 30):
+        tender_ids = await seed(count)
+        clear_caches()
+        response = await client.get(url.format(tender_id=tender_ids[0]), params=params)
+        assert response.status_code == status.HTTP_200_OK
+        queries.append(assert_query_budget(response, budget))
+
+    assert queries[0] == queries[1]
+
+
+async def test_db_headers(query_stats_headers, client, seed):
+    await seed(3)
+    response = await client.get("/api/tenders", params={"limit": 2})
+
+    assert (response.headers["x-db-queries"], response.headers["x-db-rows"]) == ("1", "2")
+    assert float(response.headers["x-db-time"]) > 0
+
+
+async def test_db_headers_are_off_by_default(client, seed):
+    await seed(3)
+    response = await client.get("/api/tenders", params={"limit": 2})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not [name for name in response.headers if name.startswith("x-db-")]
@@ -0,0 +1,101 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette import status
+
+from tenders.db.connection import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER
+
+
+USERS = [
+    "INSERT INTO employee (id, username) VALUES (:user_id, 'alice')",
+    "INSERT INTO organization (id, name) VALUES (:organization_id, 'own')",
+    "INSERT INTO organization_responsible (organization_id, user_id) VALUES (:organization_id, :user_id)",
+]
+
+TENDER = [
+    "INSERT INTO tender (id, organization_id, status, creator_id) VALUES (:tender_id, :organization_id, 'CREATED', :user_id)",
+    """
+    INSERT INTO tender_history (tender_id, name, description, service_type, history_number)
+    VALUES (:tender_id, 'tender', 'not replicated yet', 'DELIVERY', 1)
+    """,
+]
+
+
+@pytest.fixture(name="params")
+async def get_params(postgres, replica_postgres):
+    """
+    Пользователи есть в обеих базах, а тендер - только на основной, как при отставании реплики.
+    """
+    params = {"user_id": uuid4(), "organization_id": uuid4(), "tender_id": uuid4()}
+    for database_uri, statements in ((postgres, USERS + TENDER), (replica_postgres, USERS)):
+        engine = create_async_engine(database_uri)
+        async with engine.begin() as connection:
+            for statement in statements:
+                await connection.execute(text(statement), params)
+        await engine.dispose()
+
+    return params
+
+
+@pytest.fixture(name="tender_id")
+def get_tender_id(params):
+    """
+    Тендер, который есть только на основной базе.
+    """
+    return params["tender_id"]
+
+
+class TestReplicaRouting:
+    async def test_reads_go_to_replica(self, replica_postgres, client, tender_id):
+        response = await client.get("/api/tenders/my", params={"username": "alice"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+        response = await client.get("/api/tenders/my", params={"username": "alice"}, headers={READ_PRIMARY_HEADER: "1"})
+        assert [tender["id"] for tender in response.json()] == [str(tender_id)]
+
+    async def test_writer_reads_own_writes(self, replica_postgres, client, tender_id):
+        response = await client.put(
+            f"/api/tenders/{tender_id}/status", params={"username": "alice", "status": "Published"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await client.get("/api/tenders/my", params={"username": "alice"})
+        assert [tender["status"] for tender in response.json()] == ["Published"]
+
+        client.cookies.clear()
+        response = await client.get("/api/tenders/my", params={"username": "alice"})
+        assert [tender["status"] for tender in response.json()] == ["Published"]
+
+        response = await client.get("/api/tenders")
+        assert response.json() == []
+
+    async def test_failed_write_does_not_pin_writer(self, replica_postgres, client, tender_id):
+        response = await client.put(
+            f"/api/tenders/{uuid4()}/status", params={"username": "alice", "status": "Published"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert READ_PRIMARY_COOKIE not in response.cookies
+
+        response = await client.get("/api/tenders/my", params={"username": "alice"})
+        assert response.json() == []
+
+    async def test_creator_reads_created_tender(self, replica_postgres, client, params):
+        response = await client.post(
+            "/api/tenders/new",
+            json={
+                "name": "created",
+                "description": "not replicated yet",
+                "serviceType": "Delivery",
+                "organizationId": str(params["organization_id"]),
+                "creatorUsername": "alice",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert READ_PRIMARY_COOKIE in response.cookies
+        created_id = response.json()["id"]
+
+        response = await client.get("/api/tenders/my", params={"username": "alice"})
+        assert created_id in [tender["id"] for tender in response.json()]
@@ -0,0 +1,125 @@
+import pytest
+from sqlalchemy import insert
+from starlette import status
+
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+
+
+TENDERS = [
+    ("Доставка цемента", "Нужна машина на десять тонн", TenderStatus.PUBLISHED),
+    ("Ремонт офиса", "Покраска стен, доставка материалов за счет подрядчика", TenderStatus.PUBLISHED),
+    ("Cement supplies", "Portland cement for the new warehouse", TenderStatus.PUBLISHED),
+    ("Доставка кирпича", "Черновик", TenderStatus.CREATED),
+]
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> dict:
+    """
+    Тендеры организации alice на русском и английском языках и заявка bob на первый из них.
+    """
+    alice, bob = Employee(username="alice"), Employee(username="bob")
+    session.add_all([alice, bob, Employee(username="carol")])
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add(OrganizationResponsible(organization_id=organization_id, user_id=alice.id))
+    tenders = [Tender(organization_id=organization_id, status=status, creator_id=alice.id) for *_, status in TENDERS]
+    session.add_all(tenders)
+    await session.flush()
+    for tender, (name, description, _) in zip(tenders, TENDERS):
+        session.add(
+            TenderHistory(
+                tender_id=tender.id,
+                name=name,
+                description=description,
+                service_type=ServiceType.DELIVERY,
+                history_number=1,
+            )
+        )
+    bid = Bid(tender_id=tenders[0].id, status=BidStatus.CREATED, creator_type=CreatorType.USER, creator_id=bob.id)
+    session.add(bid)
+    await session.flush()
+    session.add(BidHistory(bid_id=bid.id, name="Доставим за сутки", description="Свой грузовик", history_number=1))
+    await session.commit()
+
+    return {"tenders": [tender.id for tender in tenders], "bid": bid.id}
+
+
+async def search_tenders(client, q: str, **params) -> list[str]:
+    response = await client.get("/api/tenders/search", params={"q": q, **params})
+    assert response.status_code == status.HTTP_200_OK
+
+    return [tender["name"] for tender in response.json()]
+
+
+class TestTenderSearch:
+    @pytest.mark.parametrize(
+        "q, names",
+        [
+            ("доставки", ["Доставка цемента", "Ремонт офиса"]),
+            ("цемент", ["Доставка цемента"]),
+            ("cements", ["Cement supplies"]),
+            ("warehouses", ["Cement supplies"]),
+            ('"доставка материалов"', ["Ремонт офиса"]),
+            ("доставка -цемент", ["Ремонт офиса"]),
+            ("офис or склад", ["Ремонт офиса"]),
+            ("кирпич", []),
+            ("и", []),
+        ],
+    )
+    async def test_search(self, client, entities, q, names):
+        assert await search_tenders(client, q) == names
+
+    async def test_pagination(self, client, entities):
+        assert await search_tenders(client, "доставка", limit=1) == ["Доставка цемента"]
+        assert await search_tenders(client, "доставка", limit=1, offset=1) == ["Ремонт офиса"]
+        assert await search_tenders(client, "доставка", service_type="Construction") == []
+
+    async def test_new_versions_are_searchable(self, client, entities):
+        tender_id = entities["tenders"][0]
+        params = {"username": "alice"}
+        response = await client.patch(f"/api/tenders/{tender_id}/edit", params=params, json={"name": "Вывоз мусора"})
+        assert response.status_code == status.HTTP_200_OK
+
+        assert await search_tenders(client, "мусор") == ["Вывоз мусора"]
+        assert await search_tenders(client, "цемента") == []
+
+        response = await client.put(f"/api/tenders/{tender_id}/rollback/1", params=params)
+        assert response.status_code == status.HTTP_200_OK
+
+        assert await search_tenders(client, "мусор") == []
+        assert await search_tenders(client, "цемента") == ["Доставка цемента"]
+
+    @pytest.mark.parametrize(
+        "params, reason",
+        [({"q": " "}, "invalid query"), ({"q": "a", "limit": -1}, "invalid limit")],
+    )
+    async def test_invalid_params(self, client, entities, params, reason):
+        response = await client.get("/api/tenders/search", params=params)
+        assert (response.status_code, response.json()) == (status.HTTP_400_BAD_REQUEST, {"reason": reason})
+
+
+class TestBidSearch:
+    @pytest.mark.parametrize(
+        "username, names",
+        [("bob", ["Доставим за сутки"]), ("alice", ["Доставим за сутки"]), ("carol", [])],
+    )
+    async def test_search_visible_bids(self, client, entities, username, names):
+        response = await client.get("/api/bids/search", params={"username": username, "q": "грузовики"})
+        assert response.status_code == status.HTTP_200_OK
+        assert [bid["name"] for bid in response.json()] == names
+
+    async def test_edited_bid_is_searchable(self, client, entities):
+        params = {"username": "bob"}
+        response = await client.patch(f"/api/bids/{entities['bid']}/edit", params=params, json={"description": "Фура"})
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await client.get("/api/bids/search", params={**params, "q": "грузовик"})
+        assert response.json() == []
+        response = await client.get("/api/bids/search", params={**params, "q": "фуры"})
+        assert [bid["version"] for bid in response.json()] == [2]
+
+    async def test_unknown_user(self, client, entities):
+        response = await client.get("/api/bids/search", params={"username": "nobody", "q": "доставка"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
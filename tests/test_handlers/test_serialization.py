@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import insert
+from starlette import status
+
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+from tenders.utils.common import is_fast_serialization_enabled
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> None:
+    """
+    Три опубликованных тендера организации alice с юникодом в описании и заявки alice на каждый из них.
+    """
+    alice = Employee(username="alice")
+    session.add(alice)
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add(OrganizationResponsible(organization_id=organization_id, user_id=alice.id))
+    tenders = [
+        Tender(organization_id=organization_id, status=TenderStatus.PUBLISHED, creator_id=alice.id) for _ in "abc"
+    ]
+    session.add_all(tenders)
+    await session.flush()
+    for name, tender in zip("abc", tenders):
+        session.add(
+            TenderHistory(
+                tender_id=tender.id,
+                name=name,
+                description='Доставка "под ключ"\n',
+                service_type=ServiceType.DELIVERY,
+                history_number=1,
+            )
+        )
+        bid = Bid(tender_id=tender.id, status=BidStatus.CREATED, creator_type=CreatorType.USER, creator_id=alice.id)
+        session.add(bid)
+        await session.flush()
+        session.add(BidHistory(bid_id=bid.id, name=name, description="", history_number=1))
+    await session.commit()
+
+
+@pytest.fixture(name="fast_serialization")
+def set_fast_serialization(monkeypatch):
+    """
+    Включает быстрый путь сериализации на время теста.
+    """
+    monkeypatch.setenv("FAST_SERIALIZATION", "true")
+    is_fast_serialization_enabled.cache_clear()
+    yield
+    monkeypatch.undo()
+    is_fast_serialization_enabled.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "url, params",
+    [
+        ("/api/tenders", {}),
+        ("/api/tenders", {"limit": 2, "cursor": ""}),
+        ("/api/tenders/my", {"username": "alice"}),
+        ("/api/bids/my", {"username": "alice", "limit": 2, "cursor": ""}),
+    ],
+)
+async def test_fast_serialization_is_identical(client, entities, url, params, request):
+    response = await client.get(url, params=params)
+    assert response.status_code == status.HTTP_200_OK
+
+    request.getfixturevalue("fast_serialization")
+    assert is_fast_serialization_enabled()
+    fast_response = await client.get(url, params=params)
+
+    assert fast_response.status_code == status.HTTP_200_OK
+    assert fast_response.content == response.content
+    assert fast_response.headers["content-type"] == response.headers["content-type"]
+    assert fast_response.headers["etag"] == response.headers["etag"]
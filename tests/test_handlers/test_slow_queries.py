@@ -0,0 +1,116 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, insert, select, text, update
+from sqlalchemy.dialects import postgresql
+from starlette import status
+
+from tenders.db.connection import SessionManager
+from tenders.db.models import Employee
+from tenders.utils.common import ADMIN_TOKEN_HEADER, get_admin_token, get_slow_query_log
+from tenders.utils.common.slow_queries import is_read_only, redact_parameters, redact_plan
+
+
+@pytest.fixture(name="slow_query_log")
+def get_slow_query_log_fixture(monkeypatch):
+    """
+    Включает журнал медленных запросов, в который попадает каждый запрос и для каждого снимается план.
+    """
+    monkeypatch.setenv("SLOW_QUERY_THRESHOLD", "0")
+    monkeypatch.setenv("SLOW_QUERY_EXPLAIN_RATE", "1")
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    get_slow_query_log.cache_clear()
+    get_admin_token.cache_clear()
+    yield
+    monkeypatch.undo()
+    get_slow_query_log.cache_clear()
+    get_admin_token.cache_clear()
+
+
+async def get_slow_queries(client, token: str | None = "secret"):
+    headers = {ADMIN_TOKEN_HEADER: token} if token is not None else {}
+    return await client.get("/api/admin/slow_queries", headers=headers)
+
+
+async def test_slow_queries_are_logged_with_route_and_plan(slow_query_log, client):
+    response = await client.get("/api/tenders/my", params={"username": "private-name"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    await asyncio.gather(*get_slow_query_log().explains)
+
+    response = await get_slow_queries(client)
+    assert response.status_code == status.HTTP_200_OK
+    assert "private-name" not in response.text
+    (entry,) = response.json()
+    assert entry["route"] == "GET /api/tenders/my"
+    assert entry["statement"].lstrip().startswith("SELECT")
+    assert entry["parameters"] == ["str"]
+    assert entry["duration"] >= 0
+    assert "Execution Time" in entry["plan"]
+
+
+async def test_explain_does_not_write(slow_query_log, client, session):
+    session.add(Employee(username="alice"))
+    await session.commit()
+    entry = {"statement": "", "plan": None}
+
+    statement = "WITH deleted AS (DELETE FROM employee RETURNING id) SELECT count(*) FROM deleted"
+    await get_slow_query_log().explain(SessionManager().engine, statement, (), entry)
+
+    assert entry["plan"] is None
+    assert await session.scalar(select(func.count()).select_from(Employee)) == 1
+
+
+async def test_writes_are_not_explained(slow_query_log, client):
+    new_employee = insert(Employee).values(username="alice").returning(Employee.id).cte("new_employee")
+    async with SessionManager().engine.begin() as connection:
+        await connection.execute(select(new_employee.c.id))
+
+    assert not get_slow_query_log().explains
+    (entry,) = [entry for entry in get_slow_query_log().entries if "new_employee" in entry["statement"]]
+    assert entry["plan"] is None
+
+
+@pytest.mark.parametrize(
+    "statement, read_only",
+    [
+        (select(Employee.id), True),
+        (insert(Employee).values(username="alice"), False),
+        (update(Employee).values(username="alice"), False),
+        (select(insert(Employee).values(username="alice").returning(Employee.id).cte("new_employee").c.id), False),
+        (text("SELECT 1"), False),
+    ],
+)
+def test_only_read_only_statements_are_explained(statement, read_only):
+    compiled = statement.compile(dialect=postgresql.dialect())
+    context = SimpleNamespace(
+        compiled=compiled, isinsert=compiled.isinsert, isupdate=compiled.isupdate, isdelete=compiled.isdelete
+    )
+
+    assert is_read_only(context) == read_only
+
+
+def test_plan_constants_are_redacted():
+    plan = """Limit  (cost=0.29..8.31 rows=1 width=16) (actual time=0.010..0.011 rows=1 loops=1)
+  ->  Index Scan using ix__bid__tender_id on bid  (cost=0.29..8.31 rows=1 width=16)
+        Index Cond: (tender_id = 'e3b0c442-98fc-1c14-9afb-f4c8996fb924'::uuid)
+        Filter: ((approved_num >= 3) AND (tender_history_1.history_number > $1) AND (amount < 12.5))
+Execution Time: 0.031 ms"""
+
+    assert redact_plan(plan).splitlines()[2:] == [
+        "        Index Cond: (tender_id = '?'::uuid)",
+        "        Filter: ((approved_num >= ?) AND (tender_history_1.history_number > $1) AND (amount < ?))",
+        "Execution Time: 0.031 ms",
+    ]
+    assert redact_plan(plan).splitlines()[0] == plan.splitlines()[0]
+
+
+def test_parameters_are_redacted():
+    assert redact_parameters(("alice", 1, None), False) == ["str", "int", "NoneType"]
+    assert redact_parameters([("alice",), ("bob",)], True) == ["2 rows", "str"]
+
+
+@pytest.mark.parametrize("token", [None, "", "wrong"])
+async def test_slow_queries_require_admin_token(slow_query_log, client, token):
+    response = await get_slow_queries(client, token)
+    assert (response.status_code, response.json()) == (status.HTTP_403_FORBIDDEN, {"reason": "not enough rights"})
@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import insert
+from starlette import status
+
+from tests.utils import count_statements
+
+from tenders.db.connection import SessionManager
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> dict:
+    """
+    Опубликованный тендер организации alice с двумя версиями и опубликованная заявка bob на него.
+    """
+    alice, bob = Employee(username="alice"), Employee(username="bob")
+    session.add_all([alice, bob])
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add(OrganizationResponsible(organization_id=organization_id, user_id=alice.id))
+    tender = Tender(organization_id=organization_id, status=TenderStatus.PUBLISHED, creator_id=alice.id)
+    session.add(tender)
+    await session.flush()
+    for version in (1, 2):
+        session.add(
+            TenderHistory(
+                tender_id=tender.id,
+                name="tender",
+                description="",
+                service_type=ServiceType.DELIVERY,
+                history_number=version,
+            )
+        )
+    bid = Bid(tender_id=tender.id, status=BidStatus.PUBLISHED, creator_type=CreatorType.USER, creator_id=bob.id)
+    session.add(bid)
+    await session.flush()
+    session.add(BidHistory(bid_id=bid.id, name="bid", description="", history_number=1))
+    await session.commit()
+
+    return {"tender_id": tender.id, "bid_id": bid.id}
+
+
+STATUS_CHANGES = [
+    ("/api/tenders/{tender_id}/status", {"username": "alice", "status": "Closed"}, 3),
+    ("/api/bids/{bid_id}/status", {"username": "bob", "status": "Canceled"}, 5),
+    ("/api/bids/{bid_id}/submit_decision", {"username": "alice", "decision": "Approved"}, 6),
+]
+
+
+@pytest.mark.parametrize("url, params, budget", STATUS_CHANGES)
+async def test_status_change_statement_count(client, entities, url, params, budget):
+    with count_statements(SessionManager().engine) as statements:
+        response = await client.put(url.format(**entities), params=params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) == budget, statements
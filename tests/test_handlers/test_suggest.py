@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import insert
+from starlette import status
+
+from tenders.db.enums import ServiceType, TenderStatus
+from tenders.db.models import Employee, Organization, Tender, TenderHistory
+from tenders.utils.common import has_extension
+
+
+TENDERS = [
+    ("Доставка цемента", TenderStatus.PUBLISHED),
+    ("доставка кирпича", TenderStatus.PUBLISHED),
+    ("Cement supplies", TenderStatus.PUBLISHED),
+    ("100% pure sand", TenderStatus.PUBLISHED),
+    ("Доставка песка", TenderStatus.CREATED),
+]
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> None:
+    """
+    Тендеры организации alice, последний из них не опубликован.
+    """
+    alice = Employee(username="alice")
+    session.add(alice)
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    tenders = [Tender(organization_id=organization_id, status=status, creator_id=alice.id) for _, status in TENDERS]
+    session.add_all(tenders)
+    await session.flush()
+    for tender, (name, _) in zip(tenders, TENDERS):
+        session.add(
+            TenderHistory(
+                tender_id=tender.id, name=name, description="", service_type=ServiceType.DELIVERY, history_number=1
+            )
+        )
+    await session.commit()
+
+
+async def suggest(client, prefix: str, **params) -> list[str]:
+    response = await client.get("/api/tenders/suggest", params={"prefix": prefix, **params})
+    assert response.status_code == status.HTTP_200_OK
+
+    return [tender["name"] for tender in response.json()]
+
+
+class TestSuggest:
+    @pytest.mark.parametrize(
+        "prefix, names",
+        [
+            ("дост", ["доставка кирпича", "Доставка цемента"]),
+            ("ДОСТАВКА Ц", ["Доставка цемента"]),
+            ("CEM", ["Cement supplies"]),
+            ("100%", ["100% pure sand"]),
+            ("%%%", []),
+            ("___", []),
+        ],
+    )
+    async def test_prefix(self, client, entities, prefix, names):
+        assert await suggest(client, prefix) == names
+
+    async def test_limit(self, client, entities):
+        assert await suggest(client, "дост", limit=1) == ["доставка кирпича"]
+
+    async def test_typos(self, client, entities, session):
+        if not await has_extension("pg_trgm", session):
+            pytest.skip("pg_trgm is not available")
+
+        assert await suggest(client, "цимента") == ["Доставка цемента"]
+        assert await suggest(client, "suplies") == ["Cement supplies"]
+
+    @pytest.mark.parametrize(
+        "params, reason",
+        [
+            ({"prefix": " "}, "invalid prefix"),
+            ({"prefix": " ab "}, "invalid prefix"),
+            ({"prefix": "abc", "limit": -1}, "invalid limit"),
+        ],
+    )
+    async def test_invalid_params(self, client, entities, params, reason):
+        response = await client.get("/api/tenders/suggest", params=params)
+        assert (response.status_code, response.json()) == (status.HTTP_400_BAD_REQUEST, {"reason": reason})
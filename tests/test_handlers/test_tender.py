@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import insert, select
+from starlette import status
+
+from tenders.db.enums import ServiceType, TenderStatus
+from tenders.db.models import Employee, Organization, Tender, TenderHistory
+
+
+STATUSES = [TenderStatus.PUBLISHED, TenderStatus.CREATED, TenderStatus.PUBLISHED, TenderStatus.CLOSED]
+SERVICE_TYPES = list(ServiceType)
+FIELDS = ("id", "name", "description", "status", "serviceType", "version")
+
+
+@pytest.fixture(name="tenders")
+async def get_tenders(migrated_postgres, session) -> None:
+    """
+    Двенадцать тендеров в разных статусах с одной, двумя или тремя версиями. У каждой версии свой тип услуги,
+    а имена последних версий отличаются от первых и частично повторяются.
+    """
+    alice = Employee(username="alice")
+    session.add(alice)
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    for i in range(12):
+        tender = Tender(organization_id=organization_id, status=STATUSES[i % 4], creator_id=alice.id)
+        session.add(tender)
+        await session.flush()
+        versions = 1 + i % 3
+        for number in range(1, versions + 1):
+            name = ("same" if i % 5 == 0 else "Ab"[i % 2] + str((i * 7) % 12)) if number == versions else f"~v{number}"
+            session.add(
+                TenderHistory(
+                    tender_id=tender.id,
+                    name=name,
+                    description=f"tender {i} v{number}",
+                    service_type=SERVICE_TYPES[(i + number) % 3],
+                    history_number=number,
+                )
+            )
+    await session.commit()
+
+
+async def get_tenders_as_before(limit: int, offset: int, service_type: ServiceType | None, session) -> list[dict]:
+    """
+    Тендеры, выбранные как раньше: все опубликованные, последняя версия каждого, сортировка и фильтр в Python.
+    Порядок тендеров с одинаковыми именами раньше не был определен, здесь они упорядочены по id, как в запросе.
+    """
+    tenders = await session.scalars(select(Tender).where(Tender.status == TenderStatus.PUBLISHED))
+    result = []
+    for tender in tenders:
+        history = await session.scalars(select(TenderHistory).where(TenderHistory.tender_id == tender.id))
+        history = max(history, key=lambda x: x.history_number)
+        if service_type is None or history.service_type == service_type:
+            values = (
+                str(tender.id),
+                history.name,
+                history.description,
+                tender.status.value,
+                history.service_type.value,
+            )
+            result.append(dict(zip(FIELDS, [*values, history.history_number])))
+    result.sort(key=lambda x: (x["name"], x["id"]))
+
+    return result[offset : offset + limit]
+
+
+@pytest.mark.parametrize("service_type", [None, *SERVICE_TYPES])
+@pytest.mark.parametrize("limit, offset", [(5, 0), (3, 2), (100, 0), (2, 100), (0, 0)])
+async def test_tenders_match_python_filtering(client, session, tenders, service_type, limit, offset):
+    params = {"limit": limit, "offset": offset}
+    if service_type is not None:
+        params["service_type"] = service_type.value
+    response = await client.get("/api/tenders", params=params)
+    assert response.status_code == status.HTTP_200_OK
+
+    expected = await get_tenders_as_before(limit, offset, service_type, session)
+    assert [{key: tender[key] for key in FIELDS} for tender in response.json()] == expected
+    if limit == 100:
+        assert expected
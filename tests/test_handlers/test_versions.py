@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from sqlalchemy import insert, select
+from starlette import status
+
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+
+
+EDITORS = 20
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> dict:
+    """
+    Тендер организации alice и заявка alice на него, у обоих одна версия.
+    """
+    alice = Employee(username="alice")
+    session.add(alice)
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add(OrganizationResponsible(organization_id=organization_id, user_id=alice.id))
+    tender = Tender(organization_id=organization_id, status=TenderStatus.PUBLISHED, creator_id=alice.id)
+    session.add(tender)
+    await session.flush()
+    session.add(
+        TenderHistory(
+            tender_id=tender.id, name="v1", description="", service_type=ServiceType.DELIVERY, history_number=1
+        )
+    )
+    bid = Bid(tender_id=tender.id, status=BidStatus.CREATED, creator_type=CreatorType.USER, creator_id=alice.id)
+    session.add(bid)
+    await session.flush()
+    session.add(BidHistory(bid_id=bid.id, name="v1", description="", history_number=1))
+    await session.commit()
+
+    return {"tender": tender.id, "bid": bid.id}
+
+
+async def get_history_numbers(session, key, entity_id) -> list[int]:
+    query = select(key.class_.history_number).where(key == entity_id).order_by(key.class_.history_number)
+
+    return list(await session.scalars(query))
+
+
+class TestVersionAppend:
+    async def test_concurrent_tender_edits(self, client, session, entities):
+        responses = await asyncio.gather(
+            *(
+                client.patch(
+                    f"/api/tenders/{entities['tender']}/edit", params={"username": "alice"}, json={"name": f"edit {i}"}
+                )
+                for i in range(EDITORS)
+            )
+        )
+        assert {response.status_code for response in responses} == {status.HTTP_200_OK}
+        assert sorted(response.json()["version"] for response in responses) == list(range(2, EDITORS + 2))
+        assert await get_history_numbers(session, TenderHistory.tender_id, entities["tender"]) == list(
+            range(1, EDITORS + 2)
+        )
+
+    async def test_concurrent_bid_edits_and_rollbacks(self, client, session, entities):
+        url = f"/api/bids/{entities['bid']}"
+        responses = await asyncio.gather(
+            *(
+                client.patch(f"{url}/edit", params={"username": "alice"}, json={"name": f"edit {i}"})
+                if i % 2
+                else client.put(f"{url}/rollback/1", params={"username": "alice"})
+                for i in range(EDITORS)
+            )
+        )
+        assert {response.status_code for response in responses} == {status.HTTP_200_OK}
+        assert sorted(response.json()["version"] for response in responses) == list(range(2, EDITORS + 2))
+        assert {response.json()["name"] for response in responses if response.request.method == "PUT"} == {"v1"}
+        assert await get_history_numbers(session, BidHistory.bid_id, entities["bid"]) == list(range(1, EDITORS + 2))
+
+    async def test_tender_rollback(self, client, entities):
+        url = f"/api/tenders/{entities['tender']}"
+        response = await client.patch(f"{url}/edit", params={"username": "alice"}, json={"serviceType": "Construction"})
+        assert response.json()["version"] == 2
+        assert (response.json()["name"], response.json()["serviceType"]) == ("v1", "Construction")
+
+        response = await client.put(f"{url}/rollback/1", params={"username": "alice"})
+        assert response.status_code == status.HTTP_200_OK
+        assert (response.json()["version"], response.json()["serviceType"]) == (3, "Delivery")
+
+        response = await client.put(f"{url}/rollback/7", params={"username": "alice"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
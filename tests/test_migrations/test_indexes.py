@@ -0,0 +1,135 @@
+"""
+Checks that lookups from tenders/utils are served by indexes on a database of realistic size.
+"""
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+
+from tenders.db.enums import CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Feedback, FeedbackHistory, OrganizationResponsible, Tender, TenderHistory
+from tenders.utils.tender import select_prefixed_tenders
+from tenders.utils.tender_history import is_latest_version
+
+
+SCALE = 20_000
+
+SEED = [
+    "INSERT INTO employee (username) SELECT 'user_' || i FROM generate_series(1, :scale / 10) i",
+    "INSERT INTO organization (name) SELECT 'org_' || i FROM generate_series(1, :scale / 100) i",
+    """
+    INSERT INTO organization_responsible (organization_id, user_id)
+    SELECT o.id, e.id
+    FROM (SELECT id, row_number() OVER () AS rn FROM employee) e
+    JOIN (SELECT id, row_number() OVER () AS rn FROM organization) o ON o.rn = 1 + e.rn % (:scale / 100)
+    """,
+    """
+    INSERT INTO tender (organization_id, status, creator_id)
+    SELECT o.id, (CASE i % 20 WHEN 0 THEN 'CREATED' WHEN 1 THEN 'PUBLISHED' ELSE 'CLOSED' END)::tenderstatus, e.id
+    FROM generate_series(1, :scale) i
+    JOIN (SELECT id, row_number() OVER () AS rn FROM organization) o ON o.rn = 1 + i % (:scale / 100)
+    JOIN (SELECT id, row_number() OVER () AS rn FROM employee) e ON e.rn = 1 + i % (:scale / 10)
+    """,
+    """
+    INSERT INTO tender_history (tender_id, name, description, service_type, history_number)
+    SELECT t.id, 'tender ' || md5(t.id::text || v), 'description',
+        (ARRAY['CONSTRUCTION', 'DELIVERY', 'MANUFACTURE'])[1 + (abs(hashtext(t.id::text)) + v) % 3]::servicetype, v
+    FROM tender t, generate_series(1, 3) v
+    """,
+    """
+    INSERT INTO bid (tender_id, status, creator_type, creator_id)
+    SELECT t.id, 'CREATED', 'USER', t.creator_id FROM tender t, generate_series(1, 2)
+    """,
+    "INSERT INTO bid_history (bid_id, name, history_number) SELECT b.id, 'bid', v FROM bid b, generate_series(1, 3) v",
+    "INSERT INTO feedback (bid_id, creator_id) SELECT b.id, b.creator_id FROM bid b",
+    "INSERT INTO feedback_history (feedback_id, description, history_number) SELECT id, 'ok', 1 FROM feedback",
+    "ANALYZE",
+]
+
+
+def collect_indexes(plan: dict) -> set[str]:
+    indexes = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        indexes |= collect_indexes(child)
+
+    return indexes
+
+
+async def explain(session, query) -> set[str]:
+    # the dialect of the connection knows that the server does not escape backslashes in string literals
+    sql = query.compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True})
+    plan = await session.scalar(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return collect_indexes(plan[0]["Plan"])
+
+
+@pytest.fixture(name="seeded_session")
+async def get_seeded_session(migrated_postgres, session):
+    for statement in SEED:
+        await session.execute(text(statement), {"scale": SCALE})
+    await session.commit()
+
+    yield session
+
+
+def select_published_tenders():
+    return (
+        select(Tender, TenderHistory)
+        .join(TenderHistory, TenderHistory.tender_id == Tender.id)
+        .where(Tender.status == TenderStatus.PUBLISHED, is_latest_version(TenderHistory))
+        .order_by(TenderHistory.name.collate("C"), TenderHistory.tender_id)
+        .limit(5)
+    )
+
+
+HOT_QUERIES = [
+    (
+        select(TenderHistory).where(TenderHistory.tender_id == uuid4()).order_by(TenderHistory.history_number.desc()),
+        "ix__tender_history__tender_id_history_number",
+    ),
+    (select_published_tenders(), "ix__tender_history__name_tender_id"),
+    (
+        select_published_tenders().where(TenderHistory.service_type == ServiceType.CONSTRUCTION),
+        "ix__tender_history__service_type_name_tender_id",
+    ),
+    (select_prefixed_tenders("Tender AB", 10), "ix__tender_history__lower_name_tender_id"),
+    (select(Tender).where(Tender.status == TenderStatus.CREATED), "ix__tender__status"),
+    (select(Tender).where(Tender.creator_id == uuid4()), "ix__tender__creator_id"),
+    (select(Tender).where(Tender.organization_id == uuid4()), "ix__tender__organization_id"),
+    (select(Bid).where(Bid.tender_id == uuid4()), "ix__bid__tender_id"),
+    (
+        select(Bid).where(Bid.creator_id == uuid4(), Bid.creator_type == CreatorType.USER),
+        "ix__bid__creator_id_creator_type",
+    ),
+    (
+        select(BidHistory)
+        .where(BidHistory.bid_id.in_([uuid4(), uuid4()]))
+        .distinct(BidHistory.bid_id)
+        .order_by(BidHistory.bid_id, BidHistory.history_number.desc()),
+        "ix__bid_history__bid_id_history_number",
+    ),
+    (
+        select(Feedback).where(Feedback.bid_id == uuid4(), Feedback.creator_id == uuid4()),
+        "ix__feedback__bid_id_creator_id",
+    ),
+    (
+        select(FeedbackHistory).where(FeedbackHistory.feedback_id == uuid4()),
+        "ix__feedback_history__feedback_id_history_number",
+    ),
+    (
+        select(OrganizationResponsible).where(OrganizationResponsible.organization_id == uuid4()),
+        "ix__organization_responsible__organization_id_user_id",
+    ),
+    (
+        select(OrganizationResponsible).where(OrganizationResponsible.user_id == uuid4()),
+        "ix__organization_responsible__user_id",
+    ),
+]
+
+
+@pytest.mark.parametrize("query, index", HOT_QUERIES, ids=[index for _, index in HOT_QUERIES])
+async def test_hot_query_uses_index(seeded_session, query, index):
+    assert index in await explain(seeded_session, query)
@@ -0,0 +1,51 @@
+from uuid import uuid4
+
+from tenders.db.models import Employee
+from tenders.utils.employee_cache import MISSING, EmployeeCache
+
+
+def test_employee_is_cached_by_username_and_id():
+    cache = EmployeeCache(maxsize=10, ttl=60, negative_ttl=5)
+    employee = Employee(id=uuid4(), username="alice")
+    cache.set("username", "alice", employee)
+
+    assert cache.get("username", "alice") is employee
+    assert cache.get("id", employee.id) is employee
+
+
+def test_unknown_username_is_cached():
+    cache = EmployeeCache(maxsize=10, ttl=60, negative_ttl=5)
+    assert cache.get("username", "nobody") is MISSING
+
+    cache.set("username", "nobody", None)
+    assert cache.get("username", "nobody") is None
+
+    employee = Employee(id=uuid4(), username="nobody")
+    cache.set("id", employee.id, employee)
+    assert cache.get("username", "nobody") is employee
+
+
+def test_invalidate_drops_every_key_of_employee():
+    cache = EmployeeCache(maxsize=10, ttl=60, negative_ttl=5)
+    employee = Employee(id=uuid4(), username="alice")
+    cache.set("username", "alice", employee)
+
+    cache.invalidate("id", employee.id)
+
+    assert cache.get("username", "alice") is MISSING
+    assert cache.get("id", employee.id) is MISSING
+    assert cache.stats()["by_username"]["size"] == 0
+
+
+def test_each_lookup_counts_one_hit_or_miss():
+    cache = EmployeeCache(maxsize=10, ttl=60, negative_ttl=5)
+    employee = Employee(id=uuid4(), username="alice")
+    cache.set("username", "alice", employee)
+    cache.set("username", "nobody", None)
+
+    for username in ("alice", "nobody", "carol"):
+        cache.get("username", username)
+
+    stats = cache.stats()
+    assert (stats["by_username"]["hits"], stats["by_username"]["misses"]) == (1, 1)
+    assert (stats["unknown"]["hits"], stats["unknown"]["misses"]) == (1, 0)
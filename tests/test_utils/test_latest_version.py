@@ -0,0 +1,131 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select
+
+from tests.utils import count_statements
+
+from tenders.db.enums import BidStatus, CreatorType, ServiceType, TenderStatus
+from tenders.db.models import Bid, BidHistory, Employee, Organization, Tender, TenderHistory
+from tenders.utils import bid_history, tender_history
+from tenders.utils.common import LatestVersionLoader
+
+
+VERSIONS = [1, 3, 5]
+
+
+@pytest.fixture(name="entities")
+async def get_entities(migrated_postgres, session) -> dict:
+    """
+    Тендеры и заявки с одной, тремя и пятью версиями; последние из них откатываются к первой версии.
+    """
+    alice = Employee(username="alice")
+    session.add(alice)
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    tenders = [
+        Tender(organization_id=organization_id, status=TenderStatus.PUBLISHED, creator_id=alice.id) for _ in VERSIONS
+    ]
+    session.add_all(tenders)
+    await session.flush()
+    bids = [
+        Bid(tender_id=tender.id, status=BidStatus.CREATED, creator_type=CreatorType.USER, creator_id=alice.id)
+        for tender in tenders
+    ]
+    session.add_all(bids)
+    await session.flush()
+    for tender, bid, versions in zip(tenders, bids, VERSIONS):
+        names = [f"v{number}" for number in range(1, versions + 1)]
+        if versions > 1:
+            names.append("v1")  # откат к первой версии
+        for number, name in enumerate(names, start=1):
+            session.add(
+                TenderHistory(
+                    tender_id=tender.id,
+                    name=name,
+                    description="",
+                    service_type=ServiceType.DELIVERY,
+                    history_number=number,
+                )
+            )
+            session.add(BidHistory(bid_id=bid.id, name=name, description="", history_number=number))
+    await session.commit()
+
+    return {"tenders": [tender.id for tender in tenders], "bids": [bid.id for bid in bids]}
+
+
+@pytest.fixture(name="loader")
+def get_loader(session) -> LatestVersionLoader:
+    """
+    Загрузчик последних версий тендеров.
+    """
+    return LatestVersionLoader(TenderHistory.tender_id, session)
+
+
+async def get_max_versions(history, key, session) -> set[tuple]:
+    """
+    Последние версии, выбранные как раньше: все версии сущности и максимум по номеру.
+    """
+    latest = {}
+    for row in await session.scalars(select(history)):
+        entity_id = getattr(row, key)
+        if entity_id not in latest or row.history_number > latest[entity_id].history_number:
+            latest[entity_id] = row
+
+    return {(entity_id, row.history_number, row.name) for entity_id, row in latest.items()}
+
+
+@pytest.mark.parametrize(
+    "history, key, module",
+    [(TenderHistory, "tender_id", tender_history), (BidHistory, "bid_id", bid_history)],
+)
+async def test_anti_join_matches_max_version(session, entities, history, key, module):
+    query = select(getattr(history, key), history.history_number, history.name).where(module.is_latest_version(history))
+    latest = set(await session.execute(query))
+
+    assert latest == await get_max_versions(history, key, session)
+    assert sorted((number, name) for _, number, name in latest) == [(1, "v1"), (4, "v1"), (6, "v1")]
+
+
+async def test_loader_memoizes_versions(engine_async, loader, entities):
+    tender_id = entities["tenders"][1]
+    with count_statements(engine_async) as statements:
+        first = await loader.load(tender_id)
+        second = await loader.load(tender_id)
+
+    assert len(statements) == 1
+    assert first is second
+    assert (first.tender_id, first.history_number, first.name) == (tender_id, 4, "v1")
+
+
+async def test_loader_batches_keys_into_one_query(engine_async, loader, entities):
+    unknown_id = uuid4()
+    with count_statements(engine_async) as statements:
+        versions = await loader.load_many([*entities["tenders"], unknown_id])
+        assert await loader.load(entities["tenders"][0]) is versions[entities["tenders"][0]]
+        assert await loader.load(unknown_id) is None
+
+    assert len(statements) == 2
+    assert [versions[tender_id].history_number for tender_id in entities["tenders"]] == [1, 4, 6]
+    assert unknown_id not in versions
+
+
+async def test_loader_uses_primed_version(engine_async, loader, entities):
+    tender_id = entities["tenders"][2]
+    primed = TenderHistory(tender_id=tender_id, name="primed", history_number=7)
+    loader.prime(tender_id, primed)
+    with count_statements(engine_async) as statements:
+        assert await loader.load(tender_id) is primed
+
+    assert len(statements) == 0
+
+
+async def test_loader_reloads_cleared_version(engine_async, loader, entities):
+    tender_id = entities["tenders"][0]
+    loader.prime(tender_id, TenderHistory(tender_id=tender_id, name="stale", history_number=1))
+    loader.clear(tender_id)
+    with count_statements(engine_async) as statements:
+        assert (await loader.load(tender_id)).name == "v1"
+        await loader.load(tender_id)
+
+    assert len(statements) == 1
@@ -0,0 +1,88 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, insert
+from starlette import status
+
+from tenders.db.enums import ServiceType, TenderStatus
+from tenders.db.models import Employee, Organization, OrganizationResponsible, Tender, TenderHistory
+from tenders.utils.common import TTLCache
+from tenders.utils.membership import MembershipIndex
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def get_clock() -> Clock:
+    return Clock()
+
+
+def test_cache_expires_entries(clock):
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("key", "value")
+    clock.now = 4.9
+    assert cache.get("key") == "value"
+    clock.now = 5
+    assert cache.get("key") is None
+    assert cache.stats() == {"size": 0, "hits": 1, "misses": 1}
+
+
+def test_cache_evicts_least_recently_used(clock):
+    cache = TTLCache(maxsize=2, ttl=5, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_index_invalidates_organization_members():
+    index = MembershipIndex(maxsize=10, ttl=60)
+    organization_id, other_id, member_id, stranger_id = uuid4(), uuid4(), uuid4(), uuid4()
+    index.set_organizations(member_id, [organization_id])
+    index.set_organizations(stranger_id, [other_id])
+
+    index.invalidate_organization(organization_id)
+
+    assert index.get_organizations(member_id) is None
+    assert index.get_organizations(stranger_id) == frozenset([other_id])
+    assert index.members == {other_id: {stranger_id}}
+
+
+def test_index_forgets_members_of_evicted_users():
+    index = MembershipIndex(maxsize=1, ttl=60)
+    organization_id, first_id, second_id = uuid4(), uuid4(), uuid4()
+    index.set_organizations(first_id, [organization_id])
+    index.set_organizations(second_id, [organization_id])
+    assert index.members == {organization_id: {second_id}}
+
+    index.set_organizations(second_id, [])
+    assert index.members == {}
+
+
+async def test_revoked_membership_is_visible_immediately_by_default(client, session):
+    alice, bob = Employee(username="alice"), Employee(username="bob")
+    session.add_all([alice, bob])
+    await session.flush()
+    organization_id = await session.scalar(insert(Organization).values(name="own").returning(Organization.id))
+    session.add(OrganizationResponsible(organization_id=organization_id, user_id=bob.id))
+    tender = Tender(organization_id=organization_id, status=TenderStatus.CREATED, creator_id=alice.id)
+    session.add(tender)
+    await session.flush()
+    session.add(TenderHistory(tender_id=tender.id, name="draft", service_type=ServiceType.DELIVERY, history_number=1))
+    await session.commit()
+    url, params = f"/api/tenders/{tender.id}/status", {"username": "bob"}
+
+    assert (await client.get(url, params=params)).status_code == status.HTTP_200_OK
+
+    await session.execute(delete(OrganizationResponsible).where(OrganizationResponsible.user_id == bob.id))
+    await session.commit()
+
+    assert (await client.get(url, params=params)).status_code == status.HTTP_403_FORBIDDEN
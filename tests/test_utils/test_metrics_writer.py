@@ -0,0 +1,42 @@
+from tenders.utils.common import MetricsWriter, RequestMetrics, TTLCache, write_cache_metrics, write_request_metrics
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = RequestMetrics(buckets=(0.1, 1.0))
+    for duration in (0.0625, 0.5, 0.5, 2.0):
+        metrics.observe("GET", "/api/tenders", 200, duration)
+    metrics.observe("GET", "/api/tenders", 400, 0.03125)
+
+    writer = MetricsWriter()
+    write_request_metrics(writer, metrics)
+    samples = [line for line in writer.render().splitlines() if not line.startswith("#")]
+
+    assert samples == [
+        "tenders_http_requests_in_flight 0",
+        'tenders_http_requests_total{method="GET",route="/api/tenders",status="200"} 4',
+        'tenders_http_requests_total{method="GET",route="/api/tenders",status="400"} 1',
+        'tenders_http_request_duration_seconds_bucket{method="GET",route="/api/tenders",le="0.1"} 2',
+        'tenders_http_request_duration_seconds_bucket{method="GET",route="/api/tenders",le="1.0"} 4',
+        'tenders_http_request_duration_seconds_bucket{method="GET",route="/api/tenders",le="+Inf"} 5',
+        'tenders_http_request_duration_seconds_sum{method="GET",route="/api/tenders"} 3.09375',
+        'tenders_http_request_duration_seconds_count{method="GET",route="/api/tenders"} 5',
+    ]
+
+
+def test_cache_metrics():
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    writer = MetricsWriter()
+    write_cache_metrics(writer, [('quoted "cache"', cache)])
+    samples = [line for line in writer.render().splitlines() if not line.startswith("#")]
+
+    assert samples == [
+        'tenders_cache_hits_total{cache="quoted \\"cache\\""} 2',
+        'tenders_cache_misses_total{cache="quoted \\"cache\\""} 1',
+        'tenders_cache_entries{cache="quoted \\"cache\\""} 1',
+        'tenders_cache_hit_ratio{cache="quoted \\"cache\\""} 0.6666666666666666',
+    ]
@@ -1,12 +1,17 @@
+from contextlib import contextmanager
 from os import path as os_path
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Union
+from typing import Iterator, Union
 
 from alembic.config import Config
 from configargparse import Namespace
+from httpx import Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from tenders.config import get_settings
+from tenders.utils.common.instrumentation import QUERIES_HEADER
 
 
 PROJECT_PATH = Path(__file__).parent.parent.resolve()
@@ -34,3 +39,31 @@ def make_alembic_config(cmd_opts: Union[Namespace, SimpleNamespace], base_path:
         config.set_main_option("sqlalchemy.url", database_uri)
 
     return config
+
+
+@contextmanager
+def count_statements(engine: AsyncEngine) -> Iterator[list[str]]:
+    """
+    Собирает SQL-запросы, выполненные через `engine` внутри блока.
+    """
+    statements = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", collect)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", collect)
+
+
+def assert_query_budget(response: Response, budget: int) -> int:
+    """
+    Проверяет, что при обработке запроса выполнено не больше `budget` запросов к базе данных.
+    """
+    queries = int(response.headers[QUERIES_HEADER])
+    request = response.request
+    assert queries <= budget, f"{request.method} {request.url.path} made {queries} queries, budget is {budget}"
+
+    return queries